@@ -0,0 +1,68 @@
+"""Threaded vs asyncio simulator at growing fleet sizes.
+
+Each run gives every printer the same number of jobs, so the ideal wall
+time is ``jobs_per_printer * est_time * time_scale`` regardless of fleet
+size. Reported are the wall time, its overhead over that ideal and the
+throughput of each engine.
+
+Usage:
+    python benchmarks/bench_async.py --printers 10 100 5000 --jobs-per-printer 5
+"""
+import argparse
+import asyncio
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from models import Job
+from simulator import PrinterSimulator
+from async_simulator import AsyncPrinterSimulator
+
+
+def make_jobs(count):
+    return [Job(f"job-{i}", "PLA", 1, 1 + i % 3) for i in range(count)]
+
+
+def run_threaded(num_printers, jobs, time_scale):
+    sim = PrinterSimulator(num_printers=num_printers, time_scale=time_scale)
+    sim.add_jobs(jobs)
+    start = time.perf_counter()
+    sim.run_until_complete()
+    return time.perf_counter() - start, sim.get_status()['completed']
+
+
+def run_async(num_printers, jobs, time_scale):
+    async def main():
+        sim = AsyncPrinterSimulator(num_printers=num_printers, time_scale=time_scale)
+        await sim.add_jobs(jobs)
+        start = time.perf_counter()
+        await sim.run_until_complete()
+        return time.perf_counter() - start, sim.get_status()['completed']
+
+    return asyncio.run(main())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Threaded vs asyncio engine benchmark")
+    parser.add_argument('--printers', type=int, nargs='+', default=[10, 100, 5000])
+    parser.add_argument('--jobs-per-printer', type=int, default=5)
+    parser.add_argument('--time-scale', type=float, default=0.02,
+                        help='Seconds slept per job (every job has est_time 1) (default: 0.02)')
+    args = parser.parse_args()
+
+    ideal = args.jobs_per_printer * args.time_scale
+    print(f"{args.jobs_per_printer} jobs per printer, ideal wall time {ideal * 1000:.0f} ms")
+    print(f"{'printers':>9} {'engine':>9} {'wall ms':>10} {'overhead':>9} {'jobs/s':>10}")
+    for num_printers in args.printers:
+        for name, run in (('threaded', run_threaded), ('async', run_async)):
+            jobs = make_jobs(num_printers * args.jobs_per_printer)
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                elapsed, completed = run(num_printers, jobs, args.time_scale)
+            print(f"{num_printers:>9} {name:>9} {elapsed * 1000:>10.1f} {elapsed / ideal:>8.2f}x "
+                  f"{completed / elapsed:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
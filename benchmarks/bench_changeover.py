@@ -0,0 +1,73 @@
+"""Makespan, utilization and changeovers with and without material batching.
+
+A seeded workload with several materials runs on the discrete clock with a
+filament changeover penalty, once in pure priority order and once through
+the material-aware queue for each ``--windows`` priority window.
+
+Usage:
+    python benchmarks/bench_changeover.py --jobs 5000 --printers 16 --windows 0 1
+"""
+import argparse
+import contextlib
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from changeover import ChangeoverMatrix
+from models import Job
+from simulator import PrinterSimulator
+
+
+MATERIALS = ('PLA', 'PETG', 'ABS', 'TPU')
+
+# Seconds to purge and swap filament; flexible TPU is the slowest to change
+CHANGEOVER = ChangeoverMatrix(default=900, initial=0, penalties={
+    'PLA': {'PETG': 600},
+    'PETG': {'PLA': 600},
+    'TPU': {'PLA': 1800, 'PETG': 1800, 'ABS': 1800},
+})
+
+
+def make_jobs(count, seed):
+    rng = random.Random(seed)
+    return [Job(f"job-{i}", rng.choices(MATERIALS, weights=(5, 3, 2, 1))[0],
+                rng.uniform(600, 3 * 3600), rng.choice((1, 2, 2, 3, 3, 3)))
+            for i in range(count)]
+
+
+def run(args, material_aware, window=0):
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        sim = PrinterSimulator(num_printers=args.printers, time_scale=1.0, mode='discrete',
+                               changeover=CHANGEOVER, material_aware=material_aware, priority_window=window)
+        sim.add_jobs(make_jobs(args.jobs, args.seed))
+        sim.run_until_complete()
+    return sim._calculate_metrics()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Material changeover benchmark")
+    parser.add_argument('--jobs', type=int, default=5000)
+    parser.add_argument('--printers', type=int, default=16)
+    parser.add_argument('--windows', type=int, nargs='+', default=[0, 1],
+                        help='Priority windows to try with the material-aware queue (default: 0 1)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    runs = [('priority', run(args, material_aware=False))]
+    runs += [(f'material w={window}', run(args, True, window)) for window in args.windows]
+    baseline = runs[0][1]
+
+    print(f"{args.jobs} jobs, {args.printers} printers, {len(MATERIALS)} materials")
+    print(f"{'scheduler':>14} {'makespan h':>11} {'vs prio':>8} {'util %':>7} {'changeovers':>12} "
+          f"{'changeover h':>13} {'mean wait h':>12} {'p99 wait h':>11}")
+    for name, metrics in runs:
+        change = metrics['makespan_seconds'] / baseline['makespan_seconds'] - 1
+        print(f"{name:>14} {metrics['makespan_seconds'] / 3600:>11.1f} {change * 100:>+7.1f}% "
+              f"{metrics['average_printer_utilization']:>7.1f} {metrics['changeovers']:>12} "
+              f"{metrics['total_changeover_time'] / 3600:>13.1f} {metrics['avg_wait_time'] / 3600:>12.1f} "
+              f"{metrics['p99_wait_time'] / 3600:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
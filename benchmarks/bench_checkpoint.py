@@ -0,0 +1,63 @@
+"""Checkpoint and restore cost for large runs.
+
+Runs N jobs on the discrete engine until about half have completed, then
+measures how long the printer locks are held for the checkpoint's
+consistent cut, how long writing the whole checkpoint takes, the file size,
+and how long restoring it into a new simulator takes. For scale, ``add s``
+is how long creating and adding the N jobs took in the first place.
+
+Usage:
+    python benchmarks/bench_checkpoint.py --jobs 100000 1000000 --printers 8
+"""
+import argparse
+import contextlib
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from models import Job
+from simulator import PrinterSimulator
+
+
+def measure(num_jobs, num_printers, storage, path):
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        sim = PrinterSimulator(num_printers=num_printers, time_scale=1.0, mode='discrete', storage=storage)
+        sim.add_jobs(Job(f"job-{i}", "PLA", 1 + i % 5, i % 3 + 1) for i in range(num_jobs))
+        add = time.perf_counter() - start
+        # Mean est_time is 3, so this stops about halfway
+        sim.run_until_complete(timeout=num_jobs * 1.5 / num_printers)
+
+        start = time.perf_counter()
+        sim._checkpoint_cut()
+        cut = time.perf_counter() - start
+        start = time.perf_counter()
+        sim.checkpoint(path)
+        write = time.perf_counter() - start
+
+        start = time.perf_counter()
+        PrinterSimulator(num_printers=num_printers, time_scale=1.0, mode='discrete', storage=storage).restore(path)
+        restore = time.perf_counter() - start
+    return add, cut, write, restore, os.path.getsize(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Checkpoint and restore benchmark")
+    parser.add_argument('--jobs', type=int, nargs='+', default=[100000, 1000000])
+    parser.add_argument('--printers', type=int, default=8)
+    parser.add_argument('--storage', choices=['objects', 'table'], default='objects')
+    args = parser.parse_args()
+
+    print(f"{args.printers} printers, {args.storage} storage, about half the jobs completed")
+    print(f"{'jobs':>9} {'add s':>7} {'cut ms':>8} {'write s':>8} {'restore s':>10} {'MB':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for num_jobs in args.jobs:
+            add, cut, write, restore, size = measure(num_jobs, args.printers, args.storage,
+                                                os.path.join(tmp, 'run.ckpt'))
+            print(f"{num_jobs:>9} {add:>7.2f} {cut * 1e3:>8.2f} {write:>8.2f} {restore:>10.2f} {size / 1e6:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Dispatch throughput of the threaded simulator under lock contention.
+
+Several producer threads add jobs while many printers drain the queue with
+``time_scale=0``, so the run is dominated by locking rather than sleeping.
+The current lock scheme (queue lock, per-printer locks, sharded completion
+record) is compared with the old one, where one simulator lock was held
+around every add, start and completion. Throughput and the latency of
+``add_job`` calls are reported.
+
+Usage:
+    python benchmarks/bench_contention.py --printers 64 --producers 8 --jobs 20000
+"""
+import argparse
+import contextlib
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from models import Job
+from simulator import PrinterSimulator
+
+
+class GlobalLockSimulator(PrinterSimulator):
+    """Simulator with the old single-lock scheme."""
+
+    def add_job(self, job):
+        with self.lock:
+            self.all_jobs[job.id] = job
+            self._track_added(1)
+            self.status_counter.add_queued([job])
+            self.job_queue.add_job(job)
+
+    def _printer_worker(self, printer):
+        while not self.stop_event.is_set():
+            job = self.job_queue.get()
+            if job is None or job.status == 'cancelled':
+                continue
+            with self.lock:
+                printer.start_job(job)
+            time.sleep(job.est_time * self.time_scale)
+            with self.lock:
+                printer.complete_job()
+                self._record_completion(printer, job)
+
+
+def measure(sim_cls, num_printers, num_producers, num_jobs, time_scale):
+    """Return (jobs per second, sorted add_job latencies in seconds)."""
+    sim = sim_cls(num_printers=num_printers, time_scale=time_scale)
+    sim.start_simulation()
+    per_producer = num_jobs // num_producers
+    latencies = [[] for _ in range(num_producers)]
+
+    def produce(p):
+        record = latencies[p].append
+        for i in range(per_producer):
+            job = Job(f"P{p}-{i}", "PLA", 1, i % 5)
+            added_at = time.perf_counter()
+            sim.add_job(job)
+            record(time.perf_counter() - added_at)
+
+    producers = [threading.Thread(target=produce, args=(p,)) for p in range(num_producers)]
+    start = time.perf_counter()
+    for thread in producers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    sim.all_done_event.wait()
+    elapsed = time.perf_counter() - start
+    sim.stop_simulation()
+    return per_producer * num_producers / elapsed, sorted(sum(latencies, []))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lock contention benchmark")
+    parser.add_argument('--printers', type=int, default=64)
+    parser.add_argument('--producers', type=int, default=8)
+    parser.add_argument('--jobs', type=int, default=20000)
+    parser.add_argument('--time-scale', type=float, default=0.0,
+                        help='Seconds slept per unit of est_time (default: 0, pure dispatch)')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    engines = [('fine', PrinterSimulator), ('global', GlobalLockSimulator)]
+    print(f"{args.printers} printers, {args.producers} producers, {args.jobs} jobs")
+    print(f"{'locking':>10} {'jobs/s':>10} {'add p50 us':>12} {'add p99 us':>12} {'add max ms':>12}")
+    for name, sim_cls in engines:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            runs = [measure(sim_cls, args.printers, args.producers, args.jobs, args.time_scale)
+                    for _ in range(args.repeat)]
+        # Report the run with the median throughput
+        throughput, latencies = sorted(runs, key=lambda run: run[0])[len(runs) // 2]
+        n = len(latencies)
+        print(f"{name:>10} {throughput:>10,.0f} {latencies[n // 2] * 1e6:>12.1f} "
+              f"{latencies[min(n - 1, int(n * 0.99))] * 1e6:>12.1f} {latencies[-1] * 1e3:>12.2f}")
+
+if __name__ == "__main__":
+    main()
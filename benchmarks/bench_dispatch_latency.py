@@ -0,0 +1,88 @@
+"""Add-to-start dispatch latency of the threaded simulator.
+
+Jobs are added one at a time to idle printers and the delay between
+``add_job`` and the job's ``started_at`` is recorded. ``--polling`` runs the
+same workload against the old 100 ms polling worker for comparison.
+
+Usage:
+    python benchmarks/bench_dispatch_latency.py --printers 4 --jobs 200
+"""
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from models import Job
+from simulator import PrinterSimulator
+
+
+class PollingPrinterSimulator(PrinterSimulator):
+    """Simulator with the old sleep-and-poll worker loop."""
+
+    def _printer_worker(self, printer):
+        while not self.stop_event.is_set():
+            job = self.job_queue.get_next_job()
+            if job is None:
+                time.sleep(0.1)
+                continue
+            with printer.lock:
+                printer.start_job(job)
+            time.sleep(job.est_time * self.time_scale)
+            with printer.lock:
+                printer.complete_job()
+            self._record_completion(printer, job)
+
+
+def measure(sim_cls, num_printers, num_jobs, gap):
+    sim = sim_cls(num_printers=num_printers, time_scale=0.0)
+    sim.start_simulation()
+    time.sleep(0.05)
+
+    latencies = []
+    for i in range(num_jobs):
+        job = Job(f"job-{i}", "PLA", 0, 1)
+        added_at = time.time()
+        sim.add_job(job)
+        while job.started_at is None:
+            time.sleep(0.0005)
+        latencies.append(job.started_at - added_at)
+        time.sleep(gap)
+
+    sim.stop_simulation()
+    return sorted(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dispatch latency benchmark")
+    parser.add_argument('--printers', type=int, default=4)
+    parser.add_argument('--jobs', type=int, default=200)
+    parser.add_argument('--gap', type=float, default=0.002,
+                        help='Seconds between job submissions (default: 0.002)')
+    parser.add_argument('--polling', action='store_true',
+                        help='Also measure the old polling worker')
+    args = parser.parse_args()
+
+    engines = [('condition', PrinterSimulator)]
+    if args.polling:
+        engines.append(('polling', PollingPrinterSimulator))
+
+    results = []
+    for name, sim_cls in engines:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            latencies = measure(sim_cls, args.printers, args.jobs, args.gap)
+        results.append((name, latencies))
+
+    print(f"{'engine':>10} {'mean ms':>10} {'p50 ms':>10} {'p99 ms':>10} {'max ms':>10}")
+    for name, latencies in results:
+        n = len(latencies)
+        mean = sum(latencies) / n
+        p50 = latencies[n // 2]
+        p99 = latencies[min(n - 1, int(n * 0.99))]
+        print(f"{name:>10} {mean * 1000:>10.3f} {p50 * 1000:>10.3f} "
+              f"{p99 * 1000:>10.3f} {latencies[-1] * 1000:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Cost of profiling: simulator throughput with instrumentation off and on.
+
+Runs the same jobs through the discrete engine and through the threaded
+engine with ``time_scale=0``, so dispatch dominates and any overhead of
+the timing locks, the timed queue and the idle timers shows up directly.
+
+Usage:
+    python benchmarks/bench_instrumentation.py --jobs 100000 --printers 8
+"""
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from models import Job
+from simulator import PrinterSimulator
+
+
+def measure(mode, profile, num_printers, num_jobs):
+    jobs = [Job(f"job-{i}", "PLA", 1 + i % 5, i % 3 + 1) for i in range(num_jobs)]
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        sim = PrinterSimulator(num_printers=num_printers, time_scale=0.0, mode=mode, profile=profile)
+        start = time.perf_counter()
+        sim.add_jobs(jobs)
+        sim.run_until_complete()
+        elapsed = time.perf_counter() - start
+    return num_jobs / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Instrumentation overhead benchmark")
+    parser.add_argument('--jobs', type=int, default=100000)
+    parser.add_argument('--printers', type=int, default=8)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.jobs} jobs, {args.printers} printers, median of {args.repeat}")
+    print(f"{'mode':>9} {'off jobs/s':>12} {'on jobs/s':>12} {'overhead':>9}")
+    for mode in ('discrete', 'threaded'):
+        rates = {}
+        for profile in (False, True):
+            runs = sorted(measure(mode, profile, args.printers, args.jobs) for _ in range(args.repeat))
+            rates[profile] = runs[len(runs) // 2]
+        print(f"{mode:>9} {rates[False]:>12,.0f} {rates[True]:>12,.0f} {rates[False] / rates[True] - 1:>9.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Memory cost per job of the job storage backends, measured with tracemalloc.
+
+Compares the old dict-backed Job class, the slotted Job and the columnar
+JobTable, each holding the same synthetic jobs.
+
+Usage:
+    python benchmarks/bench_memory.py --jobs 1000000
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from models import Job
+from job_table import JobTable
+
+MATERIALS = ["PLA", "ABS", "PETG", "TPU"]
+
+
+class DictJob:
+    """The pre-slots Job layout, with a per-instance __dict__."""
+
+    def __init__(self, id, material, est_time, priority):
+        self.id = id
+        self.material = material
+        self.est_time = est_time
+        self.priority = priority
+        self.created_at = time.time()
+        self.status = 'queued'
+        self.started_at = None
+        self.completed_at = None
+        self.order_counter = 0
+
+
+def build_objects(job_cls, n, ids):
+    return {ids[i]: job_cls(ids[i], MATERIALS[i % 4], 60.0 + i % 100, i % 3 + 1) for i in range(n)}
+
+
+def build_table(n, ids):
+    table = JobTable()
+    now = time.time()
+    for i in range(n):
+        table.append(ids[i], MATERIALS[i % 4], 60.0 + i % 100, i % 3 + 1, now)
+    return table
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    store = build()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del store
+    return current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Job storage memory benchmark")
+    parser.add_argument('--jobs', type=int, default=100_000)
+    args = parser.parse_args()
+
+    n = args.jobs
+    # Ids are shared by every backend so their cost is not counted
+    ids = [f"job-{i}" for i in range(n)]
+
+    backends = [
+        ('dict Job', lambda: build_objects(DictJob, n, ids)),
+        ('slotted Job', lambda: build_objects(Job, n, ids)),
+        ('JobTable', lambda: build_table(n, ids)),
+    ]
+
+    print(f"{n:,} jobs")
+    print(f"{'backend':>12} {'current MB':>12} {'peak MB':>10} {'bytes/job':>10}")
+    for name, build in backends:
+        current, peak = measure(build)
+        print(f"{name:>12} {current / 1e6:>12.1f} {peak / 1e6:>10.1f} {current / n:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
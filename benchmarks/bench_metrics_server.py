@@ -0,0 +1,50 @@
+"""Scrape cost of the metrics endpoint as the number of jobs grows.
+
+Renders the metrics of a simulator holding N queued jobs and then of one
+that has completed them. Since every value comes from counters kept up to
+date as jobs move, the render time should stay flat as N grows; only the
+number of printers adds lines.
+
+Usage:
+    python benchmarks/bench_metrics_server.py --jobs 1000 100000 1000000
+"""
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from metrics_server import render
+from models import Job
+from simulator import PrinterSimulator
+
+
+def scrape_time(sim, scrapes):
+    start = time.perf_counter()
+    for _ in range(scrapes):
+        render(sim)
+    return (time.perf_counter() - start) / scrapes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Metrics scrape cost benchmark")
+    parser.add_argument('--jobs', type=int, nargs='+', default=[1000, 100000, 1000000])
+    parser.add_argument('--printers', type=int, default=8)
+    parser.add_argument('--scrapes', type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{args.printers} printers, mean of {args.scrapes} scrapes")
+    print(f"{'jobs':>9} {'queued µs':>10} {'done µs':>10}")
+    for num_jobs in args.jobs:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            sim = PrinterSimulator(num_printers=args.printers, time_scale=0.0, mode='discrete')
+            sim.add_jobs(Job(f"job-{i}", "PLA", 1 + i % 5, i % 3 + 1) for i in range(num_jobs))
+            queued = scrape_time(sim, args.scrapes)
+            sim.run_until_complete()
+            done = scrape_time(sim, args.scrapes)
+        print(f"{num_jobs:>9} {queued * 1e6:>10.1f} {done * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
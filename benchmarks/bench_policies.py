@@ -0,0 +1,86 @@
+"""Wait times under each scheduling policy on the discrete clock.
+
+The workload is a seeded backlog: jobs with a mix of short and long print
+times and priorities, created at random points over the last
+``--backlog-hours`` hours, a third of them with a deadline somewhere
+within the time the farm needs to clear the backlog. For each policy the
+mean and p99 wait, the mean wait per priority and the number of missed
+deadlines are reported.
+
+Usage:
+    python benchmarks/bench_policies.py --jobs 5000 --printers 16 --aging-hours 4
+"""
+import argparse
+import contextlib
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from models import Job
+from queue_manager import POLICIES, AgingPolicy
+from simulator import PrinterSimulator
+
+
+def make_jobs(count, printers, backlog_hours, seed):
+    rng = random.Random(seed)
+    now = time.time()
+    jobs = []
+    for i in range(count):
+        # Mostly short prints with a long tail of multi-hour ones
+        est_time = rng.choice((rng.uniform(300, 1800), rng.uniform(300, 1800), rng.uniform(3600, 6 * 3600)))
+        job = Job(f"job-{i}", "PLA", est_time, rng.choice((1, 2, 2, 3, 3, 3)))
+        job.created_at = now - rng.uniform(0, backlog_hours * 3600)
+        jobs.append(job)
+
+    makespan = sum(job.est_time for job in jobs) / printers
+    for job in jobs:
+        if rng.random() < 1 / 3:
+            job.deadline = now + rng.uniform(0.1, 1.2) * makespan
+    return jobs
+
+
+def run(policy, args):
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        sim = PrinterSimulator(num_printers=args.printers, time_scale=1.0, mode='discrete', policy=policy)
+        sim.add_jobs(make_jobs(args.jobs, args.printers, args.backlog_hours, args.seed))
+        start = time.perf_counter()
+        sim.run_until_complete()
+        elapsed = time.perf_counter() - start
+
+    metrics = sim._calculate_metrics()
+    waits = {}
+    missed = 0
+    for job in sim.completed_jobs:
+        waits.setdefault(job.priority, []).append(job.get_wait_time())
+        if job.deadline is not None and job.completed_at > job.deadline:
+            missed += 1
+    by_priority = {priority: sum(w) / len(w) for priority, w in waits.items()}
+    return metrics, by_priority, missed, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scheduling policy benchmark")
+    parser.add_argument('--jobs', type=int, default=5000)
+    parser.add_argument('--printers', type=int, default=16)
+    parser.add_argument('--backlog-hours', type=float, default=24.0)
+    parser.add_argument('--aging-hours', type=float, default=4.0,
+                        help='Waiting time that raises a job by one priority level (default: 4)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--policies', nargs='+', choices=list(POLICIES), default=list(POLICIES))
+    args = parser.parse_args()
+
+    print(f"{args.jobs} jobs, {args.printers} printers (waits in hours)")
+    print(f"{'policy':>9} {'mean':>8} {'p99':>8} {'p1 mean':>8} {'p2 mean':>8} {'p3 mean':>8} "
+          f"{'missed':>7} {'run s':>6}")
+    for name in args.policies:
+        policy = AgingPolicy(args.aging_hours * 3600) if name == 'aging' else name
+        metrics, by_priority, missed, elapsed = run(policy, args)
+        print(f"{name:>9} {metrics['avg_wait_time'] / 3600:>8.2f} {metrics['p99_wait_time'] / 3600:>8.2f} "
+              + ' '.join(f"{by_priority.get(p, 0) / 3600:>8.2f}" for p in (1, 2, 3))
+              + f" {missed:>7} {elapsed:>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
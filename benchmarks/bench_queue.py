@@ -0,0 +1,87 @@
+"""Enqueue/dequeue throughput of JobQueue against the old list-based queue.
+
+Usage:
+    python benchmarks/bench_queue.py
+    python benchmarks/bench_queue.py --sizes 1000 100000 1000000 --legacy-limit 20000
+
+The legacy queue re-sorts the whole list on every operation, so it is only
+measured up to ``--legacy-limit`` jobs; larger sizes would take hours.
+"""
+import argparse
+import contextlib
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from models import Job
+from queue_manager import JobQueue
+
+
+class LegacyJobQueue:
+    """The list-plus-full-sort queue that JobQueue replaced."""
+
+    def __init__(self):
+        self.jobs = []
+        self._lock = threading.Lock()
+        self.counter = 0
+
+    def add_job(self, job):
+        with self._lock:
+            self.counter += 1
+            job.order_counter = self.counter
+            self.jobs.append(job)
+            self.jobs.sort(key=lambda job: (job.priority, job.order_counter))
+            print(f"Job '{job.id}' added.")
+
+    def get_next_job(self):
+        with self._lock:
+            if self.jobs:
+                self.jobs.sort(key=lambda job: (job.priority, job.order_counter))
+                job = self.jobs.pop(0)
+                print(f"Job {job.id} removed from queue.")
+                return job
+            print(f"No more jobs in the queue.")
+            return None
+
+
+def make_jobs(n):
+    return [Job(f"job-{i}", "PLA", 60, i % 3 + 1) for i in range(n)]
+
+
+def bench(queue_cls, n):
+    jobs = make_jobs(n)
+    queue = queue_cls()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for job in jobs:
+            queue.add_job(job)
+        enqueue = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(n):
+            queue.get_next_job()
+        dequeue = time.perf_counter() - start
+    return n / enqueue, n / dequeue
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JobQueue throughput benchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 100_000, 1_000_000])
+    parser.add_argument('--legacy-limit', type=int, default=20_000,
+                        help='Largest size to run the legacy queue at (default: 20000)')
+    args = parser.parse_args()
+
+    print(f"{'jobs':>10} {'queue':>8} {'enqueue/s':>14} {'dequeue/s':>14}")
+    for n in args.sizes:
+        for name, queue_cls in (('heap', JobQueue), ('legacy', LegacyJobQueue)):
+            if queue_cls is LegacyJobQueue and n > args.legacy_limit:
+                print(f"{n:>10} {name:>8} {'skipped':>14} {'skipped':>14}")
+                continue
+            enqueue, dequeue = bench(queue_cls, n)
+            print(f"{n:>10} {name:>8} {enqueue:>14,.0f} {dequeue:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Wall time of a parameter sweep with one worker process vs. a full pool.
+
+A temporary job file is generated and swept over ``--printer-counts``
+printer counts on the discrete clock.
+
+Usage:
+    python benchmarks/bench_sweep.py --jobs 20000 --printer-counts 1 2 4 8 16 32 64 128
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import sweep
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parameter sweep benchmark")
+    parser.add_argument('--jobs', type=int, default=20000)
+    parser.add_argument('--printer-counts', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32, 64, 128])
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as tmp:
+        jobs_file = os.path.join(tmp, 'jobs.jsonl')
+        with open(jobs_file, 'w') as f:
+            for i in range(args.jobs):
+                f.write(json.dumps({'id': f'job-{i}', 'material': 'PLA',
+                                    'est_time': rng.uniform(60, 3600), 'priority': rng.randint(1, 3)}) + '\n')
+
+        configs = sweep.expand_grid({'num_printers': args.printer_counts, 'jobs_file': [jobs_file]})
+        print(f"{len(configs)} configurations, {args.jobs} jobs each")
+        print(f"{'workers':>8} {'wall s':>8}")
+        for workers in sorted({1, args.workers}):
+            start = time.perf_counter()
+            sweep.run_sweep(configs, max_workers=workers)
+            print(f"{workers:>8} {time.perf_counter() - start:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
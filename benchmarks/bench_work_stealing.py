@@ -0,0 +1,77 @@
+"""Shared-queue vs. work-stealing dispatch in the threaded simulator.
+
+Producer threads add jobs of mixed priority while the printers drain them
+with a tiny ``time_scale``, so the run is dominated by dispatch. For each
+printer count, throughput and the wait from ``add_job`` to start are
+reported: p50 and p99 over all jobs, and p99 over priority 1 jobs only.
+Work stealing only keeps priority order approximately, so the priority 1
+tail is the one to watch.
+
+Usage:
+    python benchmarks/bench_work_stealing.py --printers 8 64 512 --jobs 50000
+"""
+import argparse
+import contextlib
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from models import Job
+from simulator import PrinterSimulator
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def measure(dispatch, num_printers, num_producers, num_jobs, time_scale):
+    """Return (jobs per second, sorted waits, sorted priority 1 waits) in seconds."""
+    sim = PrinterSimulator(num_printers=num_printers, time_scale=time_scale, dispatch=dispatch)
+    sim.start_simulation()
+    per_producer = num_jobs // num_producers
+
+    def produce(p):
+        for i in range(per_producer):
+            sim.add_job(Job(f"P{p}-{i}", "PLA", 1, i % 3 + 1))
+
+    producers = [threading.Thread(target=produce, args=(p,)) for p in range(num_producers)]
+    start = time.perf_counter()
+    for thread in producers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    sim.all_done_event.wait()
+    elapsed = time.perf_counter() - start
+    sim.stop_simulation()
+
+    jobs = sim.completed_jobs
+    waits = sorted(job.started_at - job.created_at for job in jobs)
+    urgent = sorted(job.started_at - job.created_at for job in jobs if job.priority == 1)
+    return len(jobs) / elapsed, waits, urgent
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Work-stealing dispatch benchmark")
+    parser.add_argument('--printers', type=int, nargs='+', default=[8, 64, 512])
+    parser.add_argument('--producers', type=int, default=4)
+    parser.add_argument('--jobs', type=int, default=50000)
+    parser.add_argument('--time-scale', type=float, default=0.0001,
+                        help='Seconds slept per unit of est_time (default: 0.0001)')
+    args = parser.parse_args()
+
+    print(f"{args.jobs} jobs, {args.producers} producers, time_scale={args.time_scale}")
+    print(f"{'printers':>8} {'dispatch':>9} {'jobs/s':>10} {'wait p50 ms':>12} {'wait p99 ms':>12} "
+          f"{'prio1 p99 ms':>13}")
+    for num_printers in args.printers:
+        for dispatch in ('shared', 'stealing'):
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                throughput, waits, urgent = measure(dispatch, num_printers, args.producers,
+                                                    args.jobs, args.time_scale)
+            print(f"{num_printers:>8} {dispatch:>9} {throughput:>10,.0f} {percentile(waits, 0.5) * 1e3:>12.2f} "
+                  f"{percentile(waits, 0.99) * 1e3:>12.2f} {percentile(urgent, 0.99) * 1e3:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Load test with a synthetic arrival stream on the discrete clock.
+
+Jobs from a seeded WorkloadGenerator arrive over time at the rate that
+loads the printers to ``--load`` (offered work / capacity). The stream is
+consumed lazily while the simulation runs. For each arrival process this
+prints the event rate of the engine and the resulting wait statistics.
+
+Usage:
+    python benchmarks/bench_workload.py --jobs 200000 --printers 32 --load 0.9
+"""
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from simulator import PrinterSimulator
+from workload import ARRIVALS, WorkloadGenerator
+
+MEAN_EST_TIME = 600.0
+
+
+def measure(arrival, args):
+    # Offered load = rate * mean est_time / printers
+    rate = args.load * args.printers / MEAN_EST_TIME
+    workload = WorkloadGenerator(seed=args.seed, arrival=arrival, rate=rate, burst_size=args.burst_size,
+                                 est_time=('exponential', MEAN_EST_TIME),
+                                 materials={'PLA': 0.6, 'PETG': 0.25, 'TPU': 0.15})
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        sim = PrinterSimulator(num_printers=args.printers, time_scale=1.0, mode='discrete',
+                               storage=args.storage)
+        sim.add_arrivals(workload.generate(count=args.jobs))
+        start = time.perf_counter()
+        sim.run_until_complete()
+        elapsed = time.perf_counter() - start
+        metrics = sim.get_summary()['metrics']
+    return args.jobs / elapsed, metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthetic workload load test")
+    parser.add_argument('--jobs', type=int, default=200000)
+    parser.add_argument('--printers', type=int, default=32)
+    parser.add_argument('--load', type=float, default=0.9, help='Offered load per printer (default: 0.9)')
+    parser.add_argument('--burst-size', type=float, default=50.0, help='Mean jobs per burst (default: 50)')
+    parser.add_argument('--storage', choices=['objects', 'table'], default='objects')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{args.jobs} jobs, {args.printers} printers, load {args.load}, mean est_time {MEAN_EST_TIME:.0f}s")
+    print(f"{'arrivals':>9} {'jobs/s':>10} {'util %':>7} {'avg wait s':>11} {'p99 wait s':>11} {'max wait s':>11}")
+    for arrival in ARRIVALS:
+        throughput, metrics = measure(arrival, args)
+        print(f"{arrival:>9} {throughput:>10,.0f} {metrics['average_printer_utilization']:>7.1f} "
+              f"{metrics['avg_wait_time']:>11.1f} {metrics['p99_wait_time']:>11.1f} {metrics['max_wait_time']:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
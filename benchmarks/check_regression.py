@@ -0,0 +1,81 @@
+"""Compare two benchmark suite result files and flag regressions.
+
+A result regresses when it is worse than the baseline by more than the
+threshold, as a fraction of the baseline value: slower for ``higher is
+better`` rates, larger for ``lower is better`` times. Exits with status 1
+if any result regressed, so it can gate CI.
+
+Usage:
+    python benchmarks/check_regression.py baseline.json current.json --threshold 0.15
+    python benchmarks/check_regression.py baseline.json current.json \\
+        --metric-threshold 'queue.cancel_job.p99[1000000]=0.5'
+"""
+import argparse
+import json
+import sys
+
+
+def load_results(filename):
+    with open(filename, 'r') as f:
+        return json.load(f)['results']
+
+
+def compare(baseline, current, threshold, overrides=None):
+    """Rows of (name, baseline, current, change, regressed) for results in both files.
+
+    ``change`` is the relative change in the good direction, so a negative
+    change is a slowdown whichever way the unit points.
+    """
+    overrides = overrides or {}
+    rows = []
+    for name, base in baseline.items():
+        if name not in current:
+            continue
+        old, new = base['value'], current[name]['value']
+        if old == 0:
+            change = 0.0
+        elif base['better'] == 'higher':
+            change = (new - old) / old
+        else:
+            change = (old - new) / old
+        rows.append((name, base, current[name], change, change < -overrides.get(name, threshold)))
+    return rows
+
+
+def parse_override(text):
+    name, _, value = text.rpartition('=')
+    if not name:
+        raise argparse.ArgumentTypeError(f"expected NAME=FRACTION, got {text!r}")
+    return name, float(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark regression checker")
+    parser.add_argument('baseline', help='Results JSON of the reference commit')
+    parser.add_argument('current', help='Results JSON to check')
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help='Largest allowed slowdown as a fraction of the baseline (default: 0.15)')
+    parser.add_argument('--metric-threshold', type=parse_override, action='append', default=[],
+                        metavar='NAME=FRACTION', help='Threshold for one result, e.g. for a noisy one')
+    args = parser.parse_args()
+
+    baseline, current = load_results(args.baseline), load_results(args.current)
+    rows = compare(baseline, current, args.threshold, dict(args.metric_threshold))
+
+    print(f"{'benchmark':<40} {'baseline':>14} {'current':>14} {'change':>8}")
+    for name, base, cur, change, regressed in rows:
+        flag = '  REGRESSION' if regressed else ''
+        print(f"{name:<40} {base['value']:>14,.2f} {cur['value']:>14,.2f} {change:>+8.1%} {base['unit']}{flag}")
+
+    for name in sorted(set(baseline) ^ set(current)):
+        print(f"{name:<40} only in {'baseline' if name in baseline else 'current'}")
+
+    regressions = [row[0] for row in rows if row[4]]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond the threshold")
+        sys.exit(1)
+    print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
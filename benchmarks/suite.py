@@ -0,0 +1,232 @@
+"""Benchmark suite for the queue, dispatch, metrics and report hot paths.
+
+Every measurement is run ``--repeat`` times and the median is written to a
+JSON results file together with the commit and Python version, so two runs
+can be compared with check_regression.py::
+
+    python benchmarks/suite.py --output baseline.json
+    # ... change the code ...
+    python benchmarks/suite.py --output current.json
+    python benchmarks/check_regression.py baseline.json current.json
+
+Results are keyed by name, e.g. ``queue.add_job[100000]``, and hold the
+value, its unit and whether ``higher`` or ``lower`` is better. ``--quick``
+uses smaller sizes for a fast smoke run.
+"""
+import argparse
+import contextlib
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from models import Job
+from queue_manager import JobQueue
+from simulator import PrinterSimulator
+
+FULL = {
+    'queue_sizes': [1_000, 100_000, 1_000_000],
+    'cancels': 10_000,
+    'status_jobs': 1_000_000,
+    'run_jobs': 100_000,
+    'run_printers': [1, 8, 64],
+    'report_jobs': 100_000,
+}
+QUICK = {
+    'queue_sizes': [1_000, 10_000, 100_000],
+    'cancels': 2_000,
+    'status_jobs': 100_000,
+    'run_jobs': 10_000,
+    'run_printers': [1, 8, 64],
+    'report_jobs': 10_000,
+}
+
+
+def make_jobs(n):
+    return [Job(f"job-{i}", "PLA", 60 + i % 7, i % 3 + 1) for i in range(n)]
+
+
+@contextlib.contextmanager
+def quiet():
+    """Silence the simulator's progress output."""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def bench_queue(n):
+    """add_job and get_next_job throughput at n queued jobs."""
+    jobs = make_jobs(n)
+    queue = JobQueue()
+    start = time.perf_counter()
+    for job in jobs:
+        queue.add_job(job)
+    added = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(n):
+        queue.get_next_job()
+    taken = time.perf_counter() - start
+    return n / added, n / taken
+
+
+def bench_cancel(n, cancels):
+    """p50 and p99 latency of cancel_job on a queue of n jobs, in microseconds."""
+    queue = JobQueue()
+    queue.add_jobs(make_jobs(n))
+    ids = random.Random(0).sample(range(n), min(cancels, n))
+    latencies = []
+    for i in ids:
+        start = time.perf_counter()
+        queue.cancel_job(f"job-{i}")
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return latencies[len(latencies) // 2] * 1e6, latencies[int(len(latencies) * 0.99)] * 1e6
+
+
+def bench_status(n):
+    """Cost of one get_status call with n jobs, in microseconds."""
+    with quiet():
+        sim = PrinterSimulator(num_printers=8, time_scale=1.0, mode='discrete')
+    sim.add_jobs(make_jobs(n))
+    calls = 10000
+    start = time.perf_counter()
+    for _ in range(calls):
+        sim.get_status()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def completed_simulator(num_printers, n):
+    with quiet():
+        sim = PrinterSimulator(num_printers=num_printers, time_scale=1.0, mode='discrete')
+        sim.add_jobs(make_jobs(n))
+        start = time.perf_counter()
+        sim.run_until_complete()
+    return sim, time.perf_counter() - start
+
+
+def bench_run(num_printers, n):
+    """End-to-end run_until_complete throughput on the discrete clock, in jobs/s."""
+    _, elapsed = completed_simulator(num_printers, n)
+    return n / elapsed
+
+
+def bench_report(n):
+    """Metrics and report build times in milliseconds, and report write rates in MB/s."""
+    sim, _ = completed_simulator(8, n)
+    start = time.perf_counter()
+    sim._calculate_metrics()
+    metrics = (time.perf_counter() - start) * 1e3
+
+    start = time.perf_counter()
+    sim.get_report()
+    report = (time.perf_counter() - start) * 1e3
+
+    rates = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for format_type in ('json', 'csv'):
+            filename = os.path.join(tmp, f"report.{format_type}")
+            with quiet():
+                start = time.perf_counter()
+                sim.save_report(filename, format_type, write_summary=False)
+                elapsed = time.perf_counter() - start
+            rates[format_type] = os.path.getsize(filename) / elapsed / 1e6
+    return metrics, report, rates['json'], rates['csv']
+
+
+def measured(func, *args):
+    # Like timeit, collect first and keep the garbage collector out of the
+    # timed code, whose runs would otherwise vary with allocation history
+    gc.collect()
+    gc.disable()
+    try:
+        return func(*args)
+    finally:
+        gc.enable()
+
+
+def median_of(repeat, func, *args):
+    """Run func repeat times; the median of each returned value."""
+    runs = [measured(func, *args) for _ in range(repeat)]
+    if not isinstance(runs[0], tuple):
+        return statistics.median(runs)
+    return tuple(statistics.median(values) for values in zip(*runs))
+
+
+def run_suite(sizes, repeat, log=print):
+    results = {}
+
+    def record(name, value, unit, better):
+        results[name] = {'value': value, 'unit': unit, 'better': better}
+        log(f"{name:<40} {value:>14,.2f} {unit}")
+
+    for n in sizes['queue_sizes']:
+        added, taken = median_of(repeat, bench_queue, n)
+        record(f"queue.add_job[{n}]", added, 'ops/s', 'higher')
+        record(f"queue.get_next_job[{n}]", taken, 'ops/s', 'higher')
+
+    n = sizes['queue_sizes'][-1]
+    p50, p99 = median_of(repeat, bench_cancel, n, sizes['cancels'])
+    record(f"queue.cancel_job.p50[{n}]", p50, 'us', 'lower')
+    record(f"queue.cancel_job.p99[{n}]", p99, 'us', 'lower')
+
+    n = sizes['status_jobs']
+    record(f"simulator.get_status[{n}]", median_of(repeat, bench_status, n), 'us', 'lower')
+
+    n = sizes['run_jobs']
+    for num_printers in sizes['run_printers']:
+        record(f"simulator.run_until_complete[{num_printers}x{n}]",
+               median_of(repeat, bench_run, num_printers, n), 'jobs/s', 'higher')
+
+    n = sizes['report_jobs']
+    metrics, report, json_rate, csv_rate = median_of(repeat, bench_report, n)
+    record(f"simulator.calculate_metrics[{n}]", metrics, 'ms', 'lower')
+    record(f"simulator.get_report[{n}]", report, 'ms', 'lower')
+    record(f"simulator.save_report.json[{n}]", json_rate, 'MB/s', 'higher')
+    record(f"simulator.save_report.csv[{n}]", csv_rate, 'MB/s', 'higher')
+    return results
+
+
+def current_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hot path benchmark suite")
+    parser.add_argument('--output', '-o', metavar='PATH', help='Write the results as JSON to PATH')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement; the median is kept (default: 5)')
+    parser.add_argument('--quick', action='store_true', help='Smaller sizes for a fast smoke run')
+    args = parser.parse_args()
+
+    sizes = QUICK if args.quick else FULL
+    results = run_suite(sizes, args.repeat)
+
+    if args.output:
+        document = {
+            'meta': {
+                'commit': current_commit(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'timestamp': time.time(),
+                'quick': args.quick,
+                'repeat': args.repeat,
+            },
+            'results': results,
+        }
+        with open(args.output, 'w') as f:
+            json.dump(document, f, indent=2)
+        print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import argparse
 import sys
 import json
+import math
 import os
 import time
 from typing import Optional, List, Dict, Any
@@ -8,64 +9,89 @@ from typing import Optional, List, Dict, Any
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from simulator import PrinterSimulator
+from queue_manager import POLICIES
+from changeover import ChangeoverMatrix
+from fleet import load_fleet
+from instrumentation import combine
+from metrics_server import MetricsServer
 from models import Job
+from events import event_log, ConsoleSink, JsonLinesSink, DEBUG, INFO
+from job_store import open_store
+from job_loader import iter_validated_records, batched
+import sweep
 
-# File to persist state between commands
+# Files to persist state between commands: a snapshot plus an append-only
+# journal of changes made since the snapshot
 STATE_FILE = '.printer_cli_state.json'
+JOURNAL_FILE = '.printer_cli_journal.jsonl'
+
+# Jobs validated and written to the store per bulk write when loading files
+LOAD_BATCH_SIZE = 10000
 
 class SimplePrinterCLI:
-    def __init__(self, num_printers: int = 2, time_scale: float = 0.01):
+    def __init__(self, num_printers: int = 2, time_scale: float = 0.01, mode: str = 'threaded',
+                 store: str = 'journal', policy: str = 'priority', changeover: Optional[ChangeoverMatrix] = None,
+                 material_aware: bool = False, fleet_file: Optional[str] = None, dispatch: str = 'shared',
+                 profile: bool = False, metrics_port: Optional[int] = None):
         self.num_printers = num_printers
         self.time_scale = time_scale
-        self.jobs_data = []
+        self.mode = mode
+        self.policy = policy
+        self.changeover = changeover
+        self.material_aware = material_aware
+        self.fleet_file = fleet_file
+        self.dispatch = dispatch
+        self.profile = profile
+        self.metrics_port = metrics_port
+        self.store = open_store(store, STATE_FILE, JOURNAL_FILE)
         self.load_state()
     
     def load_state(self):
-        try:
-            if os.path.exists(STATE_FILE):
-                with open(STATE_FILE, 'r') as f:
-                    data = json.load(f)
-                    self.jobs_data = data.get('jobs', [])
-                    self.num_printers = data.get('num_printers', self.num_printers)
-                    self.time_scale = data.get('time_scale', self.time_scale)
-        except (json.JSONDecodeError, FileNotFoundError):
-            self.jobs_data = []
-    
-    def save_state(self):
-        state = {
-            'jobs': self.jobs_data,
-            'num_printers': self.num_printers,
-            'time_scale': self.time_scale
-        }
-        with open(STATE_FILE, 'w') as f:
-            json.dump(state, f, indent=2)
+        config = self.store.get_config()
+        self.num_printers = config.get('num_printers', self.num_printers)
+        self.time_scale = config.get('time_scale', self.time_scale)
     
-    def add_job(self, job_id: str, material: str, est_time: float, priority: int):
-
-        if any(job['id'] == job_id for job in self.jobs_data):
-            print(f"Error: Job ID '{job_id}' already exists")
-            return False
-        
+    def _save_config_if_new(self):
+        # The first change persists the configuration it was made with
+        if not self.store.get_config():
+            self.store.set_config(self.num_printers, self.time_scale)
+    
+    def _check_new_job(self, job_id: str, est_time: float, priority: int,
+                       pending: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        if self.store.get(job_id) is not None or (pending and job_id in pending):
+            return f"Job ID '{job_id}' already exists"
         
-        if est_time <= 0:
-            print("Error: Estimated time must be positive")
-            return False
+        if not math.isfinite(est_time) or est_time <= 0:
+            return "Estimated time must be a positive finite number"
         
         if priority not in [1, 2, 3]:
-            print("Error: Priority must be 1 (high), 2 (medium), or 3 (low)")
-            return False
+            return "Priority must be 1 (high), 2 (medium), or 3 (low)"
         
-        job_data = {
+        return None
+    
+    @staticmethod
+    def _new_job_data(job_id: str, material: str, est_time: float, priority: int,
+                      deadline: Optional[float] = None) -> Dict[str, Any]:
+        return {
             'id': job_id,
             'material': material,
             'est_time': est_time,
             'priority': priority,
             'created_at': time.time(),
-            'status': 'queued'
+            'status': 'queued',
+            'deadline': deadline
         }
+    
+    def add_job(self, job_id: str, material: str, est_time: float, priority: int,
+                deadline: Optional[float] = None):
+
+        error = self._check_new_job(job_id, est_time, priority)
+        if error:
+            print(f"Error: {error}")
+            return False
         
-        self.jobs_data.append(job_data)
-        self.save_state()
+        self._save_config_if_new()
+        self.store.add_jobs([self._new_job_data(job_id, material, est_time, priority, deadline)])
         
         print(f"Job '{job_id}' added successfully")
         print(f"  Material: {material}")
@@ -75,95 +101,118 @@ class SimplePrinterCLI:
     
     def list_jobs(self):
         
-        if not self.jobs_data:
+        total = self.store.count()
+        if not total:
             print("No jobs in queue")
             return
         
-        queued = [j for j in self.jobs_data if j['status'] == 'queued']
-        completed = [j for j in self.jobs_data if j['status'] == 'completed']
-        cancelled = [j for j in self.jobs_data if j['status'] == 'cancelled']
+        counts = self.store.count_by_status()
         
         print(f"Queue Status:")
-        print(f"  Total jobs: {len(self.jobs_data)}")
-        print(f"  Queued: {len(queued)}")
-        print(f"  Completed: {len(completed)}")
-        print(f"  Cancelled: {len(cancelled)}")
+        print(f"  Total jobs: {total}")
+        print(f"  Queued: {counts.get('queued', 0)}")
+        print(f"  Completed: {counts.get('completed', 0)}")
+        print(f"  Cancelled: {counts.get('cancelled', 0)}")
         print(f"  Configuration: {self.num_printers} printers, time_scale={self.time_scale}")
         
-        if queued:
+        if counts.get('queued'):
             print(f"\nQueued Jobs:")
             
-            queued_sorted = sorted(queued, key=lambda x: (x['priority'], x['created_at']))
-            for i, job in enumerate(queued_sorted, 1):
+            for i, job in enumerate(self.store.iter_queued(), 1):
                 priority_name = {1: 'high', 2: 'medium', 3: 'low'}[job['priority']]
                 print(f"  {i}. {job['id']} - {job['material']} - {job['est_time']}s - Priority: {job['priority']} ({priority_name})")
     
     def cancel_job(self, job_id: str):
-        job_found = False
-        for job in self.jobs_data:
-            if job['id'] == job_id:
-                job_found = True
-                if job['status'] == 'queued':
-                    job['status'] = 'cancelled'
-                    self.save_state()
-                    print(f"Job '{job_id}' cancelled successfully")
-                    return True
-                else:
-                    print(f"Job '{job_id}' cannot be cancelled (status: {job['status']})")
-                    return False
-        
-        if not job_found:
+        job = self.store.get(job_id)
+        if job is None:
             print(f"Job '{job_id}' not found")
             return False
+        
+        if job['status'] != 'queued':
+            print(f"Job '{job_id}' cannot be cancelled (status: {job['status']})")
+            return False
+        
+        self._save_config_if_new()
+        self.store.cancel(job_id)
+        print(f"Job '{job_id}' cancelled successfully")
+        return True
     
-    def run_simulation(self, save_report: bool = True):
-        if not self.jobs_data:
+    def _queued_jobs(self):
+        for job_data in self.store.iter_queued():
+            job = Job(
+                id=job_data['id'],
+                material=job_data['material'],
+                est_time=job_data['est_time'],
+                priority=job_data['priority'],
+                deadline=job_data.get('deadline')
+            )
+            job.created_at = job_data['created_at']  
+            yield job
+    
+    def run_simulation(self, save_report: bool = True, report_formats: Optional[List[str]] = None,
+                       checkpoint: Optional[str] = None, checkpoint_interval: float = 60.0, resume: bool = False):
+        if not self.store.count():
             print("No jobs to process")
             return
         
-        queued_jobs = [j for j in self.jobs_data if j['status'] == 'queued']
-        if not queued_jobs:
+        queued_count = self.store.count_by_status().get('queued', 0)
+        if not queued_count:
             print("No queued jobs to process")
             return
         
         print(f"Starting simulation...")
-        print(f"  Jobs to process: {len(queued_jobs)}")
-        print(f"  Printers: {self.num_printers}")
+        print(f"  Jobs to process: {queued_count}")
+        fleet = load_fleet(self.fleet_file) if self.fleet_file else None
+        if fleet:
+            print(f"  Printers: {len(fleet)} (fleet {self.fleet_file})")
+        else:
+            print(f"  Printers: {self.num_printers}")
         print(f"  Time scale: {self.time_scale}")
+        print(f"  Mode: {self.mode}")
+        print(f"  Policy: {self.policy}{' (material-aware)' if self.material_aware else ''}")
+        print(f"  Dispatch: {self.dispatch}")
+        if checkpoint:
+            print(f"  Checkpoints: {checkpoint} (every {checkpoint_interval:g}s)")
         print()
         
         
-        simulator = PrinterSimulator(num_printers=self.num_printers, time_scale=self.time_scale)
+        simulator = PrinterSimulator(num_printers=self.num_printers, time_scale=self.time_scale, mode=self.mode,
+                                     policy=self.policy, changeover=self.changeover,
+                                     material_aware=self.material_aware, fleet=fleet, dispatch=self.dispatch,
+                                     profile=self.profile, checkpoint_path=checkpoint,
+                                     checkpoint_interval=checkpoint_interval)
         
         
-        jobs_to_run = []
-        for job_data in queued_jobs:
-            job = Job(
-                id=job_data['id'],
-                material=job_data['material'],
-                est_time=job_data['est_time'],
-                priority=job_data['priority']
-            )
-            job.created_at = job_data['created_at']  
-            jobs_to_run.append(job)
-            simulator.add_job(job)
+        try:
+            if resume and os.path.exists(checkpoint):
+                restored = simulator.restore(checkpoint)
+                print(f"Resumed {restored} jobs from {checkpoint}")
+            # Jobs added to the store since the checkpoint are queued as well
+            simulator.add_jobs(job for job in self._queued_jobs() if job.id not in simulator.all_jobs)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
+        
         
+        metrics_server = None
+        if self.metrics_port is not None:
+            metrics_server = MetricsServer(simulator, port=self.metrics_port).start()
+            print(f"Metrics served at {metrics_server.url}")
         
         start_time = time.time()
-        simulator.run_until_complete()
+        try:
+            simulator.run_until_complete()
+        finally:
+            if metrics_server:
+                metrics_server.stop()
         duration = time.time() - start_time
         
         
         report = simulator.get_report()
-        for job_report in report['jobs']:
-            for job_data in self.jobs_data:
-                if job_data['id'] == job_report['id']:
-                    job_data['status'] = job_report['status']
-                    job_data['started_at'] = job_report['started_at']
-                    job_data['completed_at'] = job_report['completed_at']
-                    break
-        
-        self.save_state()
+        self.store.update_statuses(
+            (job_report['id'], job_report['status'], job_report['started_at'], job_report['completed_at'])
+            for job_report in report['jobs']
+        )
         
         
         print(f"\nSimulation completed in {duration:.2f}s")
@@ -174,15 +223,20 @@ class SimplePrinterCLI:
         
         if save_report:
             timestamp = int(time.time())
-            json_filename = f"simulation_report_{timestamp}.json"
-            csv_filename = f"simulation_report_{timestamp}.csv"
+            report_formats = report_formats or ['json', 'csv']
+            # The JSON report already holds the metrics, so streaming formats
+            # only need their own summary file when it is not written
+            write_summary = 'json' not in report_formats
+            saved = []
             
-            simulator.save_report(json_filename, "json")
-            simulator.save_report(csv_filename, "csv")
+            for format_type in report_formats:
+                filename = f"simulation_report_{timestamp}.{format_type}"
+                simulator.save_report(filename, format_type, write_summary=write_summary)
+                saved.append((format_type.upper(), filename))
             
             print(f"\nReports saved:")
-            print(f"  JSON: {json_filename}")
-            print(f"  CSV: {csv_filename}")
+            for label, filename in saved:
+                print(f"  {label}: {filename}")
         
        
         metrics = report['metrics']
@@ -195,39 +249,99 @@ class SimplePrinterCLI:
                 print(f"  Throughput: {metrics['throughput_jobs_per_second']:.2f} jobs/sec")
             if 'average_printer_utilization' in metrics:
                 print(f"  Average printer utilization: {metrics['average_printer_utilization']:.1f}%")
+            if metrics.get('changeovers'):
+                print(f"  Material changeovers: {metrics['changeovers']} "
+                      f"({metrics['total_changeover_time']:.2f}s)")
+        
+        if self.profile:
+            self.print_profile(simulator.get_summary()['instrumentation'])
+    
+    def print_profile(self, instrumentation: Dict[str, Dict[str, Dict]]):
+        print(f"\nProfile (microseconds):")
+        print(f"  {'timer':<28} {'count':>9} {'mean':>10} {'p50':>10} {'p99':>10} {'max':>10}")
+        for group, histograms in instrumentation.items():
+            if group == 'idle_wait':
+                # One line for all printers rather than one per printer
+                histograms = {'all printers': combine(histograms)}
+            for name, h in histograms.items():
+                if not h['count']:
+                    continue
+                print(f"  {group + '/' + name:<28} {h['count']:>9} {h['mean'] * 1e6:>10.1f} "
+                      f"{h['p50'] * 1e6:>10.1f} {h['p99'] * 1e6:>10.1f} {h['max'] * 1e6:>10.1f}")
     
     def clear_all(self):
         
-        if os.path.exists(STATE_FILE):
-            os.remove(STATE_FILE)
-        self.jobs_data = []
+        self.store.clear()
         print("All jobs cleared")
     
-    def load_jobs_from_file(self, filename: str):
+    def compact_state(self):
+        self.store.compact()
+        print(f"State compacted: {self.store.count()} jobs")
+    
+    def run_sweep(self, job_files: List[str], printer_counts: List[int], time_scales: List[float],
+                  modes: List[str], workers: Optional[int] = None, output: Optional[str] = None):
+        """Simulate every combination of the given settings in parallel and compare them."""
+        configs = sweep.expand_grid({
+            'num_printers': printer_counts,
+            'time_scale': time_scales,
+            'mode': modes,
+            'jobs_file': job_files,
+        })
+        print(f"Running {len(configs)} configurations...")
         
+        start = time.time()
         try:
-            with open(filename, 'r') as f:
-                jobs_data = json.load(f)
-            
-            added_count = 0
-            for job_data in jobs_data:
-                success = self.add_job(
-                    job_data['id'],
-                    job_data['material'], 
-                    job_data['est_time'],
-                    job_data['priority']
-                )
-                if success:
-                    added_count += 1
+            results = sweep.run_sweep(configs, max_workers=workers)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            return None
+        
+        print(f"Finished in {time.time() - start:.2f}s\n")
+        print(sweep.comparison_table(results))
+        
+        if output:
+            sweep.save_results(results, output)
+            print(f"\nSweep results saved to {output}")
+        return results
+    
+    def load_jobs_from_file(self, filename: str, batch_size: int = LOAD_BATCH_SIZE):
+        """Stream jobs from a .json or .jsonl file into the store.
+
+        Records are validated while the file is read, and valid jobs are
+        written in bulk, one batch at a time, so memory stays constant.
+        """
+        errors = []
+        added_count = 0
+        
+        try:
+            records = iter_validated_records(filename, errors)
+            for batch in batched(records, batch_size):
+                pending: Dict[str, Any] = {}
+                for record in batch:
+                    error = self._check_new_job(record['id'], record['est_time'], record['priority'], pending)
+                    if error:
+                        print(f"Error: {error}")
+                        continue
+                    pending[record['id']] = self._new_job_data(
+                        record['id'], record['material'], record['est_time'], record['priority'],
+                        record['deadline']
+                    )
+                
+                for error in errors:
+                    print(f"Skipped invalid job ({error})")
+                errors.clear()
+                
+                if pending:
+                    self._save_config_if_new()
+                    self.store.add_jobs(pending.values())
+                    added_count += len(pending)
             
             print(f"Loaded {added_count} jobs from {filename}")
             
         except FileNotFoundError:
             print(f"File not found: {filename}")
         except json.JSONDecodeError:
-            print(f"Invalid JSON in file: {filename}")
-        except KeyError as e:
-            print(f"Missing required field in job data: {e}")
+            print(f"Invalid JSON in file: {filename} ({added_count} jobs loaded before the error)")
 
 
 def main():
@@ -240,7 +354,17 @@ Examples:
   %(prog)s list
   %(prog)s cancel job1
   %(prog)s run
+  %(prog)s --mode discrete run
+  %(prog)s --policy sjf run
+  %(prog)s --changeover changeover.json --material-aware run
+  %(prog)s --fleet fleet.json run
+  %(prog)s --printers 64 --dispatch stealing run
+  %(prog)s --profile run
+  %(prog)s --metrics-port 9464 run
+  %(prog)s run --checkpoint run.ckpt --resume
+  %(prog)s --store sqlite:jobs.db load sample_jobs.json
   %(prog)s load sample_jobs.json
+  %(prog)s sweep sample_jobs.json --printer-counts 1 2 4 8 --output sweep.csv
   %(prog)s clear
         """
     )
@@ -249,6 +373,35 @@ Examples:
                        help='Number of printers (default: 2)')
     parser.add_argument('--time-scale', '-t', type=float, default=0.01,
                        help='Time scale factor (default: 0.01)')
+    parser.add_argument('--mode', '-m', choices=['threaded', 'discrete'], default='threaded',
+                       help='Simulation engine: threaded (real time) or discrete (virtual clock) (default: threaded)')
+    parser.add_argument('--policy', choices=list(POLICIES), default='priority',
+                       help='Scheduling policy: priority, shortest job first (sjf), earliest deadline first (edf), '
+                            'priority with aging (aging) or weighted fair queuing across priorities (wfq) '
+                            '(default: priority)')
+    parser.add_argument('--changeover', metavar='PATH',
+                       help='JSON changeover matrix charging time for switching a printer between materials')
+    parser.add_argument('--material-aware', action='store_true',
+                       help='Give printers jobs of their loaded material first, within the same priority level')
+    parser.add_argument('--fleet', metavar='PATH',
+                       help='JSON fleet config with printer classes, speeds and supported materials '
+                            '(replaces --printers)')
+    parser.add_argument('--dispatch', choices=['shared', 'stealing'], default='shared',
+                       help='One shared queue, or per-printer local queues with work stealing '
+                            '(approximate priority order) (default: shared)')
+    parser.add_argument('--profile', action='store_true',
+                       help='Record lock wait, queue operation, idle and report timings; '
+                            'printed after the run and saved in the report')
+    parser.add_argument('--metrics-port', type=int, metavar='PORT',
+                       help='During run, serve live metrics in the Prometheus format at '
+                            'http://127.0.0.1:PORT/metrics')
+    parser.add_argument('--verbose', '-v', action='count', default=0,
+                       help='Print job lifecycle events (-v for dispatch/completion, -vv for every queue operation)')
+    parser.add_argument('--event-log', metavar='PATH',
+                       help='Append structured job lifecycle events to PATH as JSON Lines')
+    parser.add_argument('--store', default='journal', metavar='{journal,sqlite:PATH}',
+                       help='Job state backend: journal files in the current directory, '
+                            'or an indexed SQLite database at PATH (default: journal)')
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
@@ -258,6 +411,8 @@ Examples:
     add_parser.add_argument('--time', type=float, required=True, help='Estimated time in seconds')
     add_parser.add_argument('--priority', type=int, choices=[1, 2, 3], default=2,
                            help='Priority: 1=high, 2=medium, 3=low (default: 2)')
+    add_parser.add_argument('--deadline', type=float, metavar='SECONDS',
+                           help='Deadline in seconds from now, used by --policy edf')
     
     subparsers.add_parser('list', help='List all jobs in queue')
     
@@ -266,23 +421,67 @@ Examples:
     
     run_parser = subparsers.add_parser('run', help='Run simulation and generate report')
     run_parser.add_argument('--no-report', action='store_true', help='Skip saving report files')
+    run_parser.add_argument('--format', dest='report_formats', nargs='+', choices=['json', 'csv', 'jsonl'],
+                           help='Report formats to save (default: json csv); csv and jsonl are streamed')
+    run_parser.add_argument('--checkpoint', metavar='PATH',
+                           help='Save the run state to PATH periodically and when the run stops')
+    run_parser.add_argument('--checkpoint-interval', type=float, default=60.0, metavar='SECONDS',
+                           help='Seconds between checkpoints (default: 60)')
+    run_parser.add_argument('--resume', action='store_true',
+                           help='Continue from the --checkpoint file if it exists')
     
-    load_parser = subparsers.add_parser('load', help='Load jobs from JSON file')
-    load_parser.add_argument('filename', help='JSON file with job data')
+    load_parser = subparsers.add_parser('load', help='Load jobs from a JSON or JSON Lines file')
+    load_parser.add_argument('filename', help='.json array or .jsonl file with job data')
     
 
+    sweep_parser = subparsers.add_parser('sweep', help='Compare many configurations in parallel')
+    sweep_parser.add_argument('job_files', nargs='+', help='Job files (.json or .jsonl) to sweep over')
+    sweep_parser.add_argument('--printer-counts', type=int, nargs='+', default=[1, 2, 4, 8],
+                             help='Printer counts to try (default: 1 2 4 8)')
+    sweep_parser.add_argument('--time-scales', type=float, nargs='+', default=[1.0],
+                             help='Time scales to try (default: 1.0)')
+    sweep_parser.add_argument('--modes', nargs='+', choices=['threaded', 'discrete'], default=['discrete'],
+                             help='Simulation engines to try (default: discrete)')
+    sweep_parser.add_argument('--workers', type=int, help='Worker processes (default: one per CPU)')
+    sweep_parser.add_argument('--output', metavar='PATH', help='Save results as JSON, or CSV for a .csv PATH')
+    
     subparsers.add_parser('clear', help='Clear all jobs')
     
+    subparsers.add_parser('compact', help='Fold the change journal into a fresh state snapshot')
+    
     args = parser.parse_args()
     
     if not args.command:
         parser.print_help()
         return
     
-    cli = SimplePrinterCLI(num_printers=args.printers, time_scale=args.time_scale)
+    if args.verbose:
+        event_log.add_sink(ConsoleSink(), level=DEBUG if args.verbose > 1 else INFO)
+    if args.event_log:
+        event_log.add_sink(JsonLinesSink(args.event_log), level=DEBUG)
+    
+    try:
+        changeover = ChangeoverMatrix.load(args.changeover) if args.changeover else None
+    except (OSError, ValueError) as e:
+        parser.error(f"Could not read changeover matrix {args.changeover}: {e}")
+    if args.fleet:
+        try:
+            load_fleet(args.fleet)
+        except (OSError, ValueError) as e:
+            parser.error(f"Could not read fleet config {args.fleet}: {e}")
+    
+    try:
+        cli = SimplePrinterCLI(num_printers=args.printers, time_scale=args.time_scale, mode=args.mode,
+                               store=args.store, policy=args.policy, changeover=changeover,
+                               material_aware=args.material_aware, fleet_file=args.fleet,
+                               dispatch=args.dispatch, profile=args.profile,
+                               metrics_port=args.metrics_port)
+    except ValueError as e:
+        parser.error(str(e))
     
     if args.command == 'add':
-        cli.add_job(args.id, args.material, args.time, args.priority)
+        deadline = time.time() + args.deadline if args.deadline is not None else None
+        cli.add_job(args.id, args.material, args.time, args.priority, deadline)
     
     elif args.command == 'list':
         cli.list_jobs()
@@ -291,13 +490,24 @@ Examples:
         cli.cancel_job(args.job_id)
     
     elif args.command == 'run':
-        cli.run_simulation(save_report=not args.no_report)
+        if args.resume and not args.checkpoint:
+            parser.error("--resume requires --checkpoint")
+        cli.run_simulation(save_report=not args.no_report, report_formats=args.report_formats,
+                           checkpoint=args.checkpoint, checkpoint_interval=args.checkpoint_interval,
+                           resume=args.resume)
     
     elif args.command == 'load':
         cli.load_jobs_from_file(args.filename)
     
+    elif args.command == 'sweep':
+        cli.run_sweep(args.job_files, args.printer_counts, args.time_scales, args.modes,
+                      workers=args.workers, output=args.output)
+    
     elif args.command == 'clear':
         cli.clear_all()
+    
+    elif args.command == 'compact':
+        cli.compact_state()
 
 
 if __name__ == "__main__":
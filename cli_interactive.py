@@ -8,7 +8,11 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from simulator import PrinterSimulator
+from queue_manager import POLICIES
 from models import Job
+from events import event_log, ConsoleSink, DEBUG, INFO
+from job_loader import iter_jobs
+from metrics_server import MetricsServer
 
 
 class PrinterCLI:
@@ -17,13 +21,24 @@ class PrinterCLI:
         self.jobs_file = "jobs.json"
         self.default_printers = 2
         self.default_time_scale = 0.01
+        self.default_policy = 'priority'
+        # Serve live metrics for the current simulator on this port, if set
+        self.metrics_port: Optional[int] = None
+        self.metrics_server: Optional[MetricsServer] = None
     
     def create_simulator(self, num_printers: int = None, time_scale: float = None):
         num_printers = num_printers or self.default_printers
         time_scale = time_scale or self.default_time_scale
         
-        self.simulator = PrinterSimulator(num_printers=num_printers, time_scale=time_scale)
-        print(f"Simulator created: {num_printers} printers, time_scale={time_scale}")
+        self.simulator = PrinterSimulator(num_printers=num_printers, time_scale=time_scale,
+                                          policy=self.default_policy)
+        print(f"Simulator created: {num_printers} printers, time_scale={time_scale}, policy={self.default_policy}")
+        
+        if self.metrics_port is not None:
+            if self.metrics_server:
+                self.metrics_server.stop()
+            self.metrics_server = MetricsServer(self.simulator, port=self.metrics_port).start()
+            print(f"Metrics served at {self.metrics_server.url}")
     
     def configure_simulator(self):
         print(f"\nSimulator Configuration")
@@ -174,29 +189,20 @@ class PrinterCLI:
     
     def load_jobs_from_file(self, filename: str):
         try:
-            with open(filename, 'r') as f:
-                jobs_data = json.load(f)
-            
             if not self.simulator:
                 self.create_simulator()
             
-            for job_data in jobs_data:
-                job = Job(
-                    job_data['id'],
-                    job_data['material'],
-                    job_data['est_time'],
-                    job_data['priority']
-                )
-                self.simulator.add_job(job)
+            errors = []
+            added = self.simulator.add_jobs(iter_jobs(filename, errors))
+            for error in errors:
+                print(f"Skipped invalid job ({error})")
             
-            print(f"Loaded {len(jobs_data)} jobs from {filename}")
+            print(f"Loaded {added} jobs from {filename}")
         
         except FileNotFoundError:
             print(f"File not found: {filename}")
         except json.JSONDecodeError:
             print(f"Invalid JSON in file: {filename}")
-        except KeyError as e:
-            print(f"Missing required field in job data: {e}")
     
     def show_status(self):
         if self.simulator:
@@ -314,6 +320,12 @@ def main():
                        help='Number of printers (default: 2)')
     parser.add_argument('--time-scale', '-t', type=float, default=0.01,
                        help='Time scale factor (default: 0.01)')
+    parser.add_argument('--policy', choices=list(POLICIES), default='priority',
+                       help='Scheduling policy (default: priority)')
+    parser.add_argument('--verbose', '-v', action='count', default=0,
+                       help='Print job lifecycle events (-v for dispatch/completion, -vv for every queue operation)')
+    parser.add_argument('--metrics-port', type=int, metavar='PORT',
+                       help='Serve live metrics in the Prometheus format at http://127.0.0.1:PORT/metrics')
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
@@ -336,16 +348,21 @@ def main():
     report_parser.add_argument('--json', action='store_true', help='Save JSON report')
     report_parser.add_argument('--csv', action='store_true', help='Save CSV report')
     
-    load_parser = subparsers.add_parser('load', help='Load jobs from JSON file')
-    load_parser.add_argument('filename', help='JSON file with job data')
+    load_parser = subparsers.add_parser('load', help='Load jobs from a JSON or JSON Lines file')
+    load_parser.add_argument('filename', help='.json array or .jsonl file with job data')
     
     subparsers.add_parser('interactive', help='Start interactive mode')
     
     args = parser.parse_args()
     
+    if args.verbose:
+        event_log.add_sink(ConsoleSink(), level=DEBUG if args.verbose > 1 else INFO)
+    
     cli = PrinterCLI()
     cli.default_printers = args.printers
     cli.default_time_scale = args.time_scale
+    cli.default_policy = args.policy
+    cli.metrics_port = args.metrics_port
     
     if args.command == 'add':
         cli.create_simulator(args.printers, args.time_scale)
@@ -0,0 +1,195 @@
+import asyncio
+import itertools
+import time
+from typing import Iterable, List, Optional
+
+from models import Job, Printer
+from simulator import PrinterSimulator
+from changeover import ChangeoverMatrix
+from events import event_log, DEBUG, INFO, WARNING
+
+
+class AsyncPrinterSimulator(PrinterSimulator):
+    """Runs every printer as a coroutine on a single asyncio event loop.
+
+    A threaded simulator needs one OS thread per printer; here a printer is
+    just a task awaiting an ``asyncio.PriorityQueue``, so thousands of
+    printers cost little more than a handful. Jobs are ordered by
+    ``(priority, order_counter)`` exactly as in JobQueue, and cancelled jobs
+    are left in the queue as tombstones that workers skip.
+
+    ``add_job``, ``add_jobs``, ``cancel_job``, ``start_simulation``,
+    ``stop_simulation`` and ``run_until_complete`` are coroutines. Create the
+    simulator inside the event loop that will run it (before Python 3.10 the
+    queue binds to the loop current at construction). Status and reports
+    work as in PrinterSimulator, and so do checkpoint() and restore().
+    Stopping the simulation keeps the rest of each in-flight print for the
+    next start.
+    """
+
+    modes = ('async',)
+
+    def __init__(self, num_printers: int = 2, time_scale: float = 0.01, storage: str = 'objects',
+                 changeover: Optional[ChangeoverMatrix] = None):
+        super().__init__(num_printers, time_scale, mode='async', storage=storage, changeover=changeover)
+        self.job_queue = asyncio.PriorityQueue()
+        self._order = itertools.count(1)
+        self._done = asyncio.Event()
+        self._done.set()
+        self.worker_tasks: List[asyncio.Task] = []
+
+    async def add_job(self, job: Job) -> None:
+        self._enqueue(job)
+
+    async def add_jobs(self, jobs: Iterable[Job], batch_size: int = 10000) -> int:
+        added = 0
+        for job in jobs:
+            self._enqueue(job)
+            added += 1
+            # Let the printers run while a long iterable is being consumed
+            if added % batch_size == 0:
+                await asyncio.sleep(0)
+        return added
+
+    def _enqueue(self, job: Job) -> None:
+        if self.storage == 'table':
+            job = self.all_jobs.add(job)
+        else:
+            self.all_jobs[job.id] = job
+        job.order_counter = next(self._order)
+        self._track_added(1)
+        self.status_counter.add_queued([job])
+        self.job_queue.put_nowait((job.priority, job.order_counter, job))
+        event_log.emit(DEBUG, "job_enqueued", job=job.id, priority=job.priority)
+
+    async def cancel_job(self, job_id: str) -> bool:
+        job = self.all_jobs.get(job_id)
+        if job is None:
+            event_log.emit(WARNING, "cancel_unknown_job", job=job_id)
+            return False
+
+        if job.status != 'queued':
+            event_log.emit(WARNING, "cancel_rejected", job=job_id, status=job.status)
+            return False
+
+        job.status = 'cancelled'
+        self.status_counter.move('queued', 'cancelled', job.priority)
+        self.cancelled_jobs.append(job)
+        self._track_finished()
+        event_log.emit(INFO, "job_cancelled", job=job_id)
+        return True
+
+    def _queue_restored(self, jobs: List[Job]) -> None:
+        for job in jobs:
+            job.order_counter = next(self._order)
+            self.job_queue.put_nowait((job.priority, job.order_counter, job))
+
+    def _queue_size(self) -> int:
+        # The asyncio queue still holds cancelled tombstones
+        return self.status_counter.snapshot()['queued']
+
+    def _track_added(self, count: int) -> None:
+        super()._track_added(count)
+        self._done.clear()
+
+    def _track_finished(self) -> None:
+        super()._track_finished()
+        if self.all_done_event.is_set():
+            self._done.set()
+
+    async def _printer_worker(self, printer: Printer) -> None:
+        event_log.emit(DEBUG, "worker_started", printer=printer.id)
+        try:
+            # A job stopped mid-print, or restored, is finished before taking
+            # new work; its start is moved so that only the printing counts
+            remaining = self._in_flight.pop(printer.id, None)
+            if remaining is not None:
+                job = printer.current_job
+                job.started_at = time.time() - (printer.print_time(job) - remaining) * self.time_scale
+                await self._print(printer, job, remaining * self.time_scale)
+
+            while True:
+                _, _, job = await self.job_queue.get()
+                if job.status == 'cancelled':
+                    continue
+
+                changeover_time = self._load_material(printer, job)
+                if changeover_time:
+                    try:
+                        await asyncio.sleep(changeover_time)
+                    except asyncio.CancelledError:
+                        # Stopped before the job started, so it is queued again in its place
+                        self.job_queue.put_nowait((job.priority, job.order_counter, job))
+                        raise
+                    # The job is still 'queued' during the changeover, so it
+                    # may have been cancelled meanwhile
+                    if job.status == 'cancelled':
+                        continue
+
+                printer.start_job(job)
+                print_time = printer.print_time(job) * self.time_scale
+                event_log.emit(INFO, "job_dispatched", printer=printer.id, job=job.id, scaled_time=print_time)
+                await self._print(printer, job, print_time)
+        finally:
+            event_log.emit(DEBUG, "worker_stopped", printer=printer.id)
+
+    async def _print(self, printer: Printer, job: Job, print_time: float) -> None:
+        finish = time.time() + print_time
+        try:
+            await asyncio.sleep(print_time)
+        except asyncio.CancelledError:
+            # Stopped mid-print: like a discrete timeout, the rest of the job
+            # (in est_time units) is printed when the simulation starts again
+            left = max(0.0, finish - time.time())
+            self._in_flight[printer.id] = left / self.time_scale if self.time_scale else 0.0
+            raise
+
+        printer.complete_job()
+        self._record_completion(printer, job)
+        event_log.emit(INFO, "job_finished", printer=printer.id, job=job.id)
+
+    async def start_simulation(self) -> None:
+        if self.worker_tasks:
+            print("Simulation already running")
+            return
+
+        self.simulation_start_time = self._resumed_start or time.time()
+        self._resumed_start = None
+        self.worker_tasks = [
+            asyncio.create_task(self._printer_worker(printer))
+            for printer in self.printers
+        ]
+        print(f"Async simulation started with {self.num_printers} printers")
+
+    async def stop_simulation(self) -> None:
+        if not self.worker_tasks:
+            print("No simulation running")
+            return
+
+        for task in self.worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self.worker_tasks, return_exceptions=True)
+        self.worker_tasks.clear()
+        self.simulation_end_time = time.time()
+        print("Simulation stopped")
+
+    async def run_until_complete(self, timeout: Optional[float] = None) -> None:
+        await self.start_simulation()
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout or None)
+        except asyncio.TimeoutError:
+            print(f"Timeout reached ({timeout}s)")
+        finally:
+            await self.stop_simulation()
+
+
+if __name__ == "__main__":
+    async def main():
+        sim = AsyncPrinterSimulator(num_printers=1000, time_scale=0.01)
+        for i in range(5000):
+            await sim.add_job(Job(f"job_{i}", "PLA", 1 + i % 5, 1 + i % 3))
+        await sim.run_until_complete()
+        metrics = sim.get_report()['metrics']
+        print(f"Completed {metrics['completed_jobs']} jobs in {metrics['simulation_duration_seconds']:.2f}s")
+
+    asyncio.run(main())
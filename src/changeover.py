@@ -0,0 +1,43 @@
+import json
+from typing import Dict, Optional
+
+
+class ChangeoverMatrix:
+    """Time to switch a printer from one loaded material to another.
+
+    Penalties are in the same units as ``Job.est_time`` and are scaled by the
+    simulator's ``time_scale`` like print times. They are looked up as
+    ``penalties[loaded][material]``, falling back to ``default``. Loading
+    the first material into an empty printer costs ``initial``, and keeping
+    the same material costs nothing.
+
+    As a JSON file::
+
+        {"default": 600, "initial": 0,
+         "penalties": {"PLA": {"ABS": 900, "TPU": 1200}, "TPU": {"PLA": 1500}}}
+    """
+
+    def __init__(self, penalties: Optional[Dict[str, Dict[str, float]]] = None,
+                 default: float = 0.0, initial: float = 0.0):
+        self.penalties = {loaded: dict(row) for loaded, row in (penalties or {}).items()}
+        self.default = default
+        self.initial = initial
+
+    def penalty(self, loaded: Optional[str], material: str) -> float:
+        if loaded == material:
+            return 0.0
+        if loaded is None:
+            return self.initial
+        return self.penalties.get(loaded, {}).get(material, self.default)
+
+    def to_dict(self) -> Dict:
+        return {'default': self.default, 'initial': self.initial, 'penalties': self.penalties}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ChangeoverMatrix':
+        return cls(data.get('penalties'), data.get('default', 0.0), data.get('initial', 0.0))
+
+    @classmethod
+    def load(cls, filename: str) -> 'ChangeoverMatrix':
+        with open(filename, 'r') as f:
+            return cls.from_dict(json.load(f))
@@ -0,0 +1,80 @@
+"""Checkpoint files: a simulator's state as compact JSON Lines.
+
+The first line is a header object with the run's config, the printers'
+counters and in-flight jobs, the metric accumulators and the time the
+checkpoint was taken. Every following line holds up to ``CHUNK_SIZE``
+jobs, each a JSON array of the header's ``fields``::
+
+    {"checkpoint": 1, "fields": ["id", ...], "time": 1700000100.0, "printers": [...], ...}
+    [["job1", "PLA", 60, 1, 1700000000.0, "completed", 1700000000.5, 1700000001.1, null, 0],
+     ["job2", "ABS", 30, 2, 1700000000.0, "started", 1700000001.1, null, null, 1],
+     ["job3", "PLA", 45, 1, 1700000000.0, "queued", null, null, null, null]]
+
+(shown wrapped; a chunk is one line). ``printer`` is the printer that
+completed, or is printing, the job. Encoding a chunk per line keeps the
+JSON work inside the C codec instead of one call per job. Files
+are written to a temporary file and renamed into place, so a crash while
+writing leaves the previous checkpoint intact.
+"""
+import json
+import os
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from job_loader import batched
+
+VERSION = 1
+JOB_FIELDS = ('id', 'material', 'est_time', 'priority', 'created_at', 'status', 'started_at',
+              'completed_at', 'deadline', 'printer')
+WRITE_BUFFER_SIZE = 1 << 20
+CHUNK_SIZE = 10000
+
+
+def write(path: str, header: Dict, rows: Iterable[Sequence]) -> None:
+    """Write a header and job rows (in JOB_FIELDS order) to ``path``."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(json.dumps({'checkpoint': VERSION, 'fields': JOB_FIELDS, **header}, separators=(',', ':')) + '\n')
+        for chunk in batched(rows, CHUNK_SIZE):
+            f.write(json.dumps(chunk, separators=(',', ':')) + '\n')
+    os.replace(tmp_path, path)
+
+
+def read(path: str) -> Tuple[Dict, Iterator[List]]:
+    """Return the header of a checkpoint file and an iterator over its job rows.
+
+    Rows are parsed a chunk at a time as the iterator is consumed. The
+    iterator raises ValueError at the end if the file holds fewer jobs than
+    the header says.
+    """
+    f = open(path, 'r')
+    try:
+        header = _header(f.readline(), path)
+    except BaseException:
+        f.close()
+        raise
+    return header, _rows(f, path, header['jobs'])
+
+
+def _header(line: str, path: str) -> Dict:
+    try:
+        header = json.loads(line)
+    except json.JSONDecodeError:
+        header = None
+    if not isinstance(header, dict) or 'checkpoint' not in header:
+        raise ValueError(f"{path} is not a checkpoint file")
+    if header['checkpoint'] != VERSION:
+        raise ValueError(f"Unsupported checkpoint version {header['checkpoint']} in {path}")
+    if tuple(header['fields']) != JOB_FIELDS:
+        raise ValueError(f"Unexpected job fields in {path}: {header['fields']}")
+    return header
+
+
+def _rows(f, path: str, expected: int) -> Iterator[List]:
+    count = 0
+    with f:
+        for line in f:
+            chunk = json.loads(line)
+            count += len(chunk)
+            yield from chunk
+    if count != expected:
+        raise ValueError(f"{path} is incomplete: expected {expected} jobs, found {count}")
@@ -0,0 +1,137 @@
+import atexit
+import collections
+import json
+import logging
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+
+Sink = Callable[[List[Dict]], None]
+
+
+class EventLog:
+    """Buffered, structured log of job lifecycle events.
+
+    ``emit()`` only appends a dict to a bounded ring buffer, so it is cheap
+    enough to call while holding the queue or simulator locks. A background
+    thread drains the buffer to the registered sinks, keeping console and
+    file I/O off the critical sections. With no sinks attached, or below the
+    lowest level of any sink, ``emit()`` returns immediately.
+
+    Each sink has its own level (by default the log's ``level`` argument)
+    and only receives events at or above it.
+
+    When the buffer is full the oldest events are dropped and counted in
+    ``dropped``.
+    """
+
+    def __init__(self, level: int = INFO, capacity: int = 65536, flush_interval: float = 0.2):
+        # Threshold checked by emit(): the lowest level of any sink
+        self.level = level
+        self.default_level = level
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._buffer = collections.deque(maxlen=capacity)
+        self._sinks: List[Tuple[Sink, int]] = []
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+    def enabled(self, level: int) -> bool:
+        return level >= self.level and bool(self._sinks)
+
+    def emit(self, level: int, event: str, **fields) -> None:
+        if level < self.level or not self._sinks:
+            return
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        fields['event'] = event
+        fields['level'] = logging.getLevelName(level)
+        fields['ts'] = time.time()
+        self._buffer.append(fields)
+
+    def add_sink(self, sink: Sink, level: Optional[int] = None) -> None:
+        """Send events at ``level`` and above (default: ``default_level``) to ``sink``."""
+        self._sinks.append((sink, self.default_level if level is None else level))
+        self.level = min(sink_level for _, sink_level in self._sinks)
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._flush_loop, name="EventLogFlusher", daemon=True)
+            self._flusher.start()
+            atexit.register(self.flush)
+
+    def remove_sinks(self) -> None:
+        self.flush()
+        self._sinks.clear()
+        self.level = self.default_level
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            batch = []
+            while self._buffer:
+                batch.append(self._buffer.popleft())
+            if not batch:
+                return
+            for sink, level in self._sinks:
+                if level > self.level:
+                    events = [event for event in batch if logging.getLevelName(event['level']) >= level]
+                    if events:
+                        sink(events)
+                else:
+                    sink(batch)
+
+    def _flush_loop(self) -> None:
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+
+class ConsoleSink:
+    """Writes events as readable one-line messages."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    def __call__(self, events: List[Dict]) -> None:
+        lines = []
+        for event in events:
+            fields = " ".join(f"{key}={value}" for key, value in event.items()
+                              if key not in ('event', 'level', 'ts'))
+            lines.append(f"[{event['level']}] {event['event']} {fields}\n")
+        self.stream.write("".join(lines))
+        self.stream.flush()
+
+
+class JsonLinesSink:
+    """Appends events to a file as JSON Lines, one object per event."""
+
+    def __init__(self, path: str, buffering: int = 1 << 20):
+        self._file = open(path, 'a', buffering=buffering)
+
+    def __call__(self, events: List[Dict]) -> None:
+        self._file.write("".join(json.dumps(event) + "\n" for event in events))
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class LoggingSink:
+    """Forwards events to a standard ``logging`` logger."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        self.logger = logger or logging.getLogger("printer_simulator")
+
+    def __call__(self, events: List[Dict]) -> None:
+        for event in events:
+            self.logger.log(logging.getLevelName(event['level']), "%s", event['event'], extra={'event': event})
+
+
+# Shared by the models, queue and simulator; attach sinks to enable output
+event_log = EventLog()
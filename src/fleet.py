@@ -0,0 +1,50 @@
+"""Printer fleets built from a JSON config.
+
+A fleet file lists printer classes; each class adds ``count`` identical
+printers with a speed multiplier and, optionally, the only materials they
+can print::
+
+    {"printers": [
+        {"class": "fast", "count": 4, "speed": 2.0},
+        {"class": "standard", "count": 8},
+        {"class": "flex", "count": 2, "speed": 0.8, "materials": ["TPU", "PLA"]}
+    ]}
+"""
+import json
+from typing import Dict, List
+
+from models import Printer
+
+
+def build_fleet(config: Dict) -> List[Printer]:
+    """Create the printers described by a fleet config, numbered from 0."""
+    printers: List[Printer] = []
+    for position, spec in enumerate(config.get('printers', []), 1):
+        printer_class = str(spec.get('class', f'class-{position}'))
+        count = spec.get('count', 1)
+        speed = spec.get('speed', 1.0)
+        materials = spec.get('materials')
+
+        if isinstance(count, bool) or not isinstance(count, int) or count < 1:
+            raise ValueError(f"printer class {printer_class}: count must be a positive integer")
+        if isinstance(speed, bool) or not isinstance(speed, (int, float)) or speed <= 0:
+            raise ValueError(f"printer class {printer_class}: speed must be a positive number")
+        if materials is not None and (not isinstance(materials, list) or not materials):
+            raise ValueError(f"printer class {printer_class}: materials must be a non-empty list")
+
+        for _ in range(count):
+            printers.append(Printer(
+                id=len(printers),
+                speed=float(speed),
+                materials=frozenset(str(m) for m in materials) if materials is not None else None,
+                printer_class=printer_class,
+            ))
+
+    if not printers:
+        raise ValueError("fleet config has no printers")
+    return printers
+
+
+def load_fleet(filename: str) -> List[Printer]:
+    with open(filename, 'r') as f:
+        return build_fleet(json.load(f))
@@ -0,0 +1,147 @@
+"""Opt-in timing histograms for the simulator's hot paths.
+
+An Instrumentation holds Histograms grouped by what they measure:
+
+- ``lock_wait``: how long acquiring each kind of lock waited
+- ``queue_ops``: latency of queue operations
+- ``idle_wait``: per printer, how long its worker waited for a job
+- ``report``: metrics, report and checkpoint build times
+
+Nothing here is touched unless profiling is turned on: instrumented locks
+and the timed queue wrapper are swapped in when the simulator is created
+with ``profile=True``.
+"""
+import contextlib
+import threading
+import time
+from typing import Dict
+
+from metrics import Histogram
+
+
+class InstrumentedLock:
+    """A threading.Lock that records how long each acquire waited.
+
+    Can be used with ``with`` and as the lock of a threading.Condition.
+    """
+
+    def __init__(self, histogram: Histogram):
+        self._lock = threading.Lock()
+        self._histogram = histogram
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        start = time.perf_counter()
+        acquired = self._lock.acquire(blocking, timeout)
+        if acquired:
+            self._histogram.add(time.perf_counter() - start)
+        return acquired
+
+    def release(self) -> None:
+        self._lock.release()
+
+    def locked(self) -> bool:
+        return self._lock.locked()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+class Instrumentation:
+    """Named timing histograms, grouped as described in the module docstring."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._groups: Dict[str, Dict[str, Histogram]] = {}
+
+    def histogram(self, group: str, name: str) -> Histogram:
+        with self._lock:
+            histograms = self._groups.setdefault(group, {})
+            if name not in histograms:
+                histograms[name] = Histogram()
+            return histograms[name]
+
+    def lock(self, name: str) -> InstrumentedLock:
+        """A new lock whose acquire waits go to ``lock_wait/name``."""
+        return InstrumentedLock(self.histogram('lock_wait', name))
+
+    @contextlib.contextmanager
+    def timer(self, group: str, name: str):
+        histogram = self.histogram(group, name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            histogram.add(time.perf_counter() - start)
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            groups = {group: dict(histograms) for group, histograms in self._groups.items()}
+        return {group: {name: histogram.to_dict() for name, histogram in sorted(histograms.items())}
+                for group, histograms in sorted(groups.items())}
+
+
+def combine(histograms: Dict[str, Dict]) -> Dict:
+    """Merge several Histogram.to_dict() results into one, e.g. all printers' idle waits."""
+    histograms = [h for h in histograms.values() if h['count']]
+    count = sum(h['count'] for h in histograms)
+    buckets: Dict[str, int] = {}
+    for h in histograms:
+        for bound, bucket_count in h['buckets_us'].items():
+            buckets[bound] = buckets.get(bound, 0) + bucket_count
+    bounds = sorted(buckets, key=lambda bound: int(bound[1:]))
+    top = max((h['max'] for h in histograms), default=None)
+
+    def quantile(q):
+        seen = 0
+        for bound in bounds:
+            seen += buckets[bound]
+            if seen >= q * count:
+                return min(int(bound[1:]) / 1e6, top)
+        return top
+
+    total = sum(h['total'] for h in histograms)
+    return {
+        'count': count,
+        'total': total,
+        'mean': total / count if count else 0.0,
+        'min': min((h['min'] for h in histograms), default=None),
+        'max': top,
+        'p50': quantile(0.5) if count else None,
+        'p90': quantile(0.9) if count else None,
+        'p99': quantile(0.99) if count else None,
+        'buckets_us': {bound: buckets[bound] for bound in bounds},
+    }
+
+
+class TimedQueue:
+    """Wraps a job queue and records the latency of its non-blocking operations.
+
+    Blocking ``get`` calls are passed through untimed, since they mostly
+    measure how long a printer sat idle; the simulator records that per
+    printer instead. Everything else is delegated unchanged.
+    """
+
+    TIMED = ('add_job', 'add_jobs', 'get_next_job', 'cancel_job')
+
+    def __init__(self, queue, instrumentation: Instrumentation):
+        self._queue = queue
+        for name in self.TIMED:
+            setattr(self, name, self._timed(name, getattr(queue, name), instrumentation.histogram('queue_ops', name)))
+
+    @staticmethod
+    def _timed(name, method, histogram):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                histogram.add(time.perf_counter() - start)
+        timed.__name__ = name
+        return timed
+
+    def __getattr__(self, name):
+        return getattr(self._queue, name)
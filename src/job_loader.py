@@ -0,0 +1,174 @@
+"""Streaming readers for job files.
+
+Both formats are read incrementally, so memory stays constant however
+large the file is:
+
+- ``.jsonl``: one job object per line
+- ``.json``: a JSON array of job objects (as in sample_jobs.json), decoded
+  one element at a time
+
+Records are validated in the same pass.
+"""
+import json
+import math
+from typing import Dict, Iterator, List, Optional
+
+from models import Job
+
+
+REQUIRED_FIELDS = ('id', 'material', 'est_time', 'priority')
+READ_CHUNK_SIZE = 1 << 16
+# Characters that can continue a JSON number
+NUMBER_CHARS = '0123456789+-.eE'
+
+
+class JobValidationError(ValueError):
+    """A job record that is missing fields or has invalid values."""
+
+    def __init__(self, message: str, position: int):
+        super().__init__(f"record {position}: {message}")
+        self.position = position
+
+
+def validate_job_record(record, position: int = 0) -> Dict:
+    """Check a raw job record and return it with normalized field types."""
+    if not isinstance(record, dict):
+        raise JobValidationError("expected a JSON object", position)
+
+    missing = [field for field in REQUIRED_FIELDS if field not in record]
+    if missing:
+        raise JobValidationError(f"missing required field(s): {', '.join(missing)}", position)
+
+    try:
+        est_time = float(record['est_time'])
+    except (TypeError, ValueError):
+        raise JobValidationError(f"est_time must be a number, got {record['est_time']!r}", position)
+    if not math.isfinite(est_time) or est_time <= 0:
+        raise JobValidationError(f"est_time must be a positive finite number, got {est_time!r}", position)
+
+    priority = record['priority']
+    if isinstance(priority, bool) or not isinstance(priority, int):
+        raise JobValidationError(f"priority must be an integer, got {priority!r}", position)
+
+    deadline = record.get('deadline')
+    if deadline is not None:
+        try:
+            deadline = float(deadline)
+        except (TypeError, ValueError):
+            raise JobValidationError(f"deadline must be a number, got {deadline!r}", position)
+        if not math.isfinite(deadline):
+            raise JobValidationError(f"deadline must be finite, got {deadline!r}", position)
+
+    return {
+        **record,
+        'deadline': deadline,
+        'id': str(record['id']),
+        'material': str(record['material']),
+        'est_time': est_time,
+        'priority': priority,
+    }
+
+
+def _iter_json_array(f) -> Iterator:
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    started = False
+    eof = False
+
+    while True:
+        # Skip whitespace and separators between elements
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                position += 1
+            if position < len(buffer) or eof:
+                break
+            buffer, position = f.read(READ_CHUNK_SIZE), 0
+            eof = not buffer
+
+        if position >= len(buffer):
+            if not started:
+                raise json.JSONDecodeError("Expected a JSON array", buffer, position)
+            raise json.JSONDecodeError("Unterminated JSON array", buffer, position)
+
+        if not started:
+            if buffer[position] != '[':
+                raise json.JSONDecodeError("Expected a JSON array", buffer, position)
+            started = True
+            position += 1
+            continue
+
+        if buffer[position] == ']':
+            return
+
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                chunk = f.read(READ_CHUNK_SIZE)
+                eof = not chunk
+                buffer, position = buffer[position:] + chunk, 0
+                continue
+            # A number cut at the end of the buffer may continue in the next
+            # chunk ('1' | '.5', '1e' | '10'), so only characters that could
+            # still belong to it may follow it
+            if not eof and not buffer[end:].lstrip(NUMBER_CHARS):
+                chunk = f.read(READ_CHUNK_SIZE)
+                if chunk:
+                    buffer, position = buffer[position:] + chunk, 0
+                    continue
+                eof = True
+            break
+
+        yield value
+        position = end
+
+
+def iter_job_records(filename: str) -> Iterator[Dict]:
+    """Yield raw job records from a .json array or a .jsonl file."""
+    with open(filename, 'r') as f:
+        if filename.endswith('.jsonl'):
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        else:
+            yield from _iter_json_array(f)
+
+
+def iter_validated_records(filename: str, errors: Optional[List[JobValidationError]] = None) -> Iterator[Dict]:
+    """Yield validated job records.
+
+    Invalid records raise JobValidationError, unless an ``errors`` list is
+    given, in which case they are appended to it and skipped.
+    """
+    for position, record in enumerate(iter_job_records(filename), 1):
+        try:
+            yield validate_job_record(record, position)
+        except JobValidationError as e:
+            if errors is None:
+                raise
+            errors.append(e)
+
+
+def iter_jobs(filename: str, errors: Optional[List[JobValidationError]] = None) -> Iterator[Job]:
+    """Yield a Job for each valid record of a job file."""
+    for record in iter_validated_records(filename, errors):
+        job = Job(record['id'], record['material'], record['est_time'], record['priority'],
+                  deadline=record['deadline'])
+        if 'created_at' in record:
+            job.created_at = record['created_at']
+        yield job
+
+
+def batched(iterable, size: int) -> Iterator[List]:
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -0,0 +1,254 @@
+import json
+import os
+import sqlite3
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# A job status update: (id, status, started_at, completed_at)
+StatusUpdate = Tuple[str, str, Optional[float], Optional[float]]
+
+CONFIG_KEYS = ('num_printers', 'time_scale')
+
+
+class JournalJobStore:
+    """CLI job state as a JSON snapshot plus an append-only JSON Lines journal.
+
+    Every change is appended to the journal as one small record instead of
+    rewriting the whole state file:
+
+        {"op": "add", "job": {...}}
+        {"op": "cancel", "id": "job1"}
+        {"op": "status", "id": "job1", "status": "completed", "started_at": ..., "completed_at": ...}
+        {"op": "config", "num_printers": 2, "time_scale": 0.01}
+
+    Opening the store replays the journal on top of the snapshot into an
+    in-memory list plus an id index. Once the journal holds ``compact_every``
+    records it is folded into a fresh snapshot. A truncated last line (from
+    an interrupted write) is ignored.
+    """
+
+    def __init__(self, snapshot_path: str, journal_path: str, compact_every: int = 1000):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self.compact_every = compact_every
+        self.journal_records = 0
+        self.jobs: List[Dict] = []
+        self.config: Dict = {}
+        self._by_id: Dict[str, Dict] = {}
+        self.load()
+
+    def load(self) -> Tuple[List[Dict], Dict]:
+        """Replay the journal over the snapshot and return (jobs, config)."""
+        self.jobs, self.config, self._by_id = [], {}, {}
+
+        try:
+            with open(self.snapshot_path, 'r') as f:
+                data = json.load(f)
+            self.jobs = data.get('jobs', [])
+            self.config = {key: data[key] for key in CONFIG_KEYS if key in data}
+        except (json.JSONDecodeError, FileNotFoundError):
+            pass
+
+        self._by_id = {job['id']: job for job in self.jobs}
+        self.journal_records = 0
+        try:
+            with open(self.journal_path, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self._apply(record)
+                    self.journal_records += 1
+        except FileNotFoundError:
+            pass
+
+        return self.jobs, self.config
+
+    def _apply(self, record: Dict) -> None:
+        op = record.get('op')
+        if op == 'add':
+            job = record['job']
+            if job['id'] not in self._by_id:
+                self.jobs.append(job)
+                self._by_id[job['id']] = job
+        elif op == 'cancel':
+            job = self._by_id.get(record['id'])
+            if job is not None:
+                job['status'] = 'cancelled'
+        elif op == 'status':
+            job = self._by_id.get(record['id'])
+            if job is not None:
+                job['status'] = record['status']
+                job['started_at'] = record.get('started_at')
+                job['completed_at'] = record.get('completed_at')
+        elif op == 'config':
+            self.config.update({key: record[key] for key in CONFIG_KEYS if key in record})
+
+    def _write(self, records: List[Dict]) -> None:
+        """Apply records in memory and append them to the journal with a single write."""
+        if not records:
+            return
+        for record in records:
+            self._apply(record)
+        with open(self.journal_path, 'a') as f:
+            f.write(''.join(json.dumps(record, separators=(',', ':')) + '\n' for record in records))
+        self.journal_records += len(records)
+        if self.needs_compaction():
+            self.compact()
+
+    def append(self, records: List[Dict]) -> None:
+        self._write(list(records))
+
+    def needs_compaction(self) -> bool:
+        return self.journal_records >= self.compact_every
+
+    def compact(self) -> None:
+        """Write a snapshot of the current state and empty the journal."""
+        tmp_path = f"{self.snapshot_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'jobs': self.jobs, **self.config}, f)
+        os.replace(tmp_path, self.snapshot_path)
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self.journal_records = 0
+
+    def clear(self) -> None:
+        for path in (self.snapshot_path, self.journal_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self.jobs, self.config, self._by_id = [], {}, {}
+        self.journal_records = 0
+
+    def get_config(self) -> Dict:
+        return dict(self.config)
+
+    def set_config(self, num_printers: int, time_scale: float) -> None:
+        self._write([{'op': 'config', 'num_printers': num_printers, 'time_scale': time_scale}])
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        return self._by_id.get(job_id)
+
+    def add_jobs(self, jobs: Iterable[Dict]) -> None:
+        self._write([{'op': 'add', 'job': job} for job in jobs])
+
+    def cancel(self, job_id: str) -> None:
+        self._write([{'op': 'cancel', 'id': job_id}])
+
+    def update_statuses(self, updates: Iterable[StatusUpdate]) -> None:
+        self._write([
+            {'op': 'status', 'id': job_id, 'status': status, 'started_at': started_at, 'completed_at': completed_at}
+            for job_id, status, started_at, completed_at in updates
+        ])
+
+    def count(self) -> int:
+        return len(self.jobs)
+
+    def count_by_status(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for job in self.jobs:
+            counts[job['status']] = counts.get(job['status'], 0) + 1
+        return counts
+
+    def iter_queued(self) -> Iterator[Dict]:
+        """Queued jobs in dispatch order: priority, then creation time."""
+        queued = [job for job in self.jobs if job['status'] == 'queued']
+        return iter(sorted(queued, key=lambda job: (job['priority'], job['created_at'])))
+
+
+class SqliteJobStore:
+    """CLI job state in a SQLite database.
+
+    Jobs are rows keyed by id, with an index on (status, priority, created_at)
+    so status counts, the queued listing in dispatch order and single-job
+    lookups are index queries, and bulk changes use ``executemany``.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id TEXT PRIMARY KEY, material TEXT NOT NULL, est_time REAL NOT NULL,"
+                " priority INTEGER NOT NULL, created_at REAL NOT NULL, status TEXT NOT NULL,"
+                " started_at REAL, completed_at REAL, deadline REAL)"
+            )
+            columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(jobs)")}
+            if 'deadline' not in columns:
+                # Databases created before deadlines were supported
+                self.conn.execute("ALTER TABLE jobs ADD COLUMN deadline REAL")
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_status_priority ON jobs (status, priority, created_at)"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_priority ON jobs (priority)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS config (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    def get_config(self) -> Dict:
+        rows = self.conn.execute("SELECT key, value FROM config").fetchall()
+        return {row['key']: json.loads(row['value']) for row in rows if row['key'] in CONFIG_KEYS}
+
+    def set_config(self, num_printers: int, time_scale: float) -> None:
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)",
+                [('num_printers', json.dumps(num_printers)), ('time_scale', json.dumps(time_scale))]
+            )
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        row = self.conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def add_jobs(self, jobs: Iterable[Dict]) -> None:
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO jobs (id, material, est_time, priority, created_at, status, deadline)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                ((job['id'], job['material'], job['est_time'], job['priority'], job['created_at'],
+                  job['status'], job.get('deadline')) for job in jobs)
+            )
+
+    def cancel(self, job_id: str) -> None:
+        with self.conn:
+            self.conn.execute("UPDATE jobs SET status = 'cancelled' WHERE id = ? AND status = 'queued'", (job_id,))
+
+    def update_statuses(self, updates: Iterable[StatusUpdate]) -> None:
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE jobs SET status = ?, started_at = ?, completed_at = ? WHERE id = ?",
+                ((status, started_at, completed_at, job_id) for job_id, status, started_at, completed_at in updates)
+            )
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def count_by_status(self) -> Dict[str, int]:
+        rows = self.conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def iter_queued(self) -> Iterator[Dict]:
+        cursor = self.conn.execute(
+            "SELECT * FROM jobs WHERE status = 'queued' ORDER BY priority, created_at"
+        )
+        for row in cursor:
+            yield dict(row)
+
+    def compact(self) -> None:
+        self.conn.execute("VACUUM")
+
+    def clear(self) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM jobs")
+            self.conn.execute("DELETE FROM config")
+
+
+def open_store(spec: str, snapshot_path: str, journal_path: str):
+    """Open the store named by a ``--store`` value: ``journal`` or ``sqlite:PATH``."""
+    if spec == 'journal':
+        return JournalJobStore(snapshot_path, journal_path)
+    if spec.startswith('sqlite:') and len(spec) > len('sqlite:'):
+        return SqliteJobStore(spec[len('sqlite:'):])
+    raise ValueError(f"Unsupported store: {spec} (expected 'journal' or 'sqlite:PATH')")
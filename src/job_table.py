@@ -0,0 +1,205 @@
+import math
+from array import array
+from typing import Dict, Iterator, List, Optional
+
+from models import Job, JOB_STATUSES
+
+
+STATUS_CODES = {status: code for code, status in enumerate(JOB_STATUSES)}
+
+_NAN = float('nan')
+
+
+def _timestamp(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+class JobTable:
+    """Columnar job storage for million-job workloads.
+
+    Each job field lives in its own typed ``array`` (materials are interned
+    to small integer codes, statuses to status codes, missing timestamps are
+    NaN), so a job costs a few dozen bytes instead of a full Python object.
+    The table also behaves like the ``{id: job}`` dict PrinterSimulator
+    keeps in ``all_jobs``; lookups return lightweight JobView rows.
+    """
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self.materials: List[str] = []
+        self._material_codes: Dict[str, int] = {}
+
+        self.material = array('I')
+        self.est_time = array('d')
+        self.priority = array('q')
+        self.status = array('b')
+        self.order_counter = array('q')
+        self.created_at = array('d')
+        self.started_at = array('d')
+        self.completed_at = array('d')
+        self.deadline = array('d')
+
+    def append(self, id, material, est_time, priority, created_at: float,
+               deadline: Optional[float] = None) -> 'JobView':
+        """Add a queued job row; an existing id has its row overwritten, as in a dict."""
+        code = self._material_codes.get(material)
+        if code is None:
+            code = self._material_codes[material] = len(self.materials)
+            self.materials.append(material)
+
+        row = self._rows.get(id)
+        if row is not None:
+            self.material[row] = code
+            self.est_time[row] = est_time
+            self.priority[row] = priority
+            self.status[row] = STATUS_CODES['queued']
+            self.order_counter[row] = 0
+            self.created_at[row] = created_at
+            self.started_at[row] = _NAN
+            self.completed_at[row] = _NAN
+            self.deadline[row] = _NAN if deadline is None else deadline
+            return JobView(self, row)
+
+        row = len(self.ids)
+        self.ids.append(id)
+        self._rows[id] = row
+        self.material.append(code)
+        self.est_time.append(est_time)
+        self.priority.append(priority)
+        self.status.append(STATUS_CODES['queued'])
+        self.order_counter.append(0)
+        self.created_at.append(created_at)
+        self.started_at.append(_NAN)
+        self.completed_at.append(_NAN)
+        self.deadline.append(_NAN if deadline is None else deadline)
+        return JobView(self, row)
+
+    def add(self, job: Job) -> 'JobView':
+        """Copy a Job into the table and return its view."""
+        view = self.append(job.id, job.material, job.est_time, job.priority, job.created_at, job.deadline)
+        if job.status != 'queued':
+            view.status = job.status
+        return view
+
+    def view(self, row: int) -> 'JobView':
+        return JobView(self, row)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, job_id) -> bool:
+        return job_id in self._rows
+
+    def __getitem__(self, job_id) -> 'JobView':
+        return JobView(self, self._rows[job_id])
+
+    def get(self, job_id, default=None):
+        row = self._rows.get(job_id)
+        return default if row is None else JobView(self, row)
+
+    def keys(self):
+        return self._rows.keys()
+
+    def values(self) -> Iterator['JobView']:
+        for row in self._rows.values():
+            yield JobView(self, row)
+
+    def items(self):
+        for job_id, row in self._rows.items():
+            yield job_id, JobView(self, row)
+
+    def __iter__(self):
+        return iter(self._rows)
+
+
+class JobView:
+    """A row of a JobTable with the same interface as models.Job."""
+
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table: JobTable, row: int):
+        self._table = table
+        self._row = row
+
+    @property
+    def id(self):
+        return self._table.ids[self._row]
+
+    @property
+    def material(self):
+        return self._table.materials[self._table.material[self._row]]
+
+    @property
+    def est_time(self):
+        return self._table.est_time[self._row]
+
+    @property
+    def priority(self):
+        return self._table.priority[self._row]
+
+    @priority.setter
+    def priority(self, value):
+        self._table.priority[self._row] = value
+
+    @property
+    def status(self):
+        return JOB_STATUSES[self._table.status[self._row]]
+
+    @status.setter
+    def status(self, value):
+        self._table.status[self._row] = STATUS_CODES[value]
+
+    @property
+    def order_counter(self):
+        return self._table.order_counter[self._row]
+
+    @order_counter.setter
+    def order_counter(self, value):
+        self._table.order_counter[self._row] = value
+
+    @property
+    def created_at(self):
+        return self._table.created_at[self._row]
+
+    @created_at.setter
+    def created_at(self, value):
+        self._table.created_at[self._row] = value
+
+    @property
+    def started_at(self):
+        return _timestamp(self._table.started_at[self._row])
+
+    @started_at.setter
+    def started_at(self, value):
+        self._table.started_at[self._row] = _NAN if value is None else value
+
+    @property
+    def completed_at(self):
+        return _timestamp(self._table.completed_at[self._row])
+
+    @completed_at.setter
+    def completed_at(self, value):
+        self._table.completed_at[self._row] = _NAN if value is None else value
+
+    @property
+    def deadline(self):
+        return _timestamp(self._table.deadline[self._row])
+
+    @deadline.setter
+    def deadline(self, value):
+        self._table.deadline[self._row] = _NAN if value is None else value
+
+    def __eq__(self, other):
+        return isinstance(other, JobView) and other._table is self._table and other._row == self._row
+
+    def __hash__(self):
+        return hash((id(self._table), self._row))
+
+    # The lifecycle methods only touch attributes, so Job's implementations
+    # work unchanged on top of the properties above
+    start_printing = Job.start_printing
+    complete_printing = Job.complete_printing
+    get_wait_time = Job.get_wait_time
+    get_run_time = Job.get_run_time
+    __str__ = Job.__str__
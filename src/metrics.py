@@ -0,0 +1,268 @@
+import bisect
+import copy
+import itertools
+import math
+import threading
+from typing import Dict, List, Optional, Tuple
+
+
+class RunningStats:
+    """Count, mean, variance, min, max and total of a stream of values.
+
+    Uses Welford's online algorithm, so memory stays constant and the mean
+    and variance are numerically stable however many values are added.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._m2 = 0.0
+
+    def add(self, value: float):
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the values seen so far."""
+        if self.count == 0:
+            return 0.0
+        return self._m2 / self.count
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class P2Quantile:
+    """Streaming estimate of a single quantile with the P-square algorithm.
+
+    Jain & Chlamtac's P² keeps five markers whose heights are adjusted with
+    piecewise-parabolic interpolation as values arrive, so the estimate costs
+    O(1) time and memory per value. The first five values are kept exactly.
+    """
+
+    def __init__(self, p: float):
+        if not 0 < p < 1:
+            raise ValueError(f"Quantile must be between 0 and 1, got {p}")
+        self.p = p
+        self.count = 0
+        self._heights: List[float] = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+        self._increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, value: float):
+        self.count += 1
+        heights = self._heights
+
+        if self.count <= 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        positions = self._positions
+        if value < heights[0]:
+            heights[0] = value
+            k = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            k = 3
+        else:
+            k = 0
+            while value >= heights[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in range(1, 4):
+            d = self._desired[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or \
+                    (d <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if d > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, step)
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, d: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+            (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, d: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+
+    @property
+    def value(self) -> Optional[float]:
+        if self.count == 0:
+            return None
+        if self.count <= 5:
+            return self._heights[min(self.count - 1, int(self.count * self.p))]
+        return self._heights[2]
+
+
+class Histogram:
+    """Log-scale histogram of durations in seconds.
+
+    Bucket ``k`` counts values under ``2**k`` microseconds (and at least
+    ``2**(k-1)``), so recording is O(1) and memory is fixed. Percentiles are
+    the upper bound of the bucket they fall in, i.e. accurate to within a
+    factor of two; count, total, min and max are exact.
+    """
+
+    BUCKETS = 40
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = [0] * self.BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, seconds: float):
+        bucket = min(int(seconds * 1e6).bit_length(), self.BUCKETS - 1)
+        with self._lock:
+            self.counts[bucket] += 1
+            self.count += 1
+            self.total += seconds
+            if self.min is None or seconds < self.min:
+                self.min = seconds
+            if self.max is None or seconds > self.max:
+                self.max = seconds
+
+    def quantile(self, q: float) -> Optional[float]:
+        with self._lock:
+            return self._quantile_unsafe(q)
+
+    def _quantile_unsafe(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min((1 << bucket) / 1e6, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            return {
+                'count': self.count,
+                'total': self.total,
+                'mean': self.total / self.count if self.count else 0.0,
+                'min': self.min,
+                'max': self.max,
+                'p50': self._quantile_unsafe(0.5),
+                'p90': self._quantile_unsafe(0.9),
+                'p99': self._quantile_unsafe(0.99),
+                'buckets_us': {f"<{1 << bucket}": count for bucket, count in enumerate(self.counts) if count},
+            }
+
+
+class MetricsAccumulator:
+    """Online wait and run time statistics, updated as each job completes.
+
+    Keeps a RunningStats and p50/p90/p99 P² estimators for both series, so
+    producing the metrics is O(1) and memory use does not grow with the
+    number of jobs. Wait times are also counted in the fixed
+    ``WAIT_BUCKETS`` (upper bounds in seconds) for histogram exports.
+    """
+
+    QUANTILES = (0.5, 0.9, 0.99)
+    WAIT_BUCKETS = (0.01, 0.1, 1, 10, 60, 300, 900, 3600, 4 * 3600, 24 * 3600)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.wait = RunningStats()
+        self.run = RunningStats()
+        self.wait_quantiles = {q: P2Quantile(q) for q in self.QUANTILES}
+        self.run_quantiles = {q: P2Quantile(q) for q in self.QUANTILES}
+        # One count per bucket plus the overflow (+Inf) bucket
+        self.wait_bucket_counts = [0] * (len(self.WAIT_BUCKETS) + 1)
+
+    def record(self, wait_time: Optional[float], run_time: Optional[float]):
+        with self._lock:
+            if wait_time is not None:
+                self.wait.add(wait_time)
+                for estimator in self.wait_quantiles.values():
+                    estimator.add(wait_time)
+                self.wait_bucket_counts[bisect.bisect_left(self.WAIT_BUCKETS, wait_time)] += 1
+            if run_time is not None:
+                self.run.add(run_time)
+                for estimator in self.run_quantiles.values():
+                    estimator.add(run_time)
+
+    def record_job(self, job):
+        self.record(job.get_wait_time(), job.get_run_time())
+
+    def get_state(self) -> Dict:
+        """Every statistic's internal state as plain values, e.g. for a checkpoint."""
+        with self._lock:
+            return copy.deepcopy({
+                'wait': vars(self.wait),
+                'run': vars(self.run),
+                'wait_quantiles': [vars(estimator) for estimator in self.wait_quantiles.values()],
+                'run_quantiles': [vars(estimator) for estimator in self.run_quantiles.values()],
+                'wait_bucket_counts': self.wait_bucket_counts,
+            })
+
+    def set_state(self, state: Dict):
+        """Continue from a state returned by get_state()."""
+        state = copy.deepcopy(state)
+        with self._lock:
+            vars(self.wait).update(state['wait'])
+            vars(self.run).update(state['run'])
+            for estimator, saved in zip(self.wait_quantiles.values(), state['wait_quantiles']):
+                vars(estimator).update(saved)
+            for estimator, saved in zip(self.run_quantiles.values(), state['run_quantiles']):
+                vars(estimator).update(saved)
+            self.wait_bucket_counts = state['wait_bucket_counts']
+
+    def wait_histogram(self) -> Tuple[List[int], float]:
+        """Cumulative wait counts for each of WAIT_BUCKETS and +Inf, and the wait total."""
+        with self._lock:
+            return list(itertools.accumulate(self.wait_bucket_counts)), self.wait.total
+
+    def to_dict(self) -> Dict[str, float]:
+        """Metrics in the keys used by PrinterSimulator's report."""
+        metrics = {}
+        with self._lock:
+            if self.wait.count:
+                metrics['avg_wait_time'] = self.wait.mean
+                metrics['median_wait_time'] = self.wait_quantiles[0.5].value
+                metrics['p90_wait_time'] = self.wait_quantiles[0.9].value
+                metrics['p99_wait_time'] = self.wait_quantiles[0.99].value
+                metrics['max_wait_time'] = self.wait.max
+                metrics['min_wait_time'] = self.wait.min
+                metrics['wait_time_variance'] = self.wait.variance
+
+            if self.run.count:
+                metrics['avg_run_time'] = self.run.mean
+                metrics['median_run_time'] = self.run_quantiles[0.5].value
+                metrics['p90_run_time'] = self.run_quantiles[0.9].value
+                metrics['p99_run_time'] = self.run_quantiles[0.99].value
+                metrics['max_run_time'] = self.run.max
+                metrics['min_run_time'] = self.run.min
+                metrics['run_time_variance'] = self.run.variance
+                metrics['total_processing_time'] = self.run.total
+        return metrics
@@ -0,0 +1,127 @@
+"""Live simulator metrics over HTTP in the Prometheus text format.
+
+MetricsServer serves ``GET /metrics`` from a stdlib ThreadingHTTPServer on
+a background thread::
+
+    server = MetricsServer(sim, port=9464).start()
+    sim.run_until_complete()
+    server.stop()
+
+Every value comes from counters the simulator already keeps up to date
+(StatusCounter, MetricsAccumulator and the printers' own fields), so a
+scrape never walks ``all_jobs`` and never touches the queue or simulator
+locks; it only takes the short-lived locks of those counters.
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+PREFIX = 'printer_sim'
+
+
+def _labels(**labels) -> str:
+    if not labels:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+               for value in labels.values())
+    return '{' + ','.join(f'{name}="{value}"' for name, value in zip(labels, escaped)) + '}'
+
+
+def _format(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render(simulator) -> str:
+    """The simulator's current metrics in the Prometheus exposition format."""
+    lines: List[str] = []
+
+    def metric(name, kind, help_text, samples):
+        lines.append(f"# HELP {PREFIX}_{name} {help_text}")
+        lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+        for suffix, labels, value in samples:
+            lines.append(f"{PREFIX}_{name}{suffix}{_labels(**labels)} {_format(value)}")
+
+    counts = simulator.status_counter.snapshot()
+    by_priority = simulator.status_counter.queued_by_priority()
+    metric('jobs_queued', 'gauge', 'Jobs waiting to be printed, by priority.',
+           [('', {'priority': priority}, depth) for priority, depth in sorted(by_priority.items())])
+    metric('jobs_running', 'gauge', 'Jobs being printed.', [('', {}, counts['started'])])
+    metric('jobs_added_total', 'counter', 'Jobs added to the simulation.', [('', {}, sum(counts.values()))])
+    metric('jobs_completed_total', 'counter', 'Jobs printed to completion.', [('', {}, counts['completed'])])
+    metric('jobs_cancelled_total', 'counter', 'Jobs cancelled while queued.', [('', {}, counts['cancelled'])])
+
+    printers = simulator.printers
+    metric('printer_busy', 'gauge', 'Whether the printer is printing (1) or idle (0).',
+           [('', {'printer': p.id, 'class': p.printer_class}, int(p.is_busy)) for p in printers])
+    metric('printer_jobs_completed_total', 'counter', 'Jobs completed by the printer.',
+           [('', {'printer': p.id, 'class': p.printer_class}, p.total_jobs_completed) for p in printers])
+    metric('printer_busy_seconds_total', 'counter', 'Time the printer spent printing, on the simulation clock.',
+           [('', {'printer': p.id, 'class': p.printer_class}, p.total_busy_time) for p in printers])
+
+    cumulative, total = simulator.metrics.wait_histogram()
+    bounds = list(simulator.metrics.WAIT_BUCKETS) + [float('inf')]
+    samples = [('_bucket', {'le': _format(float(bound))}, count) for bound, count in zip(bounds, cumulative)]
+    samples.append(('_sum', {}, total))
+    samples.append(('_count', {}, cumulative[-1]))
+    metric('job_wait_seconds', 'histogram', 'Time completed jobs waited in the queue, on the simulation clock.',
+           samples)
+
+    return '\n'.join(lines) + '\n'
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?', 1)[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = render(self.server.simulator).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes every few seconds would otherwise flood stderr
+        pass
+
+
+class MetricsServer:
+    """Serves a simulator's metrics at ``http://host:port/metrics``.
+
+    Binds to localhost by default. ``port=0`` picks a free port, available
+    as ``port`` once started.
+    """
+
+    def __init__(self, simulator, host: str = '127.0.0.1', port: int = 9464):
+        self.simulator = simulator
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> 'MetricsServer':
+        server = ThreadingHTTPServer((self.host, self.port), _MetricsHandler)
+        server.daemon_threads = True
+        server.simulator = self.simulator
+        self._server = server
+        self.port = server.server_address[1]
+        self._thread = threading.Thread(target=server.serve_forever, name="MetricsServer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(timeout=5.0)
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/metrics"
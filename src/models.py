@@ -1,10 +1,20 @@
+import threading
 import time
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, Optional
+
+from events import event_log, DEBUG
+
+
+JOB_STATUSES = ('queued', 'started', 'completed', 'cancelled')
 
 
 class Job:
-    def __init__(self, id, material, est_time, priority):
+    # Slotted: no per-instance __dict__, which matters with millions of jobs
+    __slots__ = ('id', 'material', 'est_time', 'priority', 'created_at', 'status',
+                 'started_at', 'completed_at', 'order_counter', 'deadline')
+
+    def __init__(self, id, material, est_time, priority, deadline: Optional[float] = None):
         self.id = id
         self.material = material
         self.est_time = est_time
@@ -14,16 +24,18 @@ class Job:
         self.started_at = None
         self.completed_at = None
         self.order_counter = 0
+        # Absolute time the job should be finished by, used by the EDF policy
+        self.deadline = deadline
 
-    def start_printing(self):
+    def start_printing(self, now: Optional[float] = None):
         self.status = 'started'
-        self.started_at = time.time()
-        print(f"Job {self.id} started printing at {self.started_at}")
+        self.started_at = time.time() if now is None else now
+        event_log.emit(DEBUG, "job_started", job=self.id, started_at=self.started_at)
 
-    def complete_printing(self):
+    def complete_printing(self, now: Optional[float] = None):
         self.status = 'completed'
-        self.completed_at = time.time()
-        print(f"Job {self.id} completed printing at {self.completed_at}")
+        self.completed_at = time.time() if now is None else now
+        event_log.emit(DEBUG, "job_completed", job=self.id, completed_at=self.completed_at)
     
     def get_wait_time(self):
         if self.started_at:
@@ -39,6 +51,45 @@ class Job:
         return f"Job({self.id}, {self.material}, {self.est_time}s, priority={self.priority})"
 
 
+class StatusCounter:
+    """Running count of jobs per status, updated on every state transition.
+
+    Lets callers take a status snapshot in O(1) instead of walking every job.
+    Jobs added with add_queued() are also counted per priority while queued,
+    as long as moves out of 'queued' pass the job's priority.
+    """
+
+    def __init__(self):
+        self._counts = dict.fromkeys(JOB_STATUSES, 0)
+        self._queued_by_priority: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, status: str, count: int = 1):
+        with self._lock:
+            self._counts[status] += count
+
+    def add_queued(self, jobs: Iterable[Job]):
+        with self._lock:
+            for job in jobs:
+                self._counts['queued'] += 1
+                self._queued_by_priority[job.priority] = self._queued_by_priority.get(job.priority, 0) + 1
+
+    def move(self, old_status: str, new_status: str, priority: Optional[int] = None):
+        with self._lock:
+            self._counts[old_status] -= 1
+            self._counts[new_status] += 1
+            if old_status == 'queued' and priority in self._queued_by_priority:
+                self._queued_by_priority[priority] -= 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def queued_by_priority(self) -> Dict[int, int]:
+        with self._lock:
+            return dict(self._queued_by_priority)
+
+
 @dataclass
 class Printer:
     id: int
@@ -46,15 +97,43 @@ class Printer:
     is_busy: bool = False
     total_jobs_completed: int = 0
     total_busy_time: float = 0.0
+    status_counter: Optional[StatusCounter] = field(default=None, repr=False)
+    # Guards this printer's own state in the threaded engine
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    loaded_material: Optional[str] = None
+    changeovers: int = 0
+    total_changeover_time: float = 0.0
+    # Capabilities: prints take est_time / speed, and only the listed
+    # materials can be printed (None means any material)
+    speed: float = 1.0
+    materials: Optional[FrozenSet[str]] = None
+    printer_class: str = 'default'
+    
+    def can_print(self, material: str) -> bool:
+        return self.materials is None or material in self.materials
+    
+    def print_time(self, job: Job) -> float:
+        return job.est_time / self.speed
+    
+    def load_material(self, material: str, changeover_time: float = 0.0):
+        """Load ``material``, spending ``changeover_time`` seconds on the switch."""
+        if self.loaded_material is not None and material != self.loaded_material:
+            self.changeovers += 1
+        self.total_changeover_time += changeover_time
+        self.loaded_material = material
     
-    def start_job(self, job: Job):
+    def start_job(self, job: Job, now: Optional[float] = None):
         self.current_job = job
         self.is_busy = True
-        job.start_printing()
+        job.start_printing(now)
+        if self.status_counter:
+            self.status_counter.move('queued', 'started', job.priority)
     
-    def complete_job(self):
+    def complete_job(self, now: Optional[float] = None):
         if self.current_job:
-            self.current_job.complete_printing()
+            self.current_job.complete_printing(now)
+            if self.status_counter:
+                self.status_counter.move('started', 'completed')
             
             self.total_jobs_completed += 1
             if self.current_job.get_run_time():
@@ -1,75 +1,726 @@
+import heapq
+import random
 import threading
+import time
+from typing import Dict, Optional, Tuple
 from models import Job
+from events import event_log, DEBUG, INFO, WARNING
+
+
+_NO_DEADLINE = float('inf')
+
+class SchedulingPolicy:
+    """Decides the order in which a JobQueue hands out jobs.
+
+    The queue keeps one binary heap of ``[*key(job), order_counter, job]``
+    entries, so a policy only defines the key computed when a job is
+    enqueued; ties always go FIFO. Keys are never recomputed for queued
+    jobs, which keeps enqueue and dequeue O(log n) under every policy.
+    """
+
+    name = None
+
+    def key(self, job) -> Tuple:
+        raise NotImplementedError
+
+    def dequeued(self, entry) -> None:
+        """Called with each live entry as it is removed from the heap."""
+
+    def reset(self) -> None:
+        """Called before the heap is rebuilt, i.e. before every key is computed again."""
+
+
+class PriorityPolicy(SchedulingPolicy):
+    """Lowest priority number first (the default)."""
+
+    name = 'priority'
+
+    def key(self, job):
+        return (job.priority,)
+
+
+class ShortestJobFirstPolicy(SchedulingPolicy):
+    """Shortest est_time first, which minimizes the mean wait."""
+
+    name = 'sjf'
+
+    def key(self, job):
+        return (job.est_time,)
+
+
+class EarliestDeadlineFirstPolicy(SchedulingPolicy):
+    """Earliest ``Job.deadline`` first; jobs without a deadline go last, by priority."""
+
+    name = 'edf'
+
+    def key(self, job):
+        deadline = job.deadline
+        return (_NO_DEADLINE if deadline is None else deadline, job.priority)
+
+
+class AgingPolicy(SchedulingPolicy):
+    """Priority order where a waiting job gains one level every ``aging_interval`` seconds.
+
+    At any instant, ordering by ``priority - waited / aging_interval`` is the
+    same as ordering by ``priority * aging_interval + created_at``. That key
+    never changes while the job waits, so no re-sorting is needed.
+    """
+
+    name = 'aging'
+
+    def __init__(self, aging_interval: float = 60.0):
+        self.aging_interval = aging_interval
+
+    def key(self, job):
+        return (job.priority * self.aging_interval + job.created_at,)
+
+
+class WeightedFairPolicy(SchedulingPolicy):
+    """Weighted fair queuing across priority levels.
+
+    Each priority level gets a share of the printing time proportional to
+    its weight (by default 4:2:1 for priorities 1, 2 and 3), so low
+    priorities are slowed down but never starved. A job is tagged with a
+    virtual finish time, ``max(virtual_time, last finish of its level) +
+    est_time / weight``, and the smallest tag goes first. The virtual time
+    follows the tag of the last dequeued job (self-clocked fair queuing).
+    """
+
+    name = 'wfq'
+
+    def __init__(self, weights: Optional[Dict[int, float]] = None):
+        self.weights = dict(weights or {1: 4.0, 2: 2.0, 3: 1.0})
+        self._virtual_time = 0.0
+        self._last_finish: Dict[int, float] = {}
+
+    def key(self, job):
+        start = max(self._virtual_time, self._last_finish.get(job.priority, 0.0))
+        finish = start + job.est_time / self.weights.get(job.priority, 1.0)
+        self._last_finish[job.priority] = finish
+        return (finish,)
+
+    def dequeued(self, entry):
+        if entry[0] > self._virtual_time:
+            self._virtual_time = entry[0]
+
+    def reset(self):
+        self._last_finish = {}
+
+
+POLICIES = {
+    policy.name: policy
+    for policy in (PriorityPolicy, ShortestJobFirstPolicy, EarliestDeadlineFirstPolicy,
+                   AgingPolicy, WeightedFairPolicy)
+}
+
+
+class _SharedPolicy(SchedulingPolicy):
+    """A policy shared by several queues, with its state guarded by one lock.
+
+    WorkStealingQueue computes keys under its own lock while each local
+    queue reports dequeues under the local lock, so a stateful policy such
+    as ``wfq`` would otherwise be updated from several threads at once.
+    """
+
+    def __init__(self, policy: SchedulingPolicy):
+        self.policy = policy
+        self.name = policy.name
+        self._lock = threading.Lock()
+
+    def key(self, job):
+        with self._lock:
+            return self.policy.key(job)
+
+    def dequeued(self, entry):
+        with self._lock:
+            self.policy.dequeued(entry)
+
+    def reset(self):
+        with self._lock:
+            self.policy.reset()
+
+
+def make_policy(policy=None) -> SchedulingPolicy:
+    """Return a SchedulingPolicy from a policy name, an instance or None (priority)."""
+    if policy is None:
+        return PriorityPolicy()
+    if isinstance(policy, SchedulingPolicy):
+        return policy
+    if policy not in POLICIES:
+        raise ValueError(f"Unsupported policy: {policy} (expected one of {', '.join(POLICIES)})")
+    return POLICIES[policy]()
+
 
 class JobQueue:
+    """Thread-safe priority queue of jobs.
+
+    Jobs are kept in a binary heap ordered by the scheduling policy, by
+    default on ``(priority, order_counter)``, so lower priority numbers come
+    first and jobs with the same priority keep their FIFO order. Enqueue and
+    dequeue are O(log n).
+
+    Every heap entry is also indexed by job id. Cancelling a job only
+    tombstones its entry (O(1)); tombstones are skipped when they reach the
+    top of the heap and purged in bulk once they outnumber the live entries.
+
+    Consumers can block in ``get(timeout=...)`` and are woken by a condition
+    variable as soon as a job is added, or when the queue is closed.
+    """
 
-    def __init__(self):
-        self.jobs = []
+    # Heap entries are [*policy key, order_counter, job]; a cancelled entry
+    # has its job slot replaced by _REMOVED
+    _REMOVED = None
+
+    def __init__(self, policy=None):
+        self.policy = make_policy(policy)
+        self._heap = []
+        self._entries = {}
         self._lock = threading.Lock()
-        self._auto_sort = True
+        self._not_empty = threading.Condition(self._lock)
+        self._closed = False
         self.counter = 0
-    
+
+    @property
+    def jobs(self):
+        """Snapshot of the queued jobs in dispatch order."""
+        with self._lock:
+            return [entry[-1] for entry in sorted(self._live_entries_unsafe())]
+
     def add_job(self, job):
         with self._lock:
             self.counter += 1
             job.order_counter = self.counter
-            self.jobs.append(job)
-            if self._auto_sort:
-                self._sort_by_priority_unsafe()
-            print(f"Job '{job.id}' added.")
+            entry = [*self.policy.key(job), job.order_counter, job]
+            self._entries[job.id] = entry
+            self._push_unsafe(entry)
+            self._wake_unsafe(1)
+            event_log.emit(DEBUG, "job_enqueued", job=job.id, priority=job.priority)
+
+    def add_jobs(self, jobs):
+        """Enqueue many jobs under a single lock acquisition.
+
+        Small batches are pushed one by one; a batch at least as large as the
+        queue is appended and heapified once, which is O(n) overall.
+        """
+        jobs = list(jobs)
+        with self._lock:
+            entries = []
+            key = self.policy.key
+            for job in jobs:
+                self.counter += 1
+                job.order_counter = self.counter
+                entry = [*key(job), job.order_counter, job]
+                self._entries[job.id] = entry
+                entries.append(entry)
+
+            self._push_many_unsafe(entries)
+            self._wake_unsafe(len(entries))
+            event_log.emit(DEBUG, "jobs_enqueued", count=len(entries))
+        return len(entries)
     
-    def get_next_job(self):
+    def get_next_job(self, material=None, capable=None):
+        """Remove and return the next job, or None if the queue is empty.
+
+        ``material`` is the material loaded on the asking printer and
+        ``capable`` the set of materials it can print (None for any).
+        Queues indexed by material use them; plain queues ignore them.
+        """
         with self._lock:
-            if self.jobs:
-                self._sort_by_priority_unsafe()
-                job = self.jobs.pop(0)
-                print(f"Job {job.id} removed from queue.")
-                return job
-            else:
-                print(f"No more jobs in the queue.")
+            job = self._pop_unsafe(material, capable)
+            if job is None:
                 return None
+            event_log.emit(DEBUG, "job_dequeued", job=job.id)
+            return job
+
+    def get(self, timeout=None, material=None, capable=None):
+        """Remove and return the next job, blocking until one is available.
+
+        Returns None if ``timeout`` seconds pass without a job, or once the
+        queue has been closed. ``material`` and ``capable`` are as in
+        get_next_job().
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._not_empty:
+            while not self._closed:
+                job = self._pop_unsafe(material, capable)
+                if job is not None:
+                    event_log.emit(DEBUG, "job_dequeued", job=job.id)
+                    return job
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._not_empty.wait(remaining)
+            return None
+
+    def close(self):
+        """Wake every consumer blocked in get() and make further gets return None."""
+        with self._not_empty:
+            self._closed = True
+            self._not_empty.notify_all()
+
+    def reopen(self):
+        with self._lock:
+            self._closed = False
+
+    def instrument(self, instrumentation, name='queue'):
+        """Record lock waits in ``instrumentation``; call before the queue is shared."""
+        self._lock = instrumentation.lock(name)
+        self._not_empty = threading.Condition(self._lock)
+
+    def _wake_unsafe(self, count):
+        self._not_empty.notify(count)
+
+    def _push_unsafe(self, entry):
+        heapq.heappush(self._heap, entry)
+
+    def _push_many_unsafe(self, entries):
+        if len(entries) >= len(self._heap):
+            self._heap.extend(entries)
+            heapq.heapify(self._heap)
+        else:
+            for entry in entries:
+                heapq.heappush(self._heap, entry)
+
+    def _pop_unsafe(self, material=None, capable=None):
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            job = entry[-1]
+            if job is self._REMOVED:
+                continue
+            if self._entries.get(job.id) is entry:
+                del self._entries[job.id]
+            self.policy.dequeued(entry)
+            return job
+        return None
     
     def sort_by_priority(self):
         with self._lock:
             self._sort_by_priority_unsafe()
 
     def _sort_by_priority_unsafe(self):
-        self.jobs.sort(key=lambda job: (job.priority, job.order_counter))
+        # Rebuild the heap without tombstones, also picking up any queued
+        # job whose priority was changed in place. Keys are recomputed in
+        # the current dispatch order.
+        self.policy.reset()
+        key = self.policy.key
+        entries = [[*key(job), job.order_counter, job] for job in
+                   (entry[-1] for entry in sorted(self._live_entries_unsafe()))]
+        self._rebuild_unsafe(entries)
+        self._entries = {entry[-1].id: entry for entry in entries}
+
+    def _purge_unsafe(self):
+        # Drop the tombstones, keeping every live entry and its key, so
+        # policy state is left alone
+        entries = self._live_entries_unsafe()
+        self._rebuild_unsafe(entries)
+        self._entries = {entry[-1].id: entry for entry in entries}
+
+    def _rebuild_unsafe(self, entries):
+        self._heap = entries
+        heapq.heapify(self._heap)
+
+    def _all_entries_unsafe(self):
+        """Every stored entry, including tombstones."""
+        return self._heap
+
+    def _stored_count_unsafe(self):
+        return len(self._heap)
+
+    def _live_entries_unsafe(self):
+        return [entry for entry in self._all_entries_unsafe() if entry[-1] is not self._REMOVED]
     
 
     def list_jobs(self):
-        with self._lock:
-            if not self.jobs:
-                print("Empty queue")
-                return
-            
-            print("Current jobs in queue:")
-            for i, job in enumerate(self.jobs, 1):
-                print(f"  {i}. {job.id} - Priority {job.priority} - {job.material}")
+        jobs = self.jobs
+        if not jobs:
+            print("Empty queue")
+            return
+
+        print("Current jobs in queue:")
+        for i, job in enumerate(jobs, 1):
+            print(f"  {i}. {job.id} - Priority {job.priority} - {job.material}")
 
     def get_queue_size(self):
         with self._lock:
-            return len(self.jobs)
+            return len(self._entries)
 
     def cancel_job(self, job_id):
         with self._lock:
-            for i, job in enumerate(self.jobs):
-                if job.id == job_id:
-                    removed_job = self.jobs.pop(i)
-                    removed_job.status = 'cancelled'
-                    print(f"Job {job_id} cancelled and removed from queue.")
-                    return True
-            print(f"Job {job_id} not found in queue.")
-            return False
+            entry = self._entries.pop(job_id, None)
+            if entry is None:
+                event_log.emit(WARNING, "cancel_not_queued", job=job_id)
+                return False
+
+            removed_job = entry[-1]
+            entry[-1] = self._REMOVED
+            removed_job.status = 'cancelled'
+            if self._stored_count_unsafe() > 2 * len(self._entries) + 64:
+                self._purge_unsafe()
+            event_log.emit(INFO, "job_cancelled", job=job_id)
+            return True
 
     def is_empty(self):
         with self._lock:
-            return len(self.jobs) == 0
+            return len(self._entries) == 0
+
+    def peek_next_job(self):
+        with self._lock:
+            entry = self._head_unsafe(self._heap)
+            return entry[-1] if entry else None
+
+    def _head_unsafe(self, heap):
+        """Drop tombstones from the top of ``heap`` and return its first entry."""
+        while heap and heap[0][-1] is self._REMOVED:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+
+class MaterialAwareQueue(JobQueue):
+    """A JobQueue indexed by material, for batching and printer capabilities.
+
+    Jobs are kept in one heap per material, each ordered by the scheduling
+    policy. A printer asking for a job only looks at the heaps of the
+    materials it can print (``capable``). It gets the head of its loaded
+    material's heap when that job's priority is within ``priority_window``
+    levels of the best eligible job, and the best eligible job otherwise.
+    With the default window of 0, strict priority between levels is
+    preserved, and only the order within a level changes to avoid
+    changeovers.
+
+    Finding the best job looks at the head of each eligible material heap,
+    so a dequeue is O(m + log n) for m eligible materials. With
+    ``wake_all=True`` every blocked consumer is woken on each add, because a
+    job may only suit some of the printers waiting.
+    """
+
+    def __init__(self, policy=None, priority_window: int = 0, wake_all: bool = False):
+        super().__init__(policy)
+        self.priority_window = priority_window
+        self.wake_all = wake_all
+        self._heaps: Dict[str, list] = {}
+
+    def _wake_unsafe(self, count):
+        if self.wake_all:
+            self._not_empty.notify_all()
+        else:
+            self._not_empty.notify(count)
+
+    def _push_unsafe(self, entry):
+        heapq.heappush(self._heaps.setdefault(entry[-1].material, []), entry)
+
+    def _push_many_unsafe(self, entries):
+        by_material: Dict[str, list] = {}
+        for entry in entries:
+            by_material.setdefault(entry[-1].material, []).append(entry)
+        for material, group in by_material.items():
+            heap = self._heaps.setdefault(material, [])
+            if len(group) >= len(heap):
+                heap.extend(group)
+                heapq.heapify(heap)
+            else:
+                for entry in group:
+                    heapq.heappush(heap, entry)
+
+    def _best_heap_unsafe(self, material=None, capable=None):
+        best_heap, best = None, None
+        materials = list(self._heaps) if capable is None else capable
+        for heap_material in materials:
+            heap = self._heaps.get(heap_material)
+            if heap is None:
+                continue
+            head = self._head_unsafe(heap)
+            if head is None:
+                del self._heaps[heap_material]
+            elif best is None or head < best:
+                best_heap, best = heap, head
+
+        if best is not None and material is not None:
+            heap = self._heaps.get(material)
+            if heap and heap is not best_heap and heap[0][-1].priority <= best[-1].priority + self.priority_window:
+                return heap
+        return best_heap
+
+    def _pop_unsafe(self, material=None, capable=None):
+        heap = self._best_heap_unsafe(material, capable)
+        if heap is None:
+            return None
+        entry = heapq.heappop(heap)
+        job = entry[-1]
+        if self._entries.get(job.id) is entry:
+            del self._entries[job.id]
+        self.policy.dequeued(entry)
+        return job
+
+    def _rebuild_unsafe(self, entries):
+        self._heaps = {}
+        self._push_many_unsafe(entries)
+
+    def _all_entries_unsafe(self):
+        return [entry for heap in self._heaps.values() for entry in heap]
+
+    def _stored_count_unsafe(self):
+        return sum(len(heap) for heap in self._heaps.values())
 
     def peek_next_job(self):
         with self._lock:
-            if self.jobs:
-                return self.jobs[0]
+            heap = self._best_heap_unsafe()
+            return heap[0][-1] if heap else None
+
+
+ASSIGNMENTS = ('least_loaded', 'material')
+
+
+class WorkStealingQueue:
+    """Per-printer local queues with work stealing.
+
+    Every printer has its own local queue (a JobQueue, or a
+    MaterialAwareQueue when batching by material or when some printers
+    cannot print every material) with its own lock, so printers taking
+    jobs never contend on one lock. A new job goes to an idle printer that
+    can print it if there is one. Otherwise ``assignment`` picks the
+    printer:
+
+    - ``least_loaded``: the printer with fewer queued jobs out of two
+      chosen at random (the power of two choices).
+    - ``material``: the printer that last received a job of the same
+      material, unless a printer chosen as above holds at least two fewer
+      queued jobs.
+
+    A printer takes the best job of its own queue. When that is empty, it
+    steals the best job of the peer with the most queued jobs.
+
+    Ordering: keys and FIFO counters are global, and each local queue
+    hands out jobs in exact policy order. Across printers the order is
+    approximate. When a printer starts a job, any better queued job sits
+    in the local queue of a busy printer; an idle one would have started
+    or stolen it. So a job is only ever overtaken while it waits behind
+    the job its printer is running and the better jobs in its own local
+    queue. With least-loaded assignment those queues stay within a few
+    jobs of each other.
+    """
+
+    def __init__(self, printers, policy=None, assignment: str = 'least_loaded',
+                 material_aware: bool = False, priority_window: int = 0, seed: int = 0):
+        if assignment not in ASSIGNMENTS:
+            raise ValueError(f"Unsupported assignment: {assignment} (expected one of {', '.join(ASSIGNMENTS)})")
+        self.policy = make_policy(policy)
+        # Every key and dequeue goes through one lock, whichever queue's lock is held
+        self._shared_policy = _SharedPolicy(self.policy)
+        self.assignment = assignment
+        self._printers = {printer.id: printer for printer in printers}
+        local_aware = material_aware or any(printer.materials is not None for printer in printers)
+        if local_aware:
+            self._locals = {printer_id: MaterialAwareQueue(self._shared_policy, priority_window)
+                            for printer_id in self._printers}
+        else:
+            self._locals = {printer_id: JobQueue(self._shared_policy) for printer_id in self._printers}
+        self._queues = list(self._locals.values())
+        # Local queues that may hold jobs. A queue is added after each push
+        # and only dropped by a thief that finds it empty under its lock, so
+        # thieves never need to look at the rest.
+        self._stealable = set()
+        # Local queue holding each queued job, for cancellation
+        self._owner: Dict[str, JobQueue] = {}
+        # Guards the counter, the key computation, assignment and the idle set
+        self._lock = threading.Lock()
+        self._idle = set()
+        self._affinity: Dict[str, int] = {}
+        self._capable: Dict[str, list] = {}
+        self._random = random.Random(seed)
+        self._closed = False
+        self.counter = 0
+
+    @property
+    def jobs(self):
+        """Snapshot of the queued jobs in global dispatch order."""
+        entries = []
+        for local in self._queues:
+            with local._lock:
+                entries.extend(local._live_entries_unsafe())
+        return [entry[-1] for entry in sorted(entries)]
+
+    def add_job(self, job):
+        self.add_jobs([job])
+
+    def add_jobs(self, jobs):
+        """Assign and enqueue jobs, taking each local queue's lock once per batch."""
+        by_printer: Dict[int, list] = {}
+        with self._lock:
+            key = self._shared_policy.key
+            for job in jobs:
+                self.counter += 1
+                job.order_counter = self.counter
+                printer_id = self._assign_unsafe(job.material)
+                local = self._locals[printer_id]
+                self._owner[job.id] = local
+                by_printer.setdefault(printer_id, []).append([*key(job), job.order_counter, job])
+
+        count = 0
+        for printer_id, entries in by_printer.items():
+            local = self._locals[printer_id]
+            with local._lock:
+                for entry in entries:
+                    local._entries[entry[-1].id] = entry
+                local._push_many_unsafe(entries)
+                local._wake_unsafe(len(entries))
+                self._stealable.add(local)
+            count += len(entries)
+        event_log.emit(DEBUG, "jobs_enqueued", count=count)
+        return count
+
+    def _assign_unsafe(self, material):
+        candidates = self._capable.get(material)
+        if candidates is None:
+            candidates = self._capable[material] = [
+                printer_id for printer_id, printer in self._printers.items() if printer.can_print(material)
+            ]
+        if not candidates:
+            raise ValueError(f"No printer can print {material}")
+
+        for printer_id in self._idle:
+            if self._printers[printer_id].can_print(material):
+                self._idle.discard(printer_id)
+                return printer_id
+
+        first, second = self._random.choice(candidates), self._random.choice(candidates)
+        if len(self._locals[second]._entries) < len(self._locals[first]._entries):
+            first = second
+        if self.assignment == 'material':
+            home = self._affinity.get(material)
+            if home is not None and len(self._locals[home]._entries) < len(self._locals[first]._entries) + 2:
+                first = home
+            self._affinity[material] = first
+        return first
+
+    def get_next_job(self, material=None, capable=None, printer=None):
+        """Take a job for ``printer`` from its local queue, or steal one; None if there is none."""
+        job = self._take(printer, material, capable)
+        if job is not None:
+            self._owner.pop(job.id, None)
+        return job
+
+    def get(self, timeout=None, material=None, capable=None, printer=None):
+        """Take a job for ``printer``, blocking until one is available.
+
+        Returns None if ``timeout`` seconds pass without a job, or once the
+        queue has been closed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        local = self._locals[printer]
+        while not self._closed:
+            job = local.get_next_job(material, capable)
+            if job is not None:
+                self._owner.pop(job.id, None)
+                return job
+
+            # Announced as idle before looking at the peers, so a job added
+            # after the look is assigned to this printer and wakes it
+            with self._lock:
+                self._idle.add(printer)
+            job = self._steal(printer, capable)
+            if job is None:
+                with local._not_empty:
+                    if not self._closed and not local._entries:
+                        remaining = None if deadline is None else deadline - time.monotonic()
+                        if remaining is None or remaining > 0:
+                            local._not_empty.wait(remaining)
+                    if local._entries:
+                        # Assigned while idle; the adder took it off the idle set
+                        continue
+            with self._lock:
+                self._idle.discard(printer)
+            if job is not None:
+                self._owner.pop(job.id, None)
+                return job
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+        return None
+
+    def _take(self, printer, material, capable):
+        own = self._locals.get(printer)
+        if own is not None:
+            job = own.get_next_job(material, capable)
+            if job is not None:
+                return job
+        return self._steal(printer, capable)
+
+    def _steal(self, printer, capable):
+        own = self._locals.get(printer)
+        # Busiest peer first; sizes are read without locks and only pick
+        # the order in which peers are tried
+        victims = [local for local in list(self._stealable) if local is not own]
+        victims.sort(key=lambda local: len(local._entries), reverse=True)
+        for victim in victims:
+            with victim._lock:
+                job = victim._pop_unsafe(None, capable)
+                if not victim._entries:
+                    self._stealable.discard(victim)
+            if job is not None:
+                event_log.emit(DEBUG, "job_stolen", job=job.id, printer=printer)
+                return job
+        return None
+
+    def close(self):
+        """Wake every consumer blocked in get() and make further gets return None."""
+        self._closed = True
+        for local in self._queues:
+            local.close()
+
+    def reopen(self):
+        self._closed = False
+        for local in self._queues:
+            local.reopen()
+
+    def instrument(self, instrumentation, name='queue'):
+        """Record lock waits in ``instrumentation``; call before the queue is shared."""
+        self._lock = instrumentation.lock('assignment')
+        for local in self._queues:
+            local.instrument(instrumentation, name)
+
+    def sort_by_priority(self):
+        """Recompute every key in the current global dispatch order."""
+        for local in self._queues:
+            local._lock.acquire()
+        try:
+            with self._lock:
+                owned = [(entry, local) for local in self._queues for entry in local._live_entries_unsafe()]
+                owned.sort(key=lambda pair: pair[0])
+                self._shared_policy.reset()
+                key = self._shared_policy.key
+                rebuilt = {id(local): [] for local in self._queues}
+                for entry, local in owned:
+                    job = entry[-1]
+                    rebuilt[id(local)].append([*key(job), job.order_counter, job])
+                for local in self._queues:
+                    entries = rebuilt[id(local)]
+                    local._rebuild_unsafe(entries)
+                    local._entries = {entry[-1].id: entry for entry in entries}
+        finally:
+            for local in self._queues:
+                local._lock.release()
+
+    def list_jobs(self):
+        JobQueue.list_jobs(self)
+
+    def get_queue_size(self):
+        return sum(local.get_queue_size() for local in self._queues)
+
+    def cancel_job(self, job_id):
+        local = self._owner.pop(job_id, None)
+        if local is None:
+            event_log.emit(WARNING, "cancel_not_queued", job=job_id)
+            return False
+        return local.cancel_job(job_id)
+
+    def is_empty(self):
+        return all(local.is_empty() for local in self._queues)
+
+    def peek_next_job(self):
+        entries = []
+        for local in self._queues:
+            with local._lock:
+                entries.extend(local._live_entries_unsafe())
+        return min(entries)[-1] if entries else None
 
 if __name__ == "__main__":
     queue = JobQueue()
@@ -1,92 +1,502 @@
 import threading
 import time
 import json
+import contextlib
 import csv
-from typing import List, Dict, Optional
-from models import Job, Printer
-from queue_manager import JobQueue
+import heapq
+import itertools
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
+from models import Job, Printer, StatusCounter
+from queue_manager import JobQueue, MaterialAwareQueue, WorkStealingQueue
+from changeover import ChangeoverMatrix
+from job_table import JobTable
+import vector_report
+from metrics import MetricsAccumulator
+from instrumentation import Instrumentation, TimedQueue
+from events import event_log, DEBUG, INFO, WARNING
+from job_loader import batched
+import checkpoint as checkpoint_file
+
+
+MODES = ('threaded', 'discrete')
+DISPATCHES = ('shared', 'stealing')
+STORAGES = ('objects', 'table')
+REPORT_FIELDS = ('id', 'material', 'est_time', 'priority', 'status', 'created_at', 'started_at',
+                 'completed_at', 'wait_time', 'run_time', 'wait_time_real', 'run_time_real')
+WRITE_BUFFER_SIZE = 1 << 20
 
 
 class PrinterSimulator:
-    def __init__(self, num_printers: int = 2, time_scale: float = 0.01):
+    """Simulates N printers draining a shared priority queue.
+
+    ``mode='threaded'`` runs one worker thread per printer and sleeps for the
+    scaled print time. ``mode='discrete'`` runs an event-driven engine on a
+    virtual clock instead: no threads and no sleeping, so runs finish as fast
+    as the events can be processed and always produce the same schedule.
+
+    ``storage='table'`` keeps jobs in a columnar JobTable instead of one
+    Job object per job. Added jobs are copied into the table, and
+    ``all_jobs``, the queue and the completion lists hold JobView rows.
+
+    ``policy`` picks the dispatch order: a name from queue_manager.POLICIES
+    (``priority``, ``sjf``, ``edf``, ``aging``, ``wfq``) or a
+    SchedulingPolicy instance. The default is strict priority.
+
+    Each printer tracks the material it has loaded. ``changeover`` (a
+    ChangeoverMatrix) charges time for switching materials before a job
+    starts. ``material_aware=True`` dispatches through a MaterialAwareQueue,
+    which gives each printer jobs of its loaded material when they are within
+    ``priority_window`` priority levels of the best queued job.
+
+    ``fleet`` replaces the ``num_printers`` identical printers with a list
+    of Printer objects (see fleet.load_fleet) that have their own speed,
+    supported materials and class. When some printers cannot print every
+    material, jobs are matched to eligible printers through the per-material
+    heaps of a MaterialAwareQueue. Jobs that no printer can print are
+    rejected.
+
+    ``dispatch='stealing'`` gives every printer its own local queue instead
+    of one shared queue (see queue_manager.WorkStealingQueue). Jobs are
+    assigned to printers as they are added (``assignment='least_loaded'`` or
+    ``'material'``), and idle printers steal from the busiest peer. Priority
+    order then only holds approximately, but printers no longer contend on
+    a single lock.
+
+    ``profile=True`` records timing histograms of lock waits, queue
+    operations, per-printer idle waits and report building (see
+    instrumentation.py), reported under ``instrumentation`` in the report.
+    With profiling off, none of the timing code runs.
+
+    ``checkpoint()`` saves the run's state to a file and ``restore()``
+    loads it into a new simulator, which then picks up where the first one
+    stopped. With ``checkpoint_path`` set, a checkpoint is also written every
+    ``checkpoint_interval`` wall-clock seconds while the simulation runs and
+    once more when it stops.
+    """
+
+    modes = MODES
+
+    def __init__(self, num_printers: int = 2, time_scale: float = 0.01, mode: str = 'threaded',
+                 storage: str = 'objects', policy=None, changeover: Optional[ChangeoverMatrix] = None,
+                 material_aware: bool = False, priority_window: int = 0, fleet: Optional[List[Printer]] = None,
+                 dispatch: str = 'shared', assignment: str = 'least_loaded', profile: bool = False,
+                 checkpoint_path: Optional[str] = None, checkpoint_interval: float = 60.0):
+        if mode not in self.modes:
+            raise ValueError(f"Unsupported mode: {mode} (expected one of {', '.join(self.modes)})")
+        if dispatch not in DISPATCHES:
+            raise ValueError(f"Unsupported dispatch: {dispatch} (expected one of {', '.join(DISPATCHES)})")
+        if storage not in STORAGES:
+            raise ValueError(f"Unsupported storage: {storage} (expected one of {', '.join(STORAGES)})")
+
+        if fleet is not None:
+            num_printers = len(fleet)
         self.num_printers = num_printers
         self.time_scale = time_scale
+        self.mode = mode
+        self.storage = storage
+        
+        self.status_counter = StatusCounter()
+        if fleet is not None:
+            self.printers = list(fleet)
+            for printer in self.printers:
+                printer.status_counter = self.status_counter
+        else:
+            self.printers = [Printer(id=i, status_counter=self.status_counter) for i in range(num_printers)]
+        
+        # Materials at least one printer can print; None when some printer takes any
+        restricted = any(printer.materials is not None for printer in self.printers)
+        self.printable_materials = None
+        if not any(printer.materials is None for printer in self.printers):
+            self.printable_materials = frozenset().union(*(printer.materials for printer in self.printers))
         
-        self.job_queue = JobQueue()
-        self.printers = [Printer(id=i) for i in range(num_printers)]
+        self.changeover = changeover
+        self.material_aware = material_aware
+        self.dispatch = dispatch
+        if dispatch == 'stealing':
+            self.job_queue = WorkStealingQueue(self.printers, policy, assignment, material_aware, priority_window)
+        elif material_aware or restricted:
+            self.job_queue = MaterialAwareQueue(policy, priority_window, wake_all=restricted)
+        else:
+            self.job_queue = JobQueue(policy)
+        self.policy = self.job_queue.policy
         
+        # Lock scheme: JobQueue._lock (with work stealing, the lock of one
+        # local queue) is the only lock taken to add, take or cancel a job,
+        # each printer's own lock guards its state, and
+        # completions go to per-printer shards. self.lock only guards
+        # registering jobs in all_jobs and is never held while calling into
+        # the queue; _done_lock guards the count behind all_done_event.
         self.lock = threading.Lock()
+        self._done_lock = threading.Lock()
+        self._outstanding = 0
         self.stop_event = threading.Event()
+        # Set whenever every added job has completed or been cancelled
+        self.all_done_event = threading.Event()
+        self.all_done_event.set()
         self.worker_threads: List[threading.Thread] = []
         
-        self.all_jobs: Dict[str, Job] = {}
-        self.completed_jobs: List[Job] = []
+        self.all_jobs: Dict[str, Job] = JobTable() if storage == 'table' else {}
+        self._completed_by_printer: Dict[int, List[Job]] = {printer.id: [] for printer in self.printers}
         self.cancelled_jobs: List[Job] = []
+        # Streams of (arrival, job) pairs not yet being fed in
+        self._arrival_streams: List[Iterator] = []
+        self.metrics = MetricsAccumulator()
         
         self.simulation_start_time: Optional[float] = None
         self.simulation_end_time: Optional[float] = None
         
-        print(f"PrinterSimulator created with {num_printers} printers, time_scale={time_scale}")
+        # Virtual clock, only advanced in discrete mode
+        self.clock: Optional[float] = None
+        
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        # Remaining est_time of each printer's in-flight job, set by
+        # restore() and by a discrete timeout, the start time the next run
+        # continues from, set by both, and the virtual time a discrete run
+        # continues from after a timeout
+        self._in_flight: Dict[int, float] = {}
+        self._resumed_start: Optional[float] = None
+        self._resumed_clock: Optional[float] = None
+        
+        self.instrumentation: Optional[Instrumentation] = None
+        if profile:
+            self._instrument(Instrumentation())
+        
+        print(f"PrinterSimulator created with {num_printers} printers, time_scale={time_scale}, mode={mode}")
+    
+    def _instrument(self, instrumentation: Instrumentation) -> None:
+        # Swaps in timing locks and a timed queue; done before any thread starts
+        self.instrumentation = instrumentation
+        self.lock = instrumentation.lock('simulator')
+        self._done_lock = instrumentation.lock('done')
+        for printer in self.printers:
+            printer.lock = instrumentation.lock('printer')
+        self.job_queue.instrument(instrumentation)
+        self.job_queue = TimedQueue(self.job_queue, instrumentation)
+    
+    def _timer(self, group: str, name: str):
+        if self.instrumentation is None:
+            return contextlib.nullcontext()
+        return self.instrumentation.timer(group, name)
+    
+    def _check_printable(self, job: Job) -> None:
+        if self.printable_materials is not None and job.material not in self.printable_materials:
+            raise ValueError(f"No printer can print {job.material} (job {job.id})")
     
     def add_job(self, job: Job) -> None:
+        self._check_printable(job)
         with self.lock:
-            self.all_jobs[job.id] = job
-            self.job_queue.add_job(job)
+            if self.storage == 'table':
+                job = self.all_jobs.add(job)
+            else:
+                self.all_jobs[job.id] = job
+        self._track_added(1)
+        # Counted before it is enqueued, so a worker can never move it out
+        # of 'queued' first
+        self.status_counter.add_queued([job])
+        self.job_queue.add_job(job)
+    
+    def add_jobs(self, jobs: Iterable[Job], batch_size: int = 10000) -> int:
+        """Add many jobs, taking the locks once per batch of ``batch_size``.
+
+        ``jobs`` may be any iterable, including a lazy file reader; only one
+        batch is held at a time. Returns the number of jobs added.
+        """
+        added = 0
+        for batch in batched(jobs, batch_size):
+            for job in batch:
+                self._check_printable(job)
+            with self.lock:
+                if self.storage == 'table':
+                    batch = [self.all_jobs.add(job) for job in batch]
+                else:
+                    for job in batch:
+                        self.all_jobs[job.id] = job
+            self._track_added(len(batch))
+            self.status_counter.add_queued(batch)
+            self.job_queue.add_jobs(batch)
+            added += len(batch)
+        return added
+    
+    def add_arrivals(self, arrivals: Iterable[Tuple[float, Job]]) -> None:
+        """Add jobs at their arrival times while the simulation runs.
+
+        ``arrivals`` yields ``(arrival, job)`` pairs in arrival order, for
+        example from workload.WorkloadGenerator.generate(). ``arrival`` is
+        the offset from the start of the run in est_time units and is scaled
+        by ``time_scale``. Pairs are pulled one at a time as the run reaches
+        them, and each job's ``created_at`` is set to its arrival. The run is
+        not complete until the stream is exhausted.
+        """
+        # The stream itself counts as outstanding work until it ends
+        self._track_added(1)
+        self._arrival_streams.append(iter(arrivals))
+        if self.worker_threads:
+            self._start_feeders()
+    
+    def _add_arrival(self, job: Job, now: float) -> bool:
+        job.created_at = now
+        try:
+            self.add_job(job)
+        except ValueError as e:
+            event_log.emit(WARNING, "arrival_rejected", job=job.id, error=str(e))
+            return False
+        return True
+    
+    def _start_feeders(self) -> None:
+        while self._arrival_streams:
+            thread = threading.Thread(target=self._feed_arrivals, args=(self._arrival_streams.pop(),),
+                                      name="Arrivals", daemon=True)
+            thread.start()
+            self.worker_threads.append(thread)
+    
+    def _feed_arrivals(self, stream: Iterator) -> None:
+        start = self.simulation_start_time
+        for arrival, job in stream:
+            delay = start + arrival * self.time_scale - time.time()
+            if delay > 0:
+                self.stop_event.wait(delay)
+            if self.stop_event.is_set():
+                # Picked up again by the next start_simulation()
+                self._arrival_streams.append(itertools.chain([(arrival, job)], stream))
+                return
+            self._add_arrival(job, time.time())
+        self._track_finished()
     
     def cancel_job(self, job_id: str) -> bool:
-        with self.lock:
-            if job_id not in self.all_jobs:
-                print(f"Job {job_id} not found")
-                return False
-            
-            job = self.all_jobs[job_id]
-            
-            if job.status == 'queued':
-                if self.job_queue.cancel_job(job_id):
-                    self.cancelled_jobs.append(job)
-                    return True
-            elif job.status == 'started':
-                print(f"Job {job_id} is running, cannot cancel")
-                return False
-            else:
-                print(f"Job {job_id} status is {job.status}, cannot cancel")
-                return False
+        job = self.all_jobs.get(job_id)
+        if job is None:
+            event_log.emit(WARNING, "cancel_unknown_job", job=job_id)
+            return False
+        
+        # The queue removes the job atomically under its own lock, so this
+        # cannot race with a worker taking the same job
+        if job.status == 'queued' and self.job_queue.cancel_job(job_id):
+            self.status_counter.move('queued', 'cancelled', job.priority)
+            with self._done_lock:
+                self.cancelled_jobs.append(job)
+            self._track_finished()
+            return True
+        
+        event_log.emit(WARNING, "cancel_rejected", job=job_id, status=job.status)
+        return False
+    
+    @property
+    def completed_jobs(self) -> List[Job]:
+        """Completed jobs in completion order, merged from the per-printer shards."""
+        return list(heapq.merge(*self._completed_by_printer.values(), key=lambda job: job.completed_at))
+    
+    def _completed_count(self) -> int:
+        return sum(len(shard) for shard in self._completed_by_printer.values())
+    
+    def _record_completion(self, printer: Printer, job: Job) -> None:
+        # Only this printer's worker appends to its shard
+        self._completed_by_printer[printer.id].append(job)
+        self.metrics.record_job(job)
+        self._track_finished()
+    
+    def _next_job_args(self, printer: Printer) -> Dict:
+        # The loaded material is only a preference when batching by material
+        args = {
+            'material': printer.loaded_material if self.material_aware else None,
+            'capable': printer.materials,
+        }
+        if self.dispatch == 'stealing':
+            args['printer'] = printer.id
+        return args
+    
+    def _load_material(self, printer: Printer, job: Job) -> float:
+        """Load the job's material on the printer; returns the scaled changeover time."""
+        changeover_time = 0.0
+        if self.changeover is not None:
+            changeover_time = self.changeover.penalty(printer.loaded_material, job.material) * self.time_scale
+        printer.load_material(job.material, changeover_time)
+        return changeover_time
+    
+    def _track_added(self, count: int) -> None:
+        with self._done_lock:
+            self._outstanding += count
+            self.all_done_event.clear()
+    
+    def _track_finished(self) -> None:
+        with self._done_lock:
+            self._outstanding -= 1
+            if self._outstanding == 0:
+                self.all_done_event.set()
     
     def _printer_worker(self, printer: Printer) -> None:
-        print(f"Printer-{printer.id} worker started")
+        event_log.emit(DEBUG, "worker_started", printer=printer.id)
+        idle_wait = None
+        if self.instrumentation is not None:
+            idle_wait = self.instrumentation.histogram('idle_wait', f'Printer-{printer.id}')
+        
+        # A job restored mid-print is finished before taking new work
+        remaining = self._in_flight.pop(printer.id, None)
+        if remaining is not None:
+            time.sleep(remaining * self.time_scale)
+            self._finish_job(printer, printer.current_job)
         
         while not self.stop_event.is_set():
-            job = self.job_queue.get_next_job()
+            # Blocks until a job is added or the queue is closed on stop
+            if idle_wait is None:
+                job = self.job_queue.get(**self._next_job_args(printer))
+            else:
+                waited_from = time.perf_counter()
+                job = self.job_queue.get(**self._next_job_args(printer))
+                idle_wait.add(time.perf_counter() - waited_from)
             
             if job is None:
-                time.sleep(0.1)
                 continue
             
             if job.status == 'cancelled':
                 continue
             
-            with self.lock:
+            with printer.lock:
+                changeover_time = self._load_material(printer, job)
+            if changeover_time:
+                time.sleep(changeover_time)
+            
+            with printer.lock:
                 printer.start_job(job)
             
-            print(f"Printer-{printer.id} processing {job.id} (scaled_time={job.est_time * self.time_scale:.2f}s)")
+            print_time = printer.print_time(job) * self.time_scale
+            event_log.emit(INFO, "job_dispatched", printer=printer.id, job=job.id, scaled_time=print_time)
+            
+            time.sleep(print_time)
+            self._finish_job(printer, job)
+        
+        event_log.emit(DEBUG, "worker_stopped", printer=printer.id)
+    
+    def _finish_job(self, printer: Printer, job: Job) -> None:
+        # Recorded under the printer lock, so a checkpoint never sees the
+        # job as both in flight and completed
+        with printer.lock:
+            printer.complete_job()
+            self._record_completion(printer, job)
+        event_log.emit(INFO, "job_finished", printer=printer.id, job=job.id)
+    
+    def _run_discrete(self, timeout: Optional[float] = None) -> None:
+        """Process job-start and job-complete events on the virtual clock.
+
+        Each printer becomes free at time zero; starting a job schedules its
+        completion ``est_time * time_scale`` later, and completing a job
+        frees the printer again at that instant. A printer that finds no
+        job waits idle until an arrival (see add_arrivals) gives it one.
+        ``timeout`` is measured in simulated seconds; the next run then
+        continues on the same clock from the timeout, and jobs still
+        printing finish first.
+        """
+        self.clock = self._resumed_clock or time.time()
+        self.simulation_start_time = start = self._resumed_start or self.clock
+        self._resumed_start = self._resumed_clock = None
+        horizon = self.clock + timeout if timeout else None
+        checkpoint_due = None
+        if self.checkpoint_path:
+            checkpoint_due = time.monotonic() + self.checkpoint_interval
+        
+        # (time, seq, kind, printer or arrival); seq keeps simultaneous
+        # events in FIFO order
+        events = []
+        seq = itertools.count()
+        idle: List[Printer] = []
+        for printer in self.printers:
+            remaining = self._in_flight.pop(printer.id, None)
+            if remaining is None:
+                heapq.heappush(events, (self.clock, next(seq), 'start', printer))
+            else:
+                heapq.heappush(events, (self.clock + remaining * self.time_scale, next(seq), 'complete', printer))
+        
+        def schedule_arrival(stream):
+            # Only the next pair of each stream is pulled
+            pair = next(stream, None)
+            if pair is None:
+                self._track_finished()
+                return
+            heapq.heappush(events, (start + pair[0] * self.time_scale, next(seq), 'arrive', (stream, pair)))
+        
+        streams, self._arrival_streams = self._arrival_streams, []
+        for stream in streams:
+            schedule_arrival(stream)
+        
+        while events:
+            # Between events every job is queued, in flight or done, so the
+            # state can be saved as is
+            if checkpoint_due is not None and time.monotonic() >= checkpoint_due:
+                self.checkpoint(self.checkpoint_path)
+                checkpoint_due = time.monotonic() + self.checkpoint_interval
+            when, _, kind, printer = heapq.heappop(events)
+            if horizon is not None and when > horizon:
+                print(f"Timeout reached ({timeout}s simulated)")
+                self.clock = self._resumed_clock = horizon
+                self._resumed_start = start
+                # Arrivals not reached yet and the rest of each in-flight
+                # print are kept for the next run
+                for due, _, pending, payload in itertools.chain([(when, None, kind, printer)], events):
+                    if pending == 'arrive':
+                        stream, pair = payload
+                        self._arrival_streams.append(itertools.chain([pair], stream))
+                    elif pending == 'complete':
+                        self._in_flight[payload.id] = (due - self.clock) / self.time_scale if self.time_scale else 0.0
+                break
+            self.clock = when
+            
+            if kind == 'arrive':
+                stream, (_, job) = printer
+                if self._add_arrival(job, when):
+                    for position, waiting in enumerate(idle):
+                        if waiting.can_print(job.material):
+                            del idle[position]
+                            heapq.heappush(events, (when, next(seq), 'start', waiting))
+                            break
+                schedule_arrival(stream)
+                continue
             
-            time.sleep(job.est_time * self.time_scale)
+            if kind == 'complete':
+                job = printer.current_job
+                printer.complete_job(now=when)
+                self._record_completion(printer, job)
+                event_log.emit(INFO, "job_finished", printer=printer.id, job=job.id)
+                heapq.heappush(events, (when, next(seq), 'start', printer))
+                continue
             
-            with self.lock:
-                printer.complete_job()
-                self.completed_jobs.append(job)
+            job = self.job_queue.get_next_job(**self._next_job_args(printer))
+            while job is not None and job.status == 'cancelled':
+                job = self.job_queue.get_next_job(**self._next_job_args(printer))
+            if job is None:
+                idle.append(printer)
+                continue
             
-            print(f"Printer-{printer.id} completed {job.id}")
+            # The printer is held for the changeover, then starts printing
+            started = when + self._load_material(printer, job)
+            printer.start_job(job, now=started)
+            print_time = printer.print_time(job) * self.time_scale
+            event_log.emit(INFO, "job_dispatched", printer=printer.id, job=job.id, scaled_time=print_time)
+            heapq.heappush(events, (started + print_time, next(seq), 'complete', printer))
         
-        print(f"Printer-{printer.id} worker stopped")
+        self.simulation_end_time = self.clock
+        if self.checkpoint_path:
+            self.checkpoint(self.checkpoint_path)
     
     def start_simulation(self) -> None:
+        if self.mode == 'discrete':
+            print(f"Discrete simulation started with {self.num_printers} printers")
+            self._run_discrete()
+            print("Discrete simulation finished")
+            return
+        
         if self.worker_threads:
             print("Simulation already running")
             return
         
-        self.simulation_start_time = time.time()
+        self.simulation_start_time = self._resumed_start or time.time()
+        self._resumed_start = None
         self.stop_event.clear()
+        self.job_queue.reopen()
+        self._start_feeders()
+        if self.checkpoint_path:
+            thread = threading.Thread(target=self._checkpoint_periodically, name="Checkpoints", daemon=True)
+            thread.start()
+            self.worker_threads.append(thread)
         
         for printer in self.printers:
             thread = threading.Thread(
@@ -101,65 +511,75 @@ class PrinterSimulator:
         print(f"Simulation started with {self.num_printers} printers")
     
     def stop_simulation(self) -> None:
+        if self.mode == 'discrete':
+            return
+        
         if not self.worker_threads:
             print("No simulation running")
             return
         
         print("Stopping simulation...")
         self.stop_event.set()
+        self.job_queue.close()
         
         for thread in self.worker_threads:
             thread.join(timeout=5.0)
         
         self.worker_threads.clear()
         self.simulation_end_time = time.time()
+        if self.checkpoint_path:
+            self.checkpoint(self.checkpoint_path)
         print("Simulation stopped")
     
+    def _checkpoint_periodically(self) -> None:
+        while not self.stop_event.wait(self.checkpoint_interval):
+            self.checkpoint(self.checkpoint_path)
+    
     def run_until_complete(self, timeout: Optional[float] = None) -> None:
-        self.start_simulation()
+        if self.mode == 'discrete':
+            self._run_discrete(timeout)
+            return
         
-        start_wait = time.time()
+        self.start_simulation()
         
         try:
-            while True:
-                with self.lock:
-                    total_jobs = len(self.all_jobs)
-                    finished_jobs = len(self.completed_jobs) + len(self.cancelled_jobs)
-                    
-                    if finished_jobs >= total_jobs and self.job_queue.is_empty():
-                        break
-                
-                if timeout and (time.time() - start_wait) > timeout:
-                    print(f"Timeout reached ({timeout}s)")
-                    break
-                
-                time.sleep(0.1)
-                
+            if not self.all_done_event.wait(timeout or None):
+                print(f"Timeout reached ({timeout}s)")
         except KeyboardInterrupt:
             print("Simulation interrupted")
         finally:
             self.stop_simulation()
     
     def get_status(self) -> Dict:
-        with self.lock:
-            running_jobs = [job for job in self.all_jobs.values() if job.status == 'started']
-            queued_jobs = [job for job in self.all_jobs.values() if job.status == 'queued']
-            
-            return {
-                'total_jobs': len(self.all_jobs),
-                'queued': len(queued_jobs),
-                'running': len(running_jobs),
-                'completed': len(self.completed_jobs),
-                'cancelled': len(self.cancelled_jobs),
-                'queue_size': self.job_queue.get_queue_size(),
-                'active_printers': sum(1 for p in self.printers if p.is_busy)
-            }
+        # Served from the incrementally maintained counters, so this never
+        # walks all_jobs or waits on the simulator lock
+        counts = self.status_counter.snapshot()
+        
+        return {
+            'total_jobs': len(self.all_jobs),
+            'queued': counts['queued'],
+            'running': counts['started'],
+            'completed': counts['completed'],
+            'cancelled': counts['cancelled'],
+            'queue_size': self._queue_size(),
+            'active_printers': sum(1 for p in self.printers if p.is_busy)
+        }
+    
+    def _queue_size(self) -> int:
+        return self.job_queue.get_queue_size()
+    
+    def _use_numpy(self) -> bool:
+        # Gathering attributes from Job objects costs more than the vectorized
+        # arithmetic saves, so the NumPy path is only chosen for table storage
+        return self.storage == 'table' and vector_report.numpy_available()
     
-    def _calculate_metrics(self) -> Dict:
+    def _calculate_metrics(self, use_numpy: Optional[bool] = None) -> Dict:
+        if use_numpy is None:
+            use_numpy = self._use_numpy()
 
         metrics = {
             'total_jobs': len(self.all_jobs),
-            'completed_jobs': len(self.completed_jobs),
+            'completed_jobs': self._completed_count(),
             'cancelled_jobs': len(self.cancelled_jobs),
             'simulation_duration_seconds': 0,
             'time_scale_factor': self.time_scale
@@ -168,38 +588,40 @@ class PrinterSimulator:
         if self.simulation_start_time and self.simulation_end_time:
             metrics['simulation_duration_seconds'] = self.simulation_end_time - self.simulation_start_time
         
-        if not self.completed_jobs:
+        if not metrics['completed_jobs']:
             return metrics
         
-        wait_times = []
-        run_times = []
+        # Wait/run statistics are accumulated as jobs complete, so this is
+        # O(1) regardless of how many jobs have run
+        metrics.update(self.metrics.to_dict())
         
-        for job in self.completed_jobs:
-            wait_time = job.get_wait_time()
-            run_time = job.get_run_time()
-            
-            if wait_time is not None:
-                wait_times.append(wait_time)
-            if run_time is not None:
-                run_times.append(run_time)
+        if metrics['simulation_duration_seconds'] > 0:
+            metrics['throughput_jobs_per_second'] = metrics['completed_jobs'] / metrics['simulation_duration_seconds']
         
-
-        if wait_times:
-            metrics['avg_wait_time'] = sum(wait_times) / len(wait_times)
-            metrics['median_wait_time'] = sorted(wait_times)[len(wait_times) // 2]
-            metrics['max_wait_time'] = max(wait_times)
-            metrics['min_wait_time'] = min(wait_times)
+        # Time from the start of the run until the last job finished
+        last_completion = max(shard[-1].completed_at for shard in self._completed_by_printer.values() if shard)
+        metrics['makespan_seconds'] = last_completion - self.simulation_start_time
+        metrics['changeovers'] = sum(printer.changeovers for printer in self.printers)
+        metrics['total_changeover_time'] = sum(printer.total_changeover_time for printer in self.printers)
+        
+        total_sim_time = metrics['simulation_duration_seconds']
+        if use_numpy:
+            printer_utilization = vector_report.printer_utilization(self.printers, total_sim_time)
+        else:
+            printer_utilization = self._printer_utilization(total_sim_time)
         
- 
-        if run_times:
-            metrics['avg_run_time'] = sum(run_times) / len(run_times)
-            metrics['total_processing_time'] = sum(run_times)
+        metrics['printer_utilization'] = printer_utilization
         
-        if metrics['simulation_duration_seconds'] > 0:
-            metrics['throughput_jobs_per_second'] = len(self.completed_jobs) / metrics['simulation_duration_seconds']
+        if printer_utilization:
+            avg_utilization = sum(p['utilization_percentage'] for p in printer_utilization.values()) / len(printer_utilization)
+            metrics['average_printer_utilization'] = avg_utilization
+        
+        metrics['class_utilization'] = self._class_utilization(printer_utilization)
         
+        return metrics
+    
+    def _printer_utilization(self, total_sim_time: float) -> Dict:
         printer_utilization = {}
-        total_sim_time = metrics['simulation_duration_seconds']
         
         for printer in self.printers:
             utilization_pct = 0
@@ -209,70 +631,339 @@ class PrinterSimulator:
             printer_utilization[f'Printer-{printer.id}'] = {
                 'utilization_percentage': utilization_pct,
                 'jobs_completed': printer.total_jobs_completed,
-                'total_busy_time': printer.total_busy_time
+                'total_busy_time': printer.total_busy_time,
+                'changeovers': printer.changeovers,
+                'changeover_time': printer.total_changeover_time,
+                'class': printer.printer_class
             }
         
-        metrics['printer_utilization'] = printer_utilization
-        
-        if printer_utilization:
-            avg_utilization = sum(p['utilization_percentage'] for p in printer_utilization.values()) / len(printer_utilization)
-            metrics['average_printer_utilization'] = avg_utilization
+        return printer_utilization
+    
+    def _class_utilization(self, printer_utilization: Dict) -> Dict:
+        """Per printer class: printer count, average utilization, jobs and busy time."""
+        classes = {}
+        for printer in self.printers:
+            stats = printer_utilization[f'Printer-{printer.id}']
+            totals = classes.setdefault(printer.printer_class, {
+                'printers': 0, 'utilization_percentage': 0.0, 'jobs_completed': 0, 'total_busy_time': 0.0
+            })
+            totals['printers'] += 1
+            totals['utilization_percentage'] += stats['utilization_percentage']
+            totals['jobs_completed'] += stats['jobs_completed']
+            totals['total_busy_time'] += stats['total_busy_time']
         
-        return metrics
+        for totals in classes.values():
+            totals['utilization_percentage'] /= totals['printers']
+        return classes
 
-    def get_report(self) -> Dict:
-        job_reports = []
+    def get_report(self, use_numpy: Optional[bool] = None) -> Dict:
+        """Per-job rows, metrics and config of the run.
+
+        By default the vectorized NumPy path is used with table storage when
+        numpy is installed; ``use_numpy`` forces either path. Both produce
+        the same output.
+        """
+        if use_numpy is None:
+            use_numpy = self._use_numpy()
         
-        for job in self.all_jobs.values():
-            wait_time_real = job.get_wait_time()
-            run_time_real = job.get_run_time()
-            wait_time_scaled = wait_time_real * self.time_scale if wait_time_real else None
-            run_time_scaled = run_time_real * self.time_scale if run_time_real else None
-            
-            job_report = {
-                'id': job.id,
-                'material': job.material,
-                'est_time': job.est_time,
-                'priority': job.priority,
-                'status': job.status,
-                'created_at': job.created_at,
-                'started_at': job.started_at,
-                'completed_at': job.completed_at,
-                'wait_time': wait_time_scaled,  
-                'run_time': run_time_scaled,
-                'wait_time_real': wait_time_real,
-                'run_time_real': run_time_real
-            }
-            job_reports.append(job_report)
+        with self._timer('report', 'job_reports'):
+            if use_numpy:
+                job_reports = vector_report.build_job_reports(self.all_jobs, self.time_scale)
+            else:
+                job_reports = self._job_reports()
         
         return {
             'jobs': job_reports,
-            'metrics': self._calculate_metrics(),
+            **self.get_summary(use_numpy)
+        }
+    
+    def _job_reports(self) -> List[Dict]:
+        return [self._job_report(job) for job in list(self.all_jobs.values())]
+    
+    def _job_report(self, job: Job) -> Dict:
+        wait_time_real = job.get_wait_time()
+        run_time_real = job.get_run_time()
+        wait_time_scaled = wait_time_real * self.time_scale if wait_time_real else None
+        run_time_scaled = run_time_real * self.time_scale if run_time_real else None
+        
+        return {
+            'id': job.id,
+            'material': job.material,
+            'est_time': job.est_time,
+            'priority': job.priority,
+            'status': job.status,
+            'created_at': job.created_at,
+            'started_at': job.started_at,
+            'completed_at': job.completed_at,
+            'wait_time': wait_time_scaled,  
+            'run_time': run_time_scaled,
+            'wait_time_real': wait_time_real,
+            'run_time_real': run_time_real
+        }
+    
+    def iter_job_reports(self, chunk_size: int = 10000) -> Iterator[List[Dict]]:
+        """Yield the per-job report rows in chunks of ``chunk_size``.
+
+        Only one chunk of row dicts exists at a time, so writers can stream
+        reports for millions of jobs without building them all in memory.
+        """
+        jobs = list(self.all_jobs.keys())
+        for start in range(0, len(jobs), chunk_size):
+            yield [self._job_report(self.all_jobs[job_id]) for job_id in jobs[start:start + chunk_size]]
+    
+    def get_summary(self, use_numpy: Optional[bool] = None) -> Dict:
+        """The report without the per-job rows."""
+        with self._timer('report', 'metrics'):
+            metrics = self._calculate_metrics(use_numpy)
+        summary = {
+            'metrics': metrics,
             'simulation_config': {
                 'num_printers': self.num_printers,
-                'time_scale': self.time_scale
+                'time_scale': self.time_scale,
+                'mode': self.mode,
+                'printer_classes': self._printer_classes(),
+                'policy': self.policy.name,
+                'material_aware': self.material_aware,
+                'dispatch': self.dispatch,
+                'changeover': self.changeover.to_dict() if self.changeover else None
             }
         }
+        if self.instrumentation is not None:
+            summary['instrumentation'] = self.instrumentation.to_dict()
+        return summary
     
-    def save_report(self, filename: str, format_type: str = 'json') -> None:
-        report = self.get_report()
-        
-        if format_type.lower() == 'json':
+    def _printer_classes(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for printer in self.printers:
+            counts[printer.printer_class] = counts.get(printer.printer_class, 0) + 1
+        return counts
+    
+    def save_report(self, filename: str, format_type: str = 'json', write_summary: bool = False,
+                    chunk_size: int = 10000) -> None:
+        """Write the report as ``json``, ``csv`` or ``jsonl``.
+
+        ``json`` writes the complete report in one document. ``csv`` (one row
+        per job) and ``jsonl`` (one object per job) stream the job rows in
+        chunks through a large write buffer. For those, the metrics and
+        config go to a separate ``<filename>.summary.json`` when
+        ``write_summary`` is True.
+        """
+        format_type = format_type.lower()
+        with self._timer('report', f'save_report.{format_type}'):
+            self._write_report(filename, format_type, write_summary, chunk_size)
+    
+    def _write_report(self, filename: str, format_type: str, write_summary: bool, chunk_size: int) -> None:
+        if format_type == 'json':
+            report = self.get_report()
             with open(filename, 'w') as f:
                 json.dump(report, f, indent=2)
             print(f"JSON report saved to {filename}")
+            return
         
-        elif format_type.lower() == 'csv':
-            with open(filename, 'w', newline='') as f:
-                if report['jobs']:
-                    writer = csv.DictWriter(f, fieldnames=report['jobs'][0].keys())
-                    writer.writeheader()
-                    writer.writerows(report['jobs'])
+        if format_type == 'csv':
+            with open(filename, 'w', newline='', buffering=WRITE_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                for i, chunk in enumerate(self.iter_job_reports(chunk_size)):
+                    if i == 0:
+                        writer.writerow(REPORT_FIELDS)
+                    writer.writerows(row.values() for row in chunk)
             print(f"CSV report saved to {filename}")
         
+        elif format_type == 'jsonl':
+            with open(filename, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+                for chunk in self.iter_job_reports(chunk_size):
+                    f.write(''.join(json.dumps(row) + '\n' for row in chunk))
+            print(f"JSON Lines report saved to {filename}")
+        
         else:
             raise ValueError(f"Unsupported format: {format_type}")
+        
+        if write_summary:
+            summary_filename = f"{filename}.summary.json"
+            with open(summary_filename, 'w') as f:
+                json.dump(self.get_summary(), f, indent=2)
+            print(f"Report summary saved to {summary_filename}")
+
+    def _now(self) -> float:
+        # The virtual clock in discrete mode, wall-clock time otherwise
+        if self.mode == 'discrete' and self.clock is not None:
+            return self.clock
+        return time.time()
+    
+    def checkpoint(self, path: str) -> int:
+        """Save the state of the run to ``path``; returns the number of jobs saved.
+
+        The file (see checkpoint.py) holds every job with its status, each
+        printer's counters and in-flight job with its remaining print time,
+        and the metric accumulators. In threaded mode it can be taken while
+        the workers run: the printer locks are only held while the printers
+        and the metrics are read, and the jobs are written afterwards.
+        Arrival streams (see add_arrivals) are not saved.
+        """
+        with self._timer('report', 'checkpoint'):
+            now, printers, completed, metrics = self._checkpoint_cut()
+            with self.lock:
+                jobs = list(self.all_jobs.values())
+            
+            # Shards only grow, so their first entries are the jobs completed at the cut
+            completed_by = {job.id: printer_id for printer_id, count in completed.items()
+                            for job in self._completed_by_printer[printer_id][:count]}
+            in_flight = {state['job']: state['id'] for state in printers if state['job'] is not None}
+            header = {
+                'time': now,
+                'mode': self.mode,
+                'time_scale': self.time_scale,
+                'policy': self.policy.name,
+                'dispatch': self.dispatch,
+                'simulation_start_time': self.simulation_start_time,
+                'printers': printers,
+                'metrics': metrics,
+                'jobs': len(jobs),
+            }
+            checkpoint_file.write(path, header, self._checkpoint_rows(jobs, completed_by, in_flight))
+        event_log.emit(INFO, "checkpoint_written", path=path, jobs=len(jobs))
+        return len(jobs)
+    
+    def _checkpoint_cut(self) -> Tuple[float, List[Dict], Dict[int, int], Dict]:
+        """The time, printer states, completion shard sizes and metrics at one instant.
+
+        With every printer lock held no job can start or complete, so these
+        agree with each other.
+        """
+        locks = [printer.lock for printer in self.printers]
+        for lock in locks:
+            lock.acquire()
+        try:
+            now = self._now()
+            printers = [self._printer_state(printer, now) for printer in self.printers]
+            completed = {printer_id: len(shard) for printer_id, shard in self._completed_by_printer.items()}
+            return now, printers, completed, self.metrics.get_state()
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+    
+    def _printer_state(self, printer: Printer, now: float) -> Dict:
+        job = printer.current_job
+        remaining = None
+        if job is not None:
+            # In est_time units, like print_time(); restore() requires the same time scale
+            elapsed = (now - job.started_at) / self.time_scale if self.time_scale else 0.0
+            remaining = max(0.0, printer.print_time(job) - elapsed)
+        return {
+            'id': printer.id,
+            'job': job.id if job is not None else None,
+            'remaining': remaining,
+            'loaded_material': printer.loaded_material,
+            'changeovers': printer.changeovers,
+            'total_changeover_time': printer.total_changeover_time,
+            'total_jobs_completed': printer.total_jobs_completed,
+            'total_busy_time': printer.total_busy_time,
+        }
+    
+    @staticmethod
+    def _checkpoint_rows(jobs: List[Job], completed_by: Dict[str, int], in_flight: Dict[str, int]) -> Iterator[Tuple]:
+        # Rows in checkpoint.JOB_FIELDS order, with each job's status at the cut
+        for job in jobs:
+            job_id = job.id
+            printer_id = completed_by.get(job_id)
+            if printer_id is not None:
+                yield (job_id, job.material, job.est_time, job.priority, job.created_at, 'completed',
+                       job.started_at, job.completed_at, job.deadline, printer_id)
+            elif job_id in in_flight:
+                yield (job_id, job.material, job.est_time, job.priority, job.created_at, 'started',
+                       job.started_at, None, job.deadline, in_flight[job_id])
+            elif job.status == 'cancelled':
+                yield (job_id, job.material, job.est_time, job.priority, job.created_at, 'cancelled',
+                       None, None, job.deadline, None)
+            else:
+                # Queued at the cut, even if a printer has taken it since
+                yield (job_id, job.material, job.est_time, job.priority, job.created_at, 'queued',
+                       None, None, job.deadline, None)
+    
+    def _queue_restored(self, jobs: List[Job]) -> None:
+        # Jobs are already stored and counted; this only queues them
+        for batch in batched(jobs, 10000):
+            self.job_queue.add_jobs(batch)
+    
+    def restore(self, path: str) -> int:
+        """Load a checkpoint written by checkpoint(); returns the number of jobs restored.
 
+        Call it on a new simulator with the same printers, mode, time scale,
+        policy and dispatch as the one that wrote the checkpoint, before
+        adding any jobs; a mismatch raises ValueError. Timestamps are shifted
+        so the checkpoint time becomes now, so the time between the two runs
+        counts as neither waiting nor printing. Queued jobs are queued again
+        in their original order, and each in-flight job finishes on its
+        printer after its remaining print time once the simulation starts.
+        """
+        if len(self.all_jobs) or self.worker_threads:
+            raise ValueError("Can only restore into a simulator that has no jobs and is not running")
+        header, rows = checkpoint_file.read(path)
+        saved = {state['id']: state for state in header['printers']}
+        if set(saved) != set(self._completed_by_printer):
+            raise ValueError(f"Checkpoint printers {sorted(saved)} do not match this simulator's "
+                             f"{sorted(self._completed_by_printer)}")
+        config = {'mode': self.mode, 'time_scale': self.time_scale, 'policy': self.policy.name,
+                  'dispatch': self.dispatch}
+        mismatched = [f"{key} {header[key]!r} (this simulator: {value!r})"
+                      for key, value in config.items() if header[key] != value]
+        if mismatched:
+            raise ValueError(f"Checkpoint was written with a different {', '.join(mismatched)}")
+        
+        offset = time.time() - header['time']
+        table = self.all_jobs if self.storage == 'table' else None
+        printers = {printer.id: printer for printer in self.printers}
+        queued = []
+        counts = dict.fromkeys(('started', 'completed', 'cancelled'), 0)
+        for job_id, material, est_time, priority, created_at, status, started_at, completed_at, deadline, \
+                printer_id in rows:
+            job = Job(job_id, material, est_time, priority, None if deadline is None else deadline + offset)
+            job.created_at = created_at + offset
+            if table is not None:
+                job = table.add(job)
+            else:
+                self.all_jobs[job_id] = job
+            if status == 'queued':
+                queued.append(job)
+                continue
+            
+            job.status = status
+            counts[status] += 1
+            if status == 'completed':
+                job.started_at = started_at + offset
+                job.completed_at = completed_at + offset
+                self._completed_by_printer[printer_id].append(job)
+            elif status == 'started':
+                job.started_at = started_at + offset
+                printers[printer_id].current_job = job
+                printers[printer_id].is_busy = True
+            else:
+                self.cancelled_jobs.append(job)
+        
+        for printer in self.printers:
+            state = saved[printer.id]
+            printer.loaded_material = state['loaded_material']
+            printer.changeovers = state['changeovers']
+            printer.total_changeover_time = state['total_changeover_time']
+            printer.total_jobs_completed = state['total_jobs_completed']
+            printer.total_busy_time = state['total_busy_time']
+            if state['job'] is not None:
+                self._in_flight[printer.id] = state['remaining']
+        for shard in self._completed_by_printer.values():
+            shard.sort(key=lambda job: job.completed_at)
+        self.metrics.set_state(header['metrics'])
+        
+        for status, count in counts.items():
+            self.status_counter.add(status, count)
+        self.status_counter.add_queued(queued)
+        if queued or counts['started']:
+            self._track_added(len(queued) + counts['started'])
+        self._queue_restored(queued)
+        
+        if header['simulation_start_time'] is not None:
+            self.simulation_start_time = self._resumed_start = header['simulation_start_time'] + offset
+        event_log.emit(INFO, "checkpoint_restored", path=path, jobs=len(self.all_jobs))
+        return len(self.all_jobs)
 
 if __name__ == "__main__":
     sim = PrinterSimulator(num_printers=2, time_scale=0.5)
@@ -0,0 +1,114 @@
+"""Parameter sweeps: run many simulator configurations across a process pool.
+
+A sweep is a list of configurations, usually the cartesian product of a
+grid such as ``{'num_printers': [2, 4, 8], 'jobs_file': ['mix_a.json']}``.
+Each configuration is simulated in its own worker process (on the discrete
+clock unless another mode is given), and the metrics of every run are
+collected into one comparison table.
+"""
+import contextlib
+import csv
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from models import Job
+from simulator import PrinterSimulator, MODES
+from job_loader import iter_validated_records
+
+
+CONFIG_KEYS = ('num_printers', 'time_scale', 'mode', 'jobs_file')
+DEFAULT_CONFIG = {'num_printers': 2, 'time_scale': 1.0, 'mode': 'discrete'}
+
+# (column title, metrics key) pairs shown in the comparison table
+TABLE_COLUMNS = (
+    ('completed', 'completed_jobs'),
+    ('avg wait', 'avg_wait_time'),
+    ('p90 wait', 'p90_wait_time'),
+    ('p99 wait', 'p99_wait_time'),
+    ('max wait', 'max_wait_time'),
+    ('duration', 'simulation_duration_seconds'),
+    ('jobs/s', 'throughput_jobs_per_second'),
+    ('util %', 'average_printer_utilization'),
+)
+
+
+def expand_grid(grid: Dict[str, Sequence]) -> List[Dict]:
+    """Every combination of the grid's values, as a list of configurations."""
+    unknown = set(grid) - set(CONFIG_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown sweep parameter(s): {', '.join(sorted(unknown))}")
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[key] for key in keys))]
+
+
+def run_config(config: Dict) -> Dict:
+    """Simulate one configuration and return ``{'config', 'metrics'}``.
+
+    Every job of the job file is added at the start of the run, so runs of
+    the same file are comparable whatever ``created_at`` the file holds.
+    """
+    config = {**DEFAULT_CONFIG, **config}
+    if config['mode'] not in MODES:
+        raise ValueError(f"Unsupported mode: {config['mode']}")
+    if 'jobs_file' not in config:
+        raise ValueError("A sweep configuration needs a jobs_file")
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        sim = PrinterSimulator(num_printers=config['num_printers'], time_scale=config['time_scale'],
+                               mode=config['mode'])
+        sim.add_jobs(
+            Job(record['id'], record['material'], record['est_time'], record['priority'])
+            for record in iter_validated_records(config['jobs_file'])
+        )
+        sim.run_until_complete()
+
+    return {'config': config, 'metrics': sim._calculate_metrics()}
+
+
+def run_sweep(configs: Iterable[Dict], max_workers: Optional[int] = None) -> List[Dict]:
+    """Run every configuration in a process pool; results keep the input order.
+
+    ``max_workers`` defaults to the number of CPUs.
+    """
+    configs = list(configs)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run_config, configs))
+
+
+def _format_value(value) -> str:
+    if value is None:
+        return '-'
+    if isinstance(value, float):
+        return f"{value:.3f}"
+    return str(value)
+
+
+def comparison_table(results: List[Dict]) -> str:
+    """Render sweep results as a fixed-width text table, one row per run."""
+    headers = ['printers', 'time_scale', 'mode', 'jobs_file'] + [title for title, _ in TABLE_COLUMNS]
+    rows = [
+        [_format_value(result['config'].get(key)) for key in CONFIG_KEYS]
+        + [_format_value(result['metrics'].get(key)) for _, key in TABLE_COLUMNS]
+        for result in results
+    ]
+    widths = [max(len(cell) for cell in column) for column in zip(headers, *rows)]
+    lines = [' '.join(cell.rjust(width) for cell, width in zip(row, widths)) for row in [headers] + rows]
+    lines.insert(1, ' '.join('-' * width for width in widths))
+    return '\n'.join(lines)
+
+
+def save_results(results: List[Dict], filename: str) -> None:
+    """Write sweep results as JSON or, for a ``.csv`` filename, one CSV row per run."""
+    if filename.endswith('.csv'):
+        with open(filename, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(list(CONFIG_KEYS) + [key for _, key in TABLE_COLUMNS])
+            for result in results:
+                writer.writerow([result['config'].get(key) for key in CONFIG_KEYS]
+                                + [result['metrics'].get(key) for _, key in TABLE_COLUMNS])
+    else:
+        with open(filename, 'w') as f:
+            json.dump(results, f, indent=2)
@@ -0,0 +1,130 @@
+"""NumPy batch computation of the per-job report rows and printer utilization.
+
+Used by PrinterSimulator.get_report() for table storage when numpy is
+installed, where the columns can be read straight from the JobTable arrays. The output
+matches the pure-Python path key for key: timestamps that were never set are
+None, and (as in Job.get_wait_time/get_run_time) zero timestamps and zero
+scaled durations are reported as None.
+"""
+from typing import Dict, List
+
+from models import JOB_STATUSES
+from job_table import JobTable
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+def _columns(all_jobs):
+    """Return the report columns in all_jobs iteration order.
+
+    The first five entries are plain lists (id, material, est_time, priority,
+    status). They are followed by the created/started/completed timestamps
+    as float64 arrays with NaN for unset values, and then the same
+    timestamps as lists of the original values with None for unset ones.
+    """
+    if isinstance(all_jobs, JobTable):
+        rows = np.fromiter(all_jobs._rows.values(), dtype=np.int64, count=len(all_jobs))
+        materials = all_jobs.materials
+        created = np.frombuffer(all_jobs.created_at, dtype=np.float64)[rows]
+        started = np.frombuffer(all_jobs.started_at, dtype=np.float64)[rows]
+        completed = np.frombuffer(all_jobs.completed_at, dtype=np.float64)[rows]
+        return (
+            list(all_jobs._rows),
+            [materials[code] for code in np.frombuffer(all_jobs.material, dtype=np.uint32)[rows].tolist()],
+            np.frombuffer(all_jobs.est_time, dtype=np.float64)[rows].tolist(),
+            np.frombuffer(all_jobs.priority, dtype=np.int64)[rows].tolist(),
+            [JOB_STATUSES[code] for code in np.frombuffer(all_jobs.status, dtype=np.int8)[rows].tolist()],
+            created, started, completed,
+            created.tolist(), _with_none(started, ~np.isnan(started)), _with_none(completed, ~np.isnan(completed)),
+        )
+
+    jobs = list(all_jobs.values())
+    n = len(jobs)
+    nan = np.nan
+    created_list = [job.created_at for job in jobs]
+    started_list = [job.started_at for job in jobs]
+    completed_list = [job.completed_at for job in jobs]
+    return (
+        [job.id for job in jobs],
+        [job.material for job in jobs],
+        [job.est_time for job in jobs],
+        [job.priority for job in jobs],
+        [job.status for job in jobs],
+        np.fromiter(created_list, dtype=np.float64, count=n),
+        np.fromiter((nan if value is None else value for value in started_list), dtype=np.float64, count=n),
+        np.fromiter((nan if value is None else value for value in completed_list), dtype=np.float64, count=n),
+        created_list, started_list, completed_list,
+    )
+
+
+def _with_none(values, mask) -> List:
+    out = values.astype(object)
+    out[~mask] = None
+    return out.tolist()
+
+
+def build_job_reports(all_jobs, time_scale: float) -> List[Dict]:
+    (ids, materials, est_times, priorities, statuses, created, started, completed,
+     created_list, started_list, completed_list) = _columns(all_jobs)
+
+    has_started = ~np.isnan(started) & (started != 0)
+    has_completed = ~np.isnan(completed) & (completed != 0)
+    has_run = has_started & has_completed
+
+    wait_real = started - created
+    run_real = completed - started
+    wait_scaled = wait_real * time_scale
+    run_scaled = run_real * time_scale
+
+    wait_real_list = _with_none(wait_real, has_started)
+    run_real_list = _with_none(run_real, has_run)
+    wait_list = _with_none(wait_scaled, has_started & (wait_real != 0))
+    run_list = _with_none(run_scaled, has_run & (run_real != 0))
+
+    return [
+        {
+            'id': job_id,
+            'material': material,
+            'est_time': est_time,
+            'priority': priority,
+            'status': status,
+            'created_at': created_at,
+            'started_at': started_at,
+            'completed_at': completed_at,
+            'wait_time': wait_time,
+            'run_time': run_time,
+            'wait_time_real': wait_time_real,
+            'run_time_real': run_time_real
+        }
+        for job_id, material, est_time, priority, status, created_at, started_at, completed_at,
+            wait_time, run_time, wait_time_real, run_time_real
+        in zip(ids, materials, est_times, priorities, statuses, created_list, started_list,
+               completed_list, wait_list, run_list, wait_real_list, run_real_list)
+    ]
+
+
+def printer_utilization(printers, total_sim_time: float) -> Dict[str, Dict]:
+    busy = np.fromiter((printer.total_busy_time for printer in printers), dtype=np.float64, count=len(printers))
+    if total_sim_time > 0:
+        utilization = (busy / total_sim_time) * 100
+    else:
+        utilization = np.zeros_like(busy)
+
+    return {
+        f'Printer-{printer.id}': {
+            'utilization_percentage': pct if total_sim_time > 0 else 0,
+            'jobs_completed': printer.total_jobs_completed,
+            'total_busy_time': printer.total_busy_time,
+            'changeovers': printer.changeovers,
+            'changeover_time': printer.total_changeover_time,
+            'class': printer.printer_class
+        }
+        for printer, pct in zip(printers, utilization.tolist())
+    }
@@ -0,0 +1,142 @@
+"""Seeded synthetic workloads for load testing.
+
+A WorkloadGenerator yields ``(arrival, job)`` pairs lazily, in arrival
+order. ``arrival`` is the offset from the start of the run in the same
+units as ``Job.est_time``, so the simulator scales it by ``time_scale``
+like print times. The same seed always gives the same jobs::
+
+    workload = WorkloadGenerator(seed=7, rate=0.01, est_time=('lognormal', 300, 0.6),
+                                 materials={'PLA': 0.7, 'PETG': 0.2, 'TPU': 0.1})
+    sim.add_arrivals(workload.generate(count=100000))
+    sim.run_until_complete()
+"""
+import bisect
+import itertools
+import math
+import random
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+from models import Job
+
+
+ARRIVALS = ('poisson', 'bursty')
+EST_TIME_DISTRIBUTIONS = ('fixed', 'uniform', 'exponential', 'lognormal')
+
+# Shortest est_time generated, so every job passes validation
+MIN_EST_TIME = 0.001
+
+
+class WorkloadGenerator:
+    """Jobs with random arrivals, materials, print times and priorities.
+
+    ``arrival='poisson'`` spaces arrivals by exponential gaps at ``rate``
+    jobs per time unit. ``arrival='bursty'`` keeps about the same mean rate
+    but delivers jobs in bursts: bursts start as a Poisson process, each
+    brings a geometric number of jobs (``burst_size`` on average), and jobs
+    within a burst are ``burst_gap`` apart on average. A burst that is
+    still going when the next one is due delays it.
+
+    ``materials`` and ``priorities`` map each value to its relative weight.
+    ``est_time`` is a number (every job takes that long) or one of
+    ``('uniform', low, high)``, ``('exponential', mean)`` and
+    ``('lognormal', median, sigma)``.
+    """
+
+    def __init__(self, seed: Optional[int] = 0, arrival: str = 'poisson', rate: float = 1.0,
+                 burst_size: float = 10.0, burst_gap: float = 0.0,
+                 materials: Optional[Dict[str, float]] = None,
+                 est_time: Union[float, Tuple] = ('exponential', 60.0),
+                 priorities: Optional[Dict[int, float]] = None, id_prefix: str = 'gen'):
+        if arrival not in ARRIVALS:
+            raise ValueError(f"Unsupported arrival process: {arrival} (expected one of {', '.join(ARRIVALS)})")
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst_size < 1:
+            raise ValueError("burst_size must be at least 1")
+        self.seed = seed
+        self.arrival = arrival
+        self.rate = rate
+        self.burst_size = burst_size
+        self.burst_gap = burst_gap
+        self.materials = self._weights(materials or {'PLA': 1.0}, 'materials')
+        self.priorities = self._weights(priorities or {1: 0.2, 2: 0.5, 3: 0.3}, 'priorities')
+        self.est_time = self._distribution(est_time)
+        self.id_prefix = id_prefix
+
+    @staticmethod
+    def _weights(weights: Dict, name: str) -> Tuple[list, list]:
+        """Values and cumulative weights for bisect-based sampling."""
+        if any(weight < 0 for weight in weights.values()) or sum(weights.values()) <= 0:
+            raise ValueError(f"{name} weights must be non-negative with a positive sum")
+        return list(weights), list(itertools.accumulate(weights.values()))
+
+    @staticmethod
+    def _distribution(est_time) -> Tuple:
+        if isinstance(est_time, (int, float)):
+            est_time = ('fixed', est_time)
+        name, *params = est_time
+        expected = {'fixed': 1, 'uniform': 2, 'exponential': 1, 'lognormal': 2}
+        if name not in expected:
+            raise ValueError(f"Unsupported est_time distribution: {name} "
+                             f"(expected one of {', '.join(EST_TIME_DISTRIBUTIONS)})")
+        if len(params) != expected[name] or params[0] <= 0:
+            raise ValueError(f"est_time {name} takes {expected[name]} parameter(s), starting with a positive one")
+        return (name, *params)
+
+    def _sample_est_time(self, rng: random.Random) -> float:
+        name, *params = self.est_time
+        if name == 'fixed':
+            value = params[0]
+        elif name == 'uniform':
+            value = rng.uniform(*params)
+        elif name == 'exponential':
+            value = rng.expovariate(1.0 / params[0])
+        else:
+            value = rng.lognormvariate(math.log(params[0]), params[1])
+        return max(value, MIN_EST_TIME)
+
+    @staticmethod
+    def _choose(rng: random.Random, table: Tuple[list, list]):
+        values, cumulative = table
+        return values[bisect.bisect_right(cumulative, rng.random() * cumulative[-1])]
+
+    def _arrival_times(self, rng: random.Random) -> Iterator[float]:
+        now = 0.0
+        if self.arrival == 'poisson':
+            while True:
+                now += rng.expovariate(self.rate)
+                yield now
+
+        # Bursts arrive at rate / burst_size, so the mean job rate is kept
+        burst_rate = self.rate / self.burst_size
+        while True:
+            now += rng.expovariate(burst_rate)
+            burst_time = now
+            while True:
+                yield burst_time
+                # Geometric burst length with mean burst_size
+                if rng.random() < 1.0 / self.burst_size:
+                    break
+                if self.burst_gap > 0:
+                    burst_time += rng.expovariate(1.0 / self.burst_gap)
+            now = max(now, burst_time)
+
+    def generate(self, count: Optional[int] = None, duration: Optional[float] = None) -> Iterator[Tuple[float, Job]]:
+        """Yield ``(arrival, job)`` pairs until ``count`` jobs or ``duration`` time units.
+
+        Jobs are created as they are consumed, so arbitrarily long workloads
+        take constant memory. Each call starts over from the seed.
+        """
+        if count is None and duration is None:
+            raise ValueError("generate() needs a count or a duration")
+        rng = random.Random(self.seed)
+        arrivals = self._arrival_times(rng)
+        for n in itertools.count():
+            if count is not None and n >= count:
+                return
+            arrival = next(arrivals)
+            if duration is not None and arrival > duration:
+                return
+            job = Job(f"{self.id_prefix}-{n}", self._choose(rng, self.materials),
+                      round(self._sample_est_time(rng), 3), self._choose(rng, self.priorities))
+            yield arrival, job
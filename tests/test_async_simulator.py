@@ -0,0 +1,85 @@
+import sys
+import os
+import asyncio
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from async_simulator import AsyncPrinterSimulator
+from models import Job
+from changeover import ChangeoverMatrix
+
+
+def test_async_priority_order_and_cancellation():
+    async def run():
+        sim = AsyncPrinterSimulator(num_printers=1, time_scale=0.001)
+        await sim.add_job(Job("low", "PLA", 1, 3))
+        await sim.add_job(Job("high", "PLA", 1, 1))
+        await sim.add_job(Job("normal", "PLA", 1, 2))
+        await sim.add_job(Job("high2", "PLA", 1, 1))
+        assert await sim.cancel_job("normal")
+        assert not await sim.cancel_job("missing")
+        assert sim.get_status()['queue_size'] == 3
+
+        await sim.run_until_complete(timeout=5)
+        return sim
+
+    sim = asyncio.run(run())
+    assert [job.id for job in sim.completed_jobs] == ["high", "high2", "low"]
+
+    status = sim.get_status()
+    assert (status['completed'], status['cancelled'], status['queued'], status['running']) == (3, 1, 0, 0)
+    assert not asyncio.run(sim.cancel_job("high"))
+
+
+def test_async_many_printers_report():
+    async def run():
+        sim = AsyncPrinterSimulator(num_printers=500, time_scale=0.001)
+        await sim.add_jobs(Job(f"J{i}", "PLA", 1, i % 3) for i in range(1000))
+        await sim.run_until_complete(timeout=10)
+        return sim
+
+    sim = asyncio.run(run())
+    report = sim.get_report()
+    assert report['metrics']['completed_jobs'] == 1000
+    assert report['simulation_config']['mode'] == 'async'
+    assert len(report['metrics']['printer_utilization']) == 500
+    assert all(job['status'] == 'completed' for job in report['jobs'])
+
+
+def test_async_cancel_during_changeover():
+    async def run():
+        changeover = ChangeoverMatrix(default=50, initial=50)
+        sim = AsyncPrinterSimulator(num_printers=1, time_scale=0.001, changeover=changeover)
+        await sim.add_job(Job("a", "PLA", 1, 1))
+        await sim.add_job(Job("b", "ABS", 1, 2))
+        await sim.start_simulation()
+        # "a" is taken but still in its 50ms changeover
+        await asyncio.sleep(0.02)
+        assert await sim.cancel_job("a")
+        await asyncio.wait_for(sim._done.wait(), 5)
+        await sim.stop_simulation()
+        return sim
+
+    sim = asyncio.run(run())
+    assert [job.id for job in sim.completed_jobs] == ["b"]
+    assert [job.id for job in sim.cancelled_jobs] == ["a"]
+    status = sim.get_status()
+    assert (status['completed'], status['cancelled'], status['queued'], status['running']) == (1, 1, 0, 0)
+
+
+def test_async_run_after_timeout_finishes_in_flight_jobs():
+    async def run():
+        sim = AsyncPrinterSimulator(num_printers=2, time_scale=0.001)
+        await sim.add_jobs(Job(f"J{i}", "PLA", 100, 1) for i in range(6))
+        # Both printers are mid-print when the first run stops
+        await sim.run_until_complete(timeout=0.15)
+        status = sim.get_status()
+        assert (status['completed'], status['running'], status['queued']) == (2, 2, 2)
+        assert set(sim._in_flight) == {0, 1}
+
+        await sim.run_until_complete(timeout=5)
+        return sim
+
+    sim = asyncio.run(run())
+    status = sim.get_status()
+    assert (status['completed'], status['running'], status['queued'], status['active_printers']) == (6, 0, 0, 0)
+    assert sim.all_done_event.is_set()
+    assert all(0.09 < job.get_run_time() < 0.5 for job in sim.completed_jobs)
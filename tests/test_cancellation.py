@@ -0,0 +1,55 @@
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from simulator import PrinterSimulator
+from queue_manager import JobQueue
+from models import Job
+
+
+def test_cancelled_jobs_are_skipped_at_dequeue():
+    queue = JobQueue()
+    for i in range(10):
+        queue.add_job(Job(f"J{i}", "PLA", 1, i % 2 + 1))
+
+    assert queue.cancel_job("J0")
+    assert queue.cancel_job("J3")
+    assert not queue.cancel_job("J0")
+    assert not queue.cancel_job("missing")
+    assert queue.get_queue_size() == 8
+
+    order = []
+    while not queue.is_empty():
+        order.append(queue.get_next_job().id)
+
+    assert order == ["J2", "J4", "J6", "J8", "J1", "J5", "J7", "J9"]
+    assert queue.get_next_job() is None
+
+
+def test_bulk_cancel_compacts_tombstones():
+    queue = JobQueue()
+    jobs = [Job(f"J{i}", "PLA", 1, 1) for i in range(1000)]
+    for job in jobs:
+        queue.add_job(job)
+
+    for job in jobs[:900]:
+        assert queue.cancel_job(job.id)
+
+    assert all(job.status == "cancelled" for job in jobs[:900])
+    assert queue.get_queue_size() == 100
+    assert len(queue._heap) < 300
+    assert queue.peek_next_job() is jobs[900]
+    assert [job.id for job in queue.jobs] == [job.id for job in jobs[900:]]
+
+
+def test_simulator_cancel():
+    sim = PrinterSimulator(num_printers=1, time_scale=0.01, mode="discrete")
+    sim.add_job(Job("keep", "PLA", 1, 1))
+    sim.add_job(Job("drop", "PLA", 1, 1))
+
+    assert sim.cancel_job("drop")
+    assert not sim.cancel_job("drop")
+    sim.run_until_complete()
+
+    assert sim.all_jobs["keep"].status == "completed"
+    assert sim.all_jobs["drop"].status == "cancelled"
+    assert sim.get_status()['cancelled'] == 1
@@ -0,0 +1,60 @@
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from changeover import ChangeoverMatrix
+from queue_manager import MaterialAwareQueue
+from simulator import PrinterSimulator
+from models import Job
+
+
+def test_changeover_matrix_lookup():
+    matrix = ChangeoverMatrix.from_dict({'default': 600, 'initial': 60, 'penalties': {'PLA': {'TPU': 1200}}})
+    assert matrix.penalty(None, 'PLA') == 60
+    assert matrix.penalty('PLA', 'PLA') == 0
+    assert matrix.penalty('PLA', 'TPU') == 1200
+    assert matrix.penalty('TPU', 'PLA') == 600
+    assert ChangeoverMatrix.from_dict(matrix.to_dict()).penalty('PLA', 'TPU') == 1200
+
+
+def test_material_aware_queue_prefers_loaded_material_within_window():
+    queue = MaterialAwareQueue()
+    queue.add_jobs([Job("pla1", "PLA", 10, 2), Job("abs1", "ABS", 10, 2), Job("abs2", "ABS", 10, 1),
+                    Job("pla2", "PLA", 10, 2)])
+    assert queue.cancel_job("pla1")
+    # Priority 1 still goes first whatever is loaded
+    assert queue.get_next_job("PLA").id == "abs2"
+    assert queue.get_next_job("PLA").id == "pla2"
+    assert queue.peek_next_job().id == "abs1"
+    assert queue.get_next_job("PLA").id == "abs1"
+    assert queue.get_next_job("PLA") is None
+
+    queue = MaterialAwareQueue(priority_window=1)
+    queue.add_jobs([Job("abs", "ABS", 10, 1), Job("pla", "PLA", 10, 2)])
+    assert [job.id for job in queue.jobs] == ["abs", "pla"]
+    assert queue.get_next_job("PLA").id == "pla"
+
+
+def run(material_aware):
+    sim = PrinterSimulator(num_printers=1, time_scale=1.0, mode="discrete", material_aware=material_aware,
+                           changeover=ChangeoverMatrix(default=100))
+    for i, material in enumerate(["PLA", "ABS", "PLA", "ABS"]):
+        sim.add_job(Job(f"J{i}", material, 10, 1))
+    sim.run_until_complete()
+    return sim
+
+
+def test_changeover_penalty_and_batching_in_discrete_mode():
+    plain = run(material_aware=False)
+    batched = run(material_aware=True)
+
+    assert [job.id for job in plain.completed_jobs] == ["J0", "J1", "J2", "J3"]
+    assert [job.id for job in batched.completed_jobs] == ["J0", "J2", "J1", "J3"]
+
+    plain_metrics = plain.get_report()['metrics']
+    batched_metrics = batched.get_report()['metrics']
+    assert (plain_metrics['changeovers'], batched_metrics['changeovers']) == (3, 1)
+    assert plain_metrics['makespan_seconds'] == 4 * 10 + 3 * 100
+    assert batched_metrics['makespan_seconds'] == 4 * 10 + 100
+    assert batched_metrics['printer_utilization']['Printer-0']['changeover_time'] == 100
+    # Run time is only the printing, the changeover is part of the wait
+    assert all(job.get_run_time() == 10 for job in batched.completed_jobs)
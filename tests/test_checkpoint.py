@@ -0,0 +1,125 @@
+import sys
+import os
+import time
+import asyncio
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import pytest
+from simulator import PrinterSimulator
+from async_simulator import AsyncPrinterSimulator
+from models import Job
+
+
+def _jobs(count):
+    return [Job(f"J{i}", "PLA" if i % 2 else "ABS", 1 + i % 7, i % 3 + 1) for i in range(count)]
+
+
+def test_resumed_discrete_run_matches_uninterrupted_run(tmp_path):
+    path = str(tmp_path / "run.ckpt")
+    full = PrinterSimulator(num_printers=3, time_scale=1.0, mode='discrete')
+    full.add_jobs(_jobs(300))
+    full.cancel_job("J299")
+    full.run_until_complete()
+
+    first = PrinterSimulator(num_printers=3, time_scale=1.0, mode='discrete', storage='table')
+    first.add_jobs(_jobs(300))
+    assert first.cancel_job("J299")
+    first.run_until_complete(timeout=200)
+    assert first.checkpoint(path) == 300
+    status = first.get_status()
+    assert status['running'] == 3 and status['queued'] > 0
+
+    resumed = PrinterSimulator(num_printers=3, time_scale=1.0, mode='discrete')
+    assert resumed.restore(path) == 300
+    assert resumed.get_status() == status
+    assert resumed.all_jobs["J299"].status == 'cancelled'
+    resumed.run_until_complete()
+
+    assert resumed.get_status()['completed'] == 299
+    expected, actual = full.get_summary()['metrics'], resumed.get_summary()['metrics']
+    assert actual['changeovers'] == expected['changeovers']
+    assert actual['avg_run_time'] == pytest.approx(expected['avg_run_time'], abs=0.01)
+    assert actual['makespan_seconds'] == pytest.approx(expected['makespan_seconds'], abs=0.1)
+
+
+def test_checkpoint_while_workers_run(tmp_path):
+    path = str(tmp_path / "run.ckpt")
+    sim = PrinterSimulator(num_printers=4, time_scale=0.002)
+    sim.add_jobs(_jobs(400))
+    sim.start_simulation()
+    time.sleep(0.1)
+    sim.checkpoint(path)
+    sim.stop_simulation()
+
+    resumed = PrinterSimulator(num_printers=4, time_scale=0.002)
+    resumed.restore(path)
+    resumed.run_until_complete(timeout=30)
+    status = resumed.get_status()
+    assert status['completed'] == 400 and status['queued'] == status['running'] == 0
+    # Every job counted exactly once, including those in flight at the checkpoint
+    assert resumed.metrics.wait.count == 400
+    assert sum(printer.total_jobs_completed for printer in resumed.printers) == 400
+
+
+def test_periodic_checkpoints(tmp_path):
+    path = str(tmp_path / "run.ckpt")
+    sim = PrinterSimulator(num_printers=2, time_scale=0.002, checkpoint_path=path, checkpoint_interval=0.05)
+    sim.add_jobs(_jobs(200))
+    sim.run_until_complete(timeout=0.2)
+    interrupted = sim.get_status()
+
+    resumed = PrinterSimulator(num_printers=2, time_scale=0.002)
+    resumed.restore(path)
+    assert resumed.get_status() == interrupted
+    resumed.run_until_complete(timeout=30)
+    assert resumed.get_status()['completed'] == 200
+
+
+def test_async_checkpoint_and_restore(tmp_path):
+    path = str(tmp_path / "run.ckpt")
+
+    async def interrupted():
+        sim = AsyncPrinterSimulator(num_printers=3, time_scale=0.001)
+        await sim.add_jobs(Job(f"J{i}", "PLA", 40, i % 3 + 1) for i in range(30))
+        await sim.run_until_complete(timeout=0.1)
+        sim.checkpoint(path)
+        return sim.get_status()
+
+    async def resumed():
+        sim = AsyncPrinterSimulator(num_printers=3, time_scale=0.001)
+        assert sim.restore(path) == 30
+        restored = sim.get_status()
+        await sim.run_until_complete(timeout=5)
+        return sim, restored
+
+    status = asyncio.run(interrupted())
+    assert status['running'] == 3 and status['queued'] > 0
+    sim, restored = asyncio.run(resumed())
+    assert restored == status
+    assert sim.get_status()['completed'] == 30
+    assert sim.all_done_event.is_set()
+    assert sum(printer.total_jobs_completed for printer in sim.printers) == 30
+    assert all(job.get_run_time() < 0.5 for job in sim.completed_jobs)
+
+
+def test_restore_rejects_mismatched_simulator(tmp_path):
+    path = str(tmp_path / "run.ckpt")
+    sim = PrinterSimulator(num_printers=2, time_scale=0.01, mode='discrete')
+    sim.add_jobs(_jobs(10))
+    sim.checkpoint(path)
+
+    with pytest.raises(ValueError):
+        PrinterSimulator(num_printers=3, time_scale=0.01, mode='discrete').restore(path)
+    busy = PrinterSimulator(num_printers=2, time_scale=0.01, mode='discrete')
+    busy.add_job(Job("other", "PLA", 1, 1))
+    with pytest.raises(ValueError):
+        busy.restore(path)
+    with pytest.raises(ValueError):
+        PrinterSimulator(num_printers=2, mode='discrete').restore(__file__)
+    # Same printers, different configuration
+    for key, config in [('mode', {'mode': 'threaded'}),
+                        ('time_scale', {'time_scale': 1.0}),
+                        ('policy', {'policy': 'edf'}),
+                        ('dispatch', {'dispatch': 'stealing'})]:
+        other = PrinterSimulator(**{'num_printers': 2, 'time_scale': 0.01, 'mode': 'discrete', **config})
+        with pytest.raises(ValueError, match=key):
+            other.restore(path)
@@ -0,0 +1,75 @@
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from simulator import PrinterSimulator
+from models import Job
+
+
+def run_discrete():
+    sim = PrinterSimulator(num_printers=2, time_scale=1.0, mode="discrete")
+    sim.add_job(Job("J1", "PLA", 100, 2))
+    sim.add_job(Job("J2", "ABS", 50, 1))
+    sim.add_job(Job("J3", "PETG", 30, 1))
+    sim.add_job(Job("J4", "PLA", 3600, 3))
+    sim.run_until_complete()
+    return sim
+
+
+def test_discrete_schedule_on_virtual_clock():
+    sim = run_discrete()
+    report = sim.get_report()
+    start = sim.simulation_start_time
+    jobs = {j['id']: j for j in report['jobs']}
+
+    assert all(j['status'] == "completed" for j in jobs.values())
+    # J2 and J3 start immediately, J1 takes the printer freed by J3 at t=30,
+    # J4 the one freed by J2 at t=50
+    assert jobs['J2']['started_at'] - start == 0
+    assert jobs['J3']['started_at'] - start == 0
+    assert jobs['J1']['started_at'] - start == 30
+    assert jobs['J4']['started_at'] - start == 50
+    assert jobs['J4']['run_time_real'] == 3600
+    assert report['metrics']['simulation_duration_seconds'] == 3650
+    assert report['simulation_config']['mode'] == "discrete"
+
+
+def test_discrete_is_deterministic():
+    first, second = run_discrete(), run_discrete()
+
+    def offsets(sim):
+        return sorted(
+            (job.id, job.started_at - sim.simulation_start_time, job.completed_at - sim.simulation_start_time)
+            for job in sim.all_jobs.values()
+        )
+
+    assert offsets(first) == offsets(second)
+
+
+def test_discrete_timeout_is_simulated_seconds():
+    sim = PrinterSimulator(num_printers=1, time_scale=1.0, mode="discrete")
+    sim.add_job(Job("short", "PLA", 10, 1))
+    sim.add_job(Job("long", "PLA", 1000, 2))
+    sim.run_until_complete(timeout=100)
+
+    assert sim.all_jobs['short'].status == "completed"
+    assert sim.all_jobs['long'].status == "started"
+
+
+def test_discrete_run_after_timeout_finishes_in_flight_jobs():
+    sim = PrinterSimulator(num_printers=1, time_scale=1.0, mode="discrete")
+    sim.add_jobs(Job(f"j{i}", "PLA", 100, 1) for i in range(3))
+    sim.run_until_complete(timeout=150)
+    status = sim.get_status()
+    assert (status['completed'], status['running'], status['queued']) == (1, 1, 1)
+
+    sim.run_until_complete()
+    status = sim.get_status()
+    assert (status['completed'], status['running'], status['active_printers']) == (3, 0, 0)
+    assert sim.all_done_event.is_set()
+    # j1 had 50s left when the first run stopped, and the second run
+    # continues on the first run's clock
+    assert sim.all_jobs["j1"].get_run_time() == 100
+    assert sim.all_jobs["j2"].started_at - sim.all_jobs["j1"].completed_at == 0
+    assert sim.all_jobs["j2"].started_at - sim.simulation_start_time == 200
+    assert all(job.get_run_time() > 0 for job in sim.all_jobs.values())
+    assert sim.get_report()['metrics']['simulation_duration_seconds'] == 300
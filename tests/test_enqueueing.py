@@ -11,4 +11,74 @@ def test_enqueueing():
     sim.add_job(Job("J2", "ABS", 1, 2))
 
     assert len(sim.all_jobs) == 2
-    assert sim.job_queue.get_queue_size() == 2
\ No newline at end of file
+    assert sim.job_queue.get_queue_size() == 2
+
+def test_blocking_get_wakes_on_add_and_close():
+    import threading
+    import time
+    from queue_manager import JobQueue
+
+    queue = JobQueue()
+    assert queue.get(timeout=0.01) is None
+
+    results = []
+    consumer = threading.Thread(target=lambda: results.append(queue.get(timeout=5)))
+    consumer.start()
+    time.sleep(0.05)
+    queue.add_job(Job("J1", "PLA", 1, 1))
+    consumer.join(timeout=1)
+    assert [job.id for job in results] == ["J1"]
+
+    consumer = threading.Thread(target=lambda: results.append(queue.get()))
+    consumer.start()
+    time.sleep(0.05)
+    queue.close()
+    consumer.join(timeout=1)
+    assert not consumer.is_alive()
+    assert results[-1] is None
+
+
+def test_status_counters_follow_transitions():
+    sim = PrinterSimulator(num_printers=2, time_scale=0.01, mode="discrete")
+    for i in range(5):
+        sim.add_job(Job(f"J{i}", "PLA", 1, 1))
+    sim.cancel_job("J4")
+
+    status = sim.get_status()
+    assert (status['total_jobs'], status['queued'], status['cancelled']) == (5, 4, 1)
+    assert status['queue_size'] == 4
+
+    sim.run_until_complete()
+
+    status = sim.get_status()
+    assert (status['queued'], status['running'], status['completed'], status['cancelled']) == (0, 0, 4, 1)
+    assert status['active_printers'] == 0
+
+
+def test_concurrent_producers_and_cancels_keep_counts_consistent():
+    import threading
+
+    sim = PrinterSimulator(num_printers=8, time_scale=0.0)
+    sim.start_simulation()
+
+    def produce(p):
+        for i in range(200):
+            sim.add_job(Job(f"P{p}-{i}", "PLA", 1, i % 3))
+            if i % 10 == 0:
+                sim.cancel_job(f"P{p}-{i}")
+
+    producers = [threading.Thread(target=produce, args=(p,)) for p in range(4)]
+    for thread in producers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+
+    assert sim.all_done_event.wait(10)
+    sim.stop_simulation()
+
+    status = sim.get_status()
+    assert status['completed'] + status['cancelled'] == 800
+    assert status['completed'] == len(sim.completed_jobs)
+    assert status['cancelled'] == len(sim.cancelled_jobs)
+    assert (status['queued'], status['running']) == (0, 0)
+    assert sum(p.total_jobs_completed for p in sim.printers) == status['completed']
@@ -0,0 +1,66 @@
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from events import EventLog, DEBUG, INFO, WARNING, event_log
+from simulator import PrinterSimulator
+from models import Job
+
+
+def test_emit_is_disabled_without_sinks_or_below_level():
+    log = EventLog(level=INFO)
+    log.emit(WARNING, "ignored")
+    assert len(log._buffer) == 0
+
+    batches = []
+    log.add_sink(batches.append)
+    log.emit(DEBUG, "too_verbose")
+    log.emit(INFO, "job_cancelled", job="J1")
+    log.flush()
+
+    events = [event for batch in batches for event in batch]
+    assert [(e['event'], e['level'], e['job']) for e in events] == [("job_cancelled", "INFO", "J1")]
+
+
+def test_each_sink_gets_its_own_level():
+    log = EventLog(level=INFO, flush_interval=60)
+    console, debug_file = [], []
+    log.add_sink(console.append, level=INFO)
+    log.add_sink(debug_file.append, level=DEBUG)
+    assert log.level == DEBUG
+
+    log.emit(DEBUG, "job_enqueued", job="J1")
+    log.emit(INFO, "job_dispatched", job="J1")
+    log.flush()
+    assert [e['event'] for batch in console for e in batch] == ["job_dispatched"]
+    assert [e['event'] for batch in debug_file for e in batch] == ["job_enqueued", "job_dispatched"]
+
+    log.remove_sinks()
+    assert log.level == INFO
+
+
+def test_ring_buffer_drops_oldest():
+    log = EventLog(level=DEBUG, capacity=3, flush_interval=60)
+    batches = []
+    log._sinks.append((batches.append, DEBUG))
+    for i in range(5):
+        log.emit(INFO, "tick", n=i)
+    log.flush()
+
+    assert [event['n'] for event in batches[0]] == [2, 3, 4]
+    assert log.dropped == 2
+
+
+def test_simulation_emits_lifecycle_events():
+    batches = []
+    event_log.add_sink(batches.append, level=DEBUG)
+    try:
+        sim = PrinterSimulator(num_printers=1, time_scale=0.01, mode="discrete")
+        sim.add_job(Job("J1", "PLA", 1, 1))
+        sim.run_until_complete()
+    finally:
+        event_log.remove_sinks()
+        event_log.level = INFO
+
+    names = [event['event'] for batch in batches for event in batch if event.get('job') == "J1"]
+    assert names == ["job_enqueued", "job_dequeued", "job_started", "job_dispatched",
+                     "job_completed", "job_finished"]
@@ -0,0 +1,64 @@
+import sys
+import os
+import json
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from fleet import build_fleet, load_fleet
+from simulator import PrinterSimulator
+from models import Job
+
+
+FLEET = {"printers": [
+    {"class": "fast", "count": 2, "speed": 2.0, "materials": ["PLA", "PETG"]},
+    {"class": "flex", "count": 1, "materials": ["TPU"]},
+]}
+
+
+def test_build_fleet(tmp_path):
+    path = tmp_path / "fleet.json"
+    path.write_text(json.dumps(FLEET))
+    printers = load_fleet(str(path))
+
+    assert [(p.id, p.printer_class, p.speed) for p in printers] == [(0, "fast", 2.0), (1, "fast", 2.0), (2, "flex", 1.0)]
+    assert printers[0].can_print("PLA") and not printers[0].can_print("TPU")
+
+    with pytest.raises(ValueError):
+        build_fleet({"printers": [{"class": "broken", "speed": 0}]})
+    with pytest.raises(ValueError):
+        build_fleet({"printers": []})
+
+
+def test_discrete_dispatch_respects_capabilities_and_speed():
+    sim = PrinterSimulator(time_scale=1.0, mode="discrete", fleet=build_fleet(FLEET))
+    with pytest.raises(ValueError):
+        sim.add_job(Job("nylon", "Nylon", 100, 1))
+
+    sim.add_jobs([Job("tpu1", "TPU", 100, 1), Job("tpu2", "TPU", 100, 1)]
+                 + [Job(f"pla{i}", "PLA", 100, 2) for i in range(4)])
+    sim.run_until_complete()
+
+    printer_of = {}
+    for printer_id, shard in sim._completed_by_printer.items():
+        for job in shard:
+            printer_of[job.id] = printer_id
+    assert printer_of["tpu1"] == printer_of["tpu2"] == 2
+    assert all(printer_of[f"pla{i}"] in (0, 1) for i in range(4))
+    assert all(sim.all_jobs[f"pla{i}"].get_run_time() == 50 for i in range(4))
+
+    metrics = sim.get_report()['metrics']
+    assert metrics['makespan_seconds'] == 200
+    assert metrics['printer_utilization']['Printer-2']['class'] == "flex"
+    assert metrics['class_utilization']['fast']['printers'] == 2
+    assert metrics['class_utilization']['fast']['jobs_completed'] == 4
+    assert metrics['class_utilization']['flex']['utilization_percentage'] == 100
+
+
+def test_threaded_restricted_fleet_wakes_eligible_printers():
+    sim = PrinterSimulator(time_scale=0.001, fleet=build_fleet(FLEET))
+    sim.start_simulation()
+    for i in range(20):
+        sim.add_job(Job(f"J{i}", "TPU" if i % 4 == 0 else "PLA", 5, 1))
+    assert sim.all_done_event.wait(10)
+    sim.stop_simulation()
+    assert sim.get_status()['completed'] == 20
+    assert sim.printers[2].total_jobs_completed == 5
@@ -0,0 +1,51 @@
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from metrics import Histogram
+from instrumentation import combine
+from simulator import PrinterSimulator
+from models import Job
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = Histogram()
+    for micros in [0.5] * 50 + [3] * 40 + [1000] * 10:
+        histogram.add(micros / 1e6)
+
+    stats = histogram.to_dict()
+    assert stats['count'] == 100
+    assert stats['buckets_us'] == {'<1': 50, '<4': 40, '<1024': 10}
+    assert stats['p50'] == 1e-6 and stats['p90'] == 4e-6
+    assert stats['p99'] == stats['max'] == 1000e-6
+
+    merged = combine({'a': stats, 'b': stats, 'empty': Histogram().to_dict()})
+    assert merged['count'] == 200 and merged['buckets_us']['<4'] == 80
+    assert merged['p50'] == 1e-6 and merged['max'] == 1000e-6
+
+
+def test_profiled_runs_report_instrumentation():
+    for mode in ('threaded', 'discrete'):
+        sim = PrinterSimulator(num_printers=3, time_scale=0.0001, mode=mode, profile=True)
+        sim.add_jobs(Job(f"J{i}", "PLA", 1, i % 3 + 1) for i in range(60))
+        sim.add_job(Job("late", "PLA", 1, 1))
+        assert sim.cancel_job("late")
+        sim.run_until_complete(timeout=30)
+        assert sim.get_status()['completed'] == 60
+
+        instrumentation = sim.get_report()['instrumentation']
+        assert instrumentation['lock_wait']['queue']['count'] > 0
+        assert instrumentation['queue_ops']['add_jobs']['count'] == 1
+        assert instrumentation['queue_ops']['cancel_job']['count'] == 1
+        assert instrumentation['report']['job_reports']['count'] == 1
+        if mode == 'threaded':
+            assert set(instrumentation['idle_wait']) == {'Printer-0', 'Printer-1', 'Printer-2'}
+        else:
+            assert instrumentation['queue_ops']['get_next_job']['count'] >= 60
+
+
+def test_instrumentation_is_off_by_default():
+    sim = PrinterSimulator(num_printers=1, time_scale=0.0001, mode='discrete')
+    sim.add_job(Job("J1", "PLA", 1, 1))
+    sim.run_until_complete()
+    assert sim.instrumentation is None
+    assert 'instrumentation' not in sim.get_report()
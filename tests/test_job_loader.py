@@ -0,0 +1,89 @@
+import sys
+import os
+import json
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import job_loader
+from job_loader import JobValidationError, iter_job_records, iter_jobs
+from queue_manager import JobQueue
+from simulator import PrinterSimulator
+from models import Job
+
+
+def records(n):
+    return [{"id": f"J{i}", "material": "PLA", "est_time": 10 + i, "priority": i % 3 + 1,
+             "tags": ["a]", {"b": "},"}]} for i in range(n)]
+
+
+def test_json_array_is_streamed_across_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(job_loader, "READ_CHUNK_SIZE", 5)
+    path = tmp_path / "jobs.json"
+    path.write_text(json.dumps(records(40), indent=2))
+
+    assert list(iter_job_records(str(path))) == records(40)
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 20))
+def test_numbers_split_across_chunks(tmp_path, monkeypatch, chunk_size):
+    monkeypatch.setattr(job_loader, "READ_CHUNK_SIZE", chunk_size)
+    path = tmp_path / "values.json"
+    path.write_text("[12345, 678901 ,1e10, 2.5 ,-7]")
+
+    assert list(iter_job_records(str(path))) == [12345, 678901, 1e10, 2.5, -7]
+
+
+def test_jsonl_records_are_validated(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    lines = [json.dumps(r) for r in records(3)]
+    lines.insert(1, json.dumps({"id": "bad", "material": "PLA", "est_time": 0, "priority": 1}))
+    lines.append(json.dumps({"id": "noprio", "material": "PLA", "est_time": 5}))
+    lines.append(json.dumps({"id": "baddeadline", "material": "PLA", "est_time": 5, "priority": 1,
+                             "deadline": "soon"}))
+    lines.append(json.dumps({"id": "due", "material": "PLA", "est_time": 5, "priority": 1, "deadline": 100}))
+    path.write_text("\n".join(lines) + "\n")
+
+    errors = []
+    jobs = list(iter_jobs(str(path), errors))
+
+    assert [job.id for job in jobs] == ["J0", "J1", "J2", "due"]
+    assert [job.deadline for job in jobs] == [None, None, None, 100.0]
+    assert [e.position for e in errors] == [2, 5, 6]
+    with pytest.raises(JobValidationError):
+        list(iter_jobs(str(path)))
+
+
+def test_non_finite_values_are_rejected(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    # Python's json module writes and reads these as NaN / Infinity literals
+    bad = [{"est_time": float('nan')}, {"est_time": float('inf')}, {"est_time": "inf"},
+           {"deadline": float('nan')}, {"deadline": float('-inf')}]
+    lines = [json.dumps({"id": f"bad{i}", "material": "PLA", "est_time": 5, "priority": 1, **fields})
+             for i, fields in enumerate(bad)]
+    lines.append(json.dumps({"id": "ok", "material": "PLA", "est_time": 5, "priority": 1}))
+    path.write_text("\n".join(lines) + "\n")
+
+    errors = []
+    assert [job.id for job in iter_jobs(str(path), errors)] == ["ok"]
+    assert [e.position for e in errors] == [1, 2, 3, 4, 5]
+
+
+def test_bulk_add_keeps_priority_fifo_order():
+    queue = JobQueue()
+    queue.add_job(Job("first", "PLA", 1, 2))
+    queue.add_jobs(Job(f"J{i}", "PLA", 1, i % 2 + 1) for i in range(6))
+    queue.add_jobs([Job("late", "PLA", 1, 1)])
+
+    order = [queue.get_next_job().id for _ in range(queue.get_queue_size())]
+    assert order == ["J0", "J2", "J4", "late", "first", "J1", "J3", "J5"]
+
+
+def test_simulator_add_jobs_in_batches(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    path.write_text("".join(json.dumps(r) + "\n" for r in records(25)))
+
+    sim = PrinterSimulator(num_printers=2, time_scale=0.01, mode="discrete")
+    assert sim.add_jobs(iter_jobs(str(path)), batch_size=7) == 25
+    assert sim.get_status()['queued'] == 25
+
+    sim.run_until_complete()
+    assert sim.get_status()['completed'] == 25
@@ -22,3 +22,18 @@ def test_priority_order():
 
     print(f"Order of START: {order}")
     assert order == ["J1", "J3", "J2"]
+
+
+def test_queue_fifo_within_priority():
+    from queue_manager import JobQueue
+
+    queue = JobQueue()
+    for i in range(30):
+        queue.add_job(Job(f"J{i}", "PLA", 1, 3 - i % 3))
+
+    order = [queue.get_next_job().id for _ in range(30)]
+
+    assert order[:10] == [f"J{i}" for i in range(2, 30, 3)]
+    assert order[10:20] == [f"J{i}" for i in range(1, 30, 3)]
+    assert order[20:] == [f"J{i}" for i in range(0, 30, 3)]
+    assert queue.get_next_job() is None
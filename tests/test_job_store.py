@@ -0,0 +1,60 @@
+import sys
+import os
+import json
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from job_store import JournalJobStore
+
+
+def make_job(job_id, priority=1):
+    return {'id': job_id, 'material': 'PLA', 'est_time': 60, 'priority': priority,
+            'created_at': 1.0, 'status': 'queued'}
+
+
+def test_journal_replays_over_snapshot(tmp_path):
+    snapshot = tmp_path / "state.json"
+    snapshot.write_text(json.dumps({'jobs': [make_job("A")], 'num_printers': 3, 'time_scale': 0.5}))
+    store = JournalJobStore(str(snapshot), str(tmp_path / "journal.jsonl"))
+
+    store.append([{'op': 'add', 'job': make_job("B")}, {'op': 'cancel', 'id': "A"}])
+    store.append([{'op': 'status', 'id': "B", 'status': 'completed', 'started_at': 2.0, 'completed_at': 3.0}])
+    with open(store.journal_path, 'a') as f:
+        f.write('{"op": "add", "job": {"id"')
+
+    jobs, config = JournalJobStore(str(snapshot), store.journal_path).load()
+
+    assert [(job['id'], job['status']) for job in jobs] == [("A", "cancelled"), ("B", "completed")]
+    assert jobs[1]['completed_at'] == 3.0
+    assert config == {'num_printers': 3, 'time_scale': 0.5}
+
+
+def test_compaction_folds_journal_into_snapshot(tmp_path):
+    store = JournalJobStore(str(tmp_path / "state.json"), str(tmp_path / "journal.jsonl"), compact_every=3)
+    store.append([{'op': 'config', 'num_printers': 4}, {'op': 'add', 'job': make_job("A")}])
+    assert not store.needs_compaction()
+    store.append([{'op': 'add', 'job': make_job("B")}])
+
+    assert not os.path.exists(store.journal_path)
+    assert store.journal_records == 0
+
+    reopened = JournalJobStore(store.snapshot_path, store.journal_path)
+    assert [job['id'] for job in reopened.jobs] == ["A", "B"]
+    assert reopened.get_config() == {'num_printers': 4}
+
+
+def test_sqlite_store_queries(tmp_path):
+    from job_store import SqliteJobStore, open_store
+
+    store = open_store(f"sqlite:{tmp_path / 'jobs.db'}", "unused", "unused")
+    assert isinstance(store, SqliteJobStore)
+    store.set_config(3, 0.5)
+    store.add_jobs([make_job("low", 3), make_job("high", 1), make_job("mid", 2), make_job("high", 1)])
+    store.cancel("mid")
+    store.update_statuses([("high", "completed", 2.0, 3.0)])
+
+    reopened = SqliteJobStore(str(tmp_path / 'jobs.db'))
+    assert reopened.get_config() == {'num_printers': 3, 'time_scale': 0.5}
+    assert reopened.count() == 3
+    assert reopened.count_by_status() == {'queued': 1, 'cancelled': 1, 'completed': 1}
+    assert [job['id'] for job in reopened.iter_queued()] == ["low"]
+    assert reopened.get("high")['completed_at'] == 3.0
+    assert reopened.get("missing") is None
@@ -0,0 +1,59 @@
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from job_table import JobTable
+from simulator import PrinterSimulator
+from models import Job
+
+
+def test_job_view_round_trips_fields():
+    table = JobTable()
+    view = table.add(Job("J1", "PLA", 60, 2))
+
+    assert (view.id, view.material, view.est_time, view.priority, view.status) == ("J1", "PLA", 60, 2, "queued")
+    assert view.started_at is None and view.get_wait_time() is None
+
+    view.start_printing(now=view.created_at + 5)
+    view.complete_printing(now=view.created_at + 65)
+
+    row = table["J1"]
+    assert row.status == "completed"
+    assert row.get_wait_time() == 5
+    assert row.get_run_time() == 60
+    assert table.materials == ["PLA"]
+
+
+def test_table_storage_matches_object_storage():
+    def run(storage):
+        sim = PrinterSimulator(num_printers=2, time_scale=1.0, mode="discrete", storage=storage)
+        for i in range(20):
+            job = Job(f"J{i}", ["PLA", "ABS"][i % 2], 10 + i, i % 3 + 1)
+            job.created_at = 1000.0
+            sim.add_job(job)
+        sim.cancel_job("J5")
+        sim.run_until_complete()
+        report = sim.get_report()
+        start = sim.simulation_start_time
+        return sorted(
+            (j['id'], j['status'], j['started_at'] and j['started_at'] - start, j['run_time'])
+            for j in report['jobs']
+        ), report['metrics']['completed_jobs']
+
+    assert run('table') == run('objects')
+
+
+def test_duplicate_id_replaces_row_like_a_dict():
+    table = JobTable()
+    table.add(Job("J1", "PLA", 60, 2))
+    table.add(Job("J2", "PLA", 10, 1))
+    view = table.add(Job("J1", "ABS", 30, 1))
+
+    assert len(table) == 2 and list(table.keys()) == ["J1", "J2"]
+    assert table["J1"] == view
+    assert (view.material, view.est_time, view.priority) == ("ABS", 30, 1)
+
+    for storage in ('objects', 'table'):
+        sim = PrinterSimulator(num_printers=1, mode='discrete', storage=storage)
+        sim.add_job(Job("dup", "PLA", 1, 1))
+        sim.add_job(Job("dup", "PLA", 1, 1))
+        assert sim.get_status()['total_jobs'] == 1
@@ -0,0 +1,61 @@
+import sys
+import os
+import random
+import statistics
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from metrics import MetricsAccumulator, P2Quantile, RunningStats
+from simulator import PrinterSimulator
+from models import Job
+
+
+def test_running_stats_matches_batch():
+    rng = random.Random(1)
+    values = [rng.expovariate(0.1) for _ in range(5000)]
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+
+    assert stats.count == 5000
+    assert abs(stats.mean - statistics.fmean(values)) < 1e-9
+    assert abs(stats.variance - statistics.pvariance(values)) < 1e-6
+    assert (stats.min, stats.max) == (min(values), max(values))
+
+
+def test_p2_quantiles_approximate_sorted_values():
+    rng = random.Random(2)
+    values = [rng.uniform(0, 100) for _ in range(20000)]
+    ordered = sorted(values)
+    for p in (0.5, 0.9, 0.99):
+        estimator = P2Quantile(p)
+        for value in values:
+            estimator.add(value)
+        assert abs(estimator.value - ordered[int(p * len(values))]) < 1.0
+
+
+def test_p2_small_samples_are_exact():
+    estimator = P2Quantile(0.5)
+    for value in (5, 1, 3):
+        estimator.add(value)
+    assert estimator.value == 3
+
+
+def test_report_includes_tail_percentiles():
+    sim = PrinterSimulator(num_printers=2, time_scale=1.0, mode="discrete")
+    for i in range(50):
+        sim.add_job(Job(f"J{i}", "PLA", 10 + i, 1))
+    sim.run_until_complete()
+
+    metrics = sim.get_report()['metrics']
+    run_times = sorted(job.get_run_time() for job in sim.completed_jobs)
+
+    assert abs(metrics['avg_run_time'] - statistics.fmean(run_times)) < 1e-9
+    assert abs(metrics['total_processing_time'] - sum(run_times)) < 1e-6
+    assert metrics['min_run_time'] == 10 and metrics['max_run_time'] == 59
+    assert metrics['median_wait_time'] <= metrics['p90_wait_time'] <= metrics['p99_wait_time'] <= metrics['max_wait_time']
+    assert abs(metrics['p90_run_time'] - run_times[45]) <= 2
+
+
+def test_accumulator_ignores_missing_values():
+    accumulator = MetricsAccumulator()
+    accumulator.record(None, None)
+    assert accumulator.to_dict() == {}
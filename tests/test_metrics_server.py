@@ -0,0 +1,50 @@
+import sys
+import os
+import urllib.error
+import urllib.request
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import pytest
+from metrics_server import MetricsServer, render
+from simulator import PrinterSimulator
+from models import Job
+
+
+def _samples(text):
+    return dict(line.rsplit(' ', 1) for line in text.splitlines() if not line.startswith('#'))
+
+
+def test_render_reports_counters():
+    sim = PrinterSimulator(num_printers=2, time_scale=0.0001, mode='discrete')
+    sim.add_jobs(Job(f"J{i}", "PLA", 1, i % 3 + 1) for i in range(9))
+    assert sim.cancel_job("J8")
+
+    samples = _samples(render(sim))
+    assert samples['printer_sim_jobs_queued{priority="1"}'] == '3'
+    assert samples['printer_sim_jobs_queued{priority="3"}'] == '2'
+    assert samples['printer_sim_jobs_added_total'] == '9'
+    assert samples['printer_sim_jobs_cancelled_total'] == '1'
+
+    sim.run_until_complete()
+    samples = _samples(render(sim))
+    assert samples['printer_sim_jobs_queued{priority="1"}'] == '0'
+    assert samples['printer_sim_jobs_completed_total'] == '8'
+    assert samples['printer_sim_jobs_running'] == '0'
+    assert samples['printer_sim_printer_busy{printer="0",class="default"}'] == '0'
+    assert samples['printer_sim_job_wait_seconds_count'] == '8'
+    assert samples['printer_sim_job_wait_seconds_bucket{le="+Inf"}'] == '8'
+
+
+def test_server_serves_metrics():
+    sim = PrinterSimulator(num_printers=1, time_scale=0.0001, mode='discrete')
+    sim.add_job(Job("J1", "PLA", 1, 1))
+    server = MetricsServer(sim, port=0).start()
+    try:
+        with urllib.request.urlopen(server.url) as response:
+            assert response.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+            assert 'printer_sim_jobs_queued{priority="1"} 1' in response.read().decode()
+
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(server.url.replace('/metrics', '/other'))
+        assert error.value.code == 404
+    finally:
+        server.stop()
@@ -0,0 +1,44 @@
+import sys
+import os
+import csv
+import json
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from simulator import PrinterSimulator
+from models import Job
+
+
+def make_sim():
+    sim = PrinterSimulator(num_printers=2, time_scale=1.0, mode="discrete")
+    for i in range(25):
+        sim.add_job(Job(f"J{i}", "PLA", 10 + i, i % 3 + 1))
+    sim.cancel_job("J3")
+    sim.run_until_complete()
+    return sim
+
+
+def test_jsonl_report_streams_rows_and_summary(tmp_path):
+    sim = make_sim()
+    path = tmp_path / "report.jsonl"
+    sim.save_report(str(path), "jsonl", write_summary=True, chunk_size=7)
+
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert rows == json.loads(json.dumps(sim.get_report()['jobs']))
+
+    summary = json.loads((tmp_path / "report.jsonl.summary.json").read_text())
+    assert summary['metrics']['completed_jobs'] == 24
+    assert summary['simulation_config']['mode'] == "discrete"
+
+
+def test_streaming_csv_matches_report(tmp_path):
+    sim = make_sim()
+    path = tmp_path / "report.csv"
+    sim.save_report(str(path), "csv", write_summary=False, chunk_size=4)
+
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f))
+
+    jobs = sim.get_report()['jobs']
+    assert [row['id'] for row in rows] == [job['id'] for job in jobs]
+    assert rows[0].keys() == jobs[0].keys()
+    assert rows[3]['status'] == "cancelled" and rows[3]['started_at'] == ""
+    assert not (tmp_path / "report.csv.summary.json").exists()
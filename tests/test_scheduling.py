@@ -0,0 +1,70 @@
+import sys
+import os
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from queue_manager import JobQueue, AgingPolicy, WeightedFairPolicy
+from simulator import PrinterSimulator
+from models import Job
+
+
+def drain(queue):
+    order = []
+    while not queue.is_empty():
+        order.append(queue.get_next_job().id)
+    return order
+
+
+def test_sjf_and_edf_order():
+    queue = JobQueue('sjf')
+    queue.add_jobs([Job("long", "PLA", 300, 1), Job("short", "PLA", 10, 3), Job("mid", "PLA", 60, 2)])
+    assert drain(queue) == ["short", "mid", "long"]
+
+    queue = JobQueue('edf')
+    queue.add_job(Job("none", "PLA", 10, 1))
+    queue.add_job(Job("late", "PLA", 10, 3, deadline=2000.0))
+    queue.add_job(Job("soon", "PLA", 10, 3, deadline=1000.0))
+    assert drain(queue) == ["soon", "late", "none"]
+
+
+def test_aging_lets_old_low_priority_jobs_through():
+    queue = JobQueue(AgingPolicy(aging_interval=60))
+    old = Job("old-low", "PLA", 10, 3)
+    old.created_at -= 150
+    queue.add_job(Job("new-high", "PLA", 10, 1))
+    queue.add_job(Job("new-medium", "PLA", 10, 2))
+    queue.add_job(old)
+    # 150s of waiting is worth 2.5 levels, so priority 3 ranks as 0.5
+    assert drain(queue) == ["old-low", "new-high", "new-medium"]
+
+
+def test_weighted_fair_queuing_shares_by_weight():
+    queue = JobQueue(WeightedFairPolicy({1: 3, 3: 1}))
+    queue.add_jobs([Job(f"high{i}", "PLA", 10, 1) for i in range(9)])
+    queue.add_jobs([Job(f"low{i}", "PLA", 10, 3) for i in range(3)])
+    order = drain(queue)
+    # Three high-priority jobs for every low-priority one
+    assert [job_id[:3] for job_id in order[:8]] == ["hig", "hig", "hig", "low"] * 2
+
+
+def test_cancel_compaction_keeps_policy_order():
+    queue = JobQueue('sjf')
+    jobs = [Job(f"J{i}", "PLA", 1000 - i, 1) for i in range(300)]
+    queue.add_jobs(jobs)
+    for job in jobs[:250]:
+        queue.cancel_job(job.id)
+    assert drain(queue) == [f"J{i}" for i in range(299, 249, -1)]
+
+
+def test_simulator_policy_selection():
+    with pytest.raises(ValueError):
+        PrinterSimulator(num_printers=1, policy="random")
+
+    sim = PrinterSimulator(num_printers=1, time_scale=1.0, mode="discrete", policy="edf", storage="table")
+    sim.add_job(Job("later", "PLA", 10, 1, deadline=5000.0))
+    sim.add_job(Job("first", "PLA", 10, 2, deadline=100.0))
+    sim.run_until_complete()
+
+    report = sim.get_report()
+    assert report['simulation_config']['policy'] == "edf"
+    assert [job.id for job in sim.completed_jobs] == ["first", "later"]
+    assert sim.all_jobs["first"].deadline == 100.0
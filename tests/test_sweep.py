@@ -0,0 +1,47 @@
+import sys
+import os
+import json
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import sweep
+
+
+def write_jobs(tmp_path):
+    path = tmp_path / "jobs.json"
+    path.write_text(json.dumps([
+        {"id": f"J{i}", "material": "PLA", "est_time": 10 * (i % 4 + 1), "priority": i % 3 + 1}
+        for i in range(40)
+    ]))
+    return str(path)
+
+
+def test_expand_grid():
+    configs = sweep.expand_grid({'num_printers': [1, 2], 'time_scale': [1.0, 0.5]})
+    assert configs == [
+        {'num_printers': 1, 'time_scale': 1.0}, {'num_printers': 1, 'time_scale': 0.5},
+        {'num_printers': 2, 'time_scale': 1.0}, {'num_printers': 2, 'time_scale': 0.5},
+    ]
+    with pytest.raises(ValueError):
+        sweep.expand_grid({'printers': [1]})
+
+
+def test_run_sweep_in_process_pool(tmp_path):
+    jobs_file = write_jobs(tmp_path)
+    configs = sweep.expand_grid({'num_printers': [1, 2, 4], 'jobs_file': [jobs_file]})
+    results = sweep.run_sweep(configs, max_workers=2)
+
+    assert [r['config']['num_printers'] for r in results] == [1, 2, 4]
+    assert all(r['config']['mode'] == 'discrete' for r in results)
+    assert all(r['metrics']['completed_jobs'] == 40 for r in results)
+    # More printers never make the queue wait longer on the discrete clock
+    waits = [r['metrics']['avg_wait_time'] for r in results]
+    assert waits[0] > waits[1] > waits[2]
+    # Matches a run in this process
+    assert results[1]['metrics']['total_processing_time'] == sweep.run_config(configs[1])['metrics']['total_processing_time']
+
+    table = sweep.comparison_table(results).splitlines()
+    assert len(table) == 2 + 3
+    assert 'p99 wait' in table[0]
+
+    sweep.save_results(results, str(tmp_path / "sweep.csv"))
+    assert len((tmp_path / "sweep.csv").read_text().splitlines()) == 4
@@ -0,0 +1,42 @@
+import sys
+import os
+import math
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from simulator import PrinterSimulator
+from models import Job
+
+pytest.importorskip("numpy")
+
+
+def assert_same(expected, actual):
+    assert type(expected) is type(actual) or {type(expected), type(actual)} <= {int, float}
+    if isinstance(expected, dict):
+        assert list(expected) == list(actual)
+        for key in expected:
+            assert_same(expected[key], actual[key])
+    elif isinstance(expected, list):
+        assert len(expected) == len(actual)
+        for left, right in zip(expected, actual):
+            assert_same(left, right)
+    elif isinstance(expected, float):
+        assert math.isclose(expected, actual, rel_tol=1e-12)
+    else:
+        assert expected == actual
+
+
+@pytest.mark.parametrize("storage", ["objects", "table"])
+def test_numpy_report_matches_python(storage):
+    sim = PrinterSimulator(num_printers=3, time_scale=0.5, mode="discrete", storage=storage)
+    for i in range(40):
+        sim.add_job(Job(f"J{i}", ["PLA", "ABS", "TPU"][i % 3], 5 + i % 7, i % 3 + 1))
+    sim.cancel_job("J7")
+    sim.run_until_complete(timeout=20)
+
+    python_report = sim.get_report(use_numpy=False)
+    numpy_report = sim.get_report(use_numpy=True)
+
+    statuses = {job['status'] for job in python_report['jobs']}
+    assert {'queued', 'started', 'completed', 'cancelled'} <= statuses
+    assert python_report['jobs'] == numpy_report['jobs']
+    assert_same(python_report, numpy_report)
@@ -0,0 +1,80 @@
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from queue_manager import WorkStealingQueue
+from simulator import PrinterSimulator
+from fleet import build_fleet
+from models import Job, Printer
+
+
+def test_local_order_stealing_and_cancel():
+    printers = [Printer(id=i) for i in range(2)]
+    queue = WorkStealingQueue(printers)
+    queue.add_jobs(Job(f"J{i}", "PLA", 1, 3 - i % 3) for i in range(9))
+
+    assert [job.id for job in queue.jobs] == ["J2", "J5", "J8", "J1", "J4", "J7", "J0", "J3", "J6"]
+    assert queue.cancel_job("J5") and not queue.cancel_job("J5")
+
+    # Printer 1 drains its own queue first, each in policy order, then steals
+    own = set(job.id for job in queue._locals[1].jobs)
+    taken = [queue.get_next_job(printer=1).id for _ in range(queue.get_queue_size())]
+    assert set(taken[:len(own)]) == own
+    assert sorted(taken) == sorted(f"J{i}" for i in range(9) if i != 5)
+    assert queue.get_next_job(printer=1) is None
+
+
+def test_idle_printer_gets_new_job():
+    printers = [Printer(id=i) for i in range(4)]
+    queue = WorkStealingQueue(printers)
+    queue._idle.add(3)
+    queue.add_job(Job("J1", "PLA", 1, 1))
+    assert queue._locals[3].get_queue_size() == 1
+    assert queue.get(timeout=0.1, printer=0).id == "J1"
+    assert queue.get(timeout=0.01, printer=0) is None
+
+
+def test_stealing_runs_match_shared_queue():
+    def run(dispatch, mode):
+        sim = PrinterSimulator(num_printers=4, time_scale=0.0001, mode=mode, dispatch=dispatch)
+        sim.add_jobs(Job(f"J{i}", "PLA", 1 + i % 7, i % 3 + 1) for i in range(300))
+        sim.cancel_job("J7")
+        sim.run_until_complete(timeout=30)
+        return sim.get_status()
+
+    for mode in ('discrete', 'threaded'):
+        status = run('stealing', mode)
+        assert status == run('shared', mode)
+        assert status['completed'] == 299 and status['cancelled'] == 1
+
+
+def test_stealing_respects_printer_capabilities():
+    fleet = build_fleet({"printers": [{"count": 3, "materials": ["PLA"]}, {"count": 1, "materials": ["TPU"]}]})
+    sim = PrinterSimulator(time_scale=0.0001, mode='threaded', fleet=fleet, dispatch='stealing', assignment='material')
+    sim.add_jobs(Job(f"J{i}", "TPU" if i % 4 == 0 else "PLA", 1, 1) for i in range(80))
+    sim.run_until_complete(timeout=30)
+
+    assert sim.get_status()['completed'] == 80
+    on_tpu_printer = {job.id for job in sim._completed_by_printer[3]}
+    assert on_tpu_printer == {job.id for job in sim.completed_jobs if job.material == "TPU"}
+
+
+def test_wfq_state_is_shared_across_local_queues():
+    printers = [Printer(id=i) for i in range(4)]
+    queue = WorkStealingQueue(printers, policy='wfq')
+    queue.add_jobs(Job(f"J{i}", "PLA", 10, i % 3 + 1) for i in range(2000))
+    order = [job.id for job in queue.jobs]
+    last_finish = dict(queue.policy._last_finish)
+
+    # Enough cancellations to compact every local queue's tombstones
+    for i in range(2000):
+        if i % 4 != 3:
+            assert queue.cancel_job(f"J{i}")
+    assert all(len(local._heap) < 500 for local in queue._queues)
+    assert queue.policy._last_finish == last_finish
+    assert [job.id for job in queue.jobs] == [job_id for job_id in order if int(job_id[1:]) % 4 == 3]
+
+    sim = PrinterSimulator(num_printers=8, time_scale=0.0001, policy='wfq', dispatch='stealing')
+    sim.add_jobs(Job(f"J{i}", "PLA", 1, i % 3 + 1) for i in range(2000))
+    sim.run_until_complete(timeout=30)
+    assert sim.get_status()['completed'] == 2000
+    assert sim.job_queue.policy._virtual_time > 0
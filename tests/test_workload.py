@@ -0,0 +1,64 @@
+import sys
+import os
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from workload import WorkloadGenerator
+from simulator import PrinterSimulator
+
+
+def summary(pairs):
+    return [(arrival, job.id, job.material, job.est_time, job.priority) for arrival, job in pairs]
+
+
+def test_generator_is_seeded_and_follows_the_mix():
+    workload = WorkloadGenerator(seed=3, rate=2.0, materials={'PLA': 3, 'TPU': 1},
+                                 est_time=('uniform', 10, 20), priorities={1: 1, 3: 1})
+    pairs = list(workload.generate(count=4000))
+
+    assert summary(pairs) == summary(workload.generate(count=4000))
+    assert summary(pairs) != summary(WorkloadGenerator(seed=4, rate=2.0).generate(count=4000))
+    arrivals = [arrival for arrival, _ in pairs]
+    assert arrivals == sorted(arrivals)
+    assert 1.8 < len(pairs) / arrivals[-1] < 2.2
+    assert 0.7 < sum(job.material == 'PLA' for _, job in pairs) / len(pairs) < 0.8
+    assert {job.priority for _, job in pairs} == {1, 3}
+    assert all(10 <= job.est_time <= 20 for _, job in pairs)
+
+    bursty = list(WorkloadGenerator(seed=3, arrival='bursty', rate=2.0, burst_size=20).generate(duration=5000))
+    assert 1.6 < len(bursty) / 5000 < 2.4
+    assert all(arrival <= 5000 for arrival, _ in bursty)
+
+    with pytest.raises(ValueError):
+        WorkloadGenerator(est_time=('normal', 5))
+
+
+def test_discrete_run_starts_jobs_at_their_arrivals():
+    sim = PrinterSimulator(num_printers=3, time_scale=1.0, mode='discrete')
+    sim.add_arrivals(WorkloadGenerator(seed=1, rate=0.2, est_time=5).generate(count=200))
+    sim.run_until_complete()
+
+    assert sim.get_status()['completed'] == 200
+    jobs = sim.completed_jobs
+    assert all(job.started_at >= job.created_at > sim.simulation_start_time for job in jobs)
+    # Mostly idle printers pick up each arrival at once
+    assert sum(job.started_at == job.created_at for job in jobs) > 150
+
+
+def test_discrete_timeout_keeps_the_remaining_arrivals():
+    sim = PrinterSimulator(num_printers=2, time_scale=1.0, mode='discrete')
+    sim.add_arrivals(WorkloadGenerator(seed=2, rate=1.0, est_time=1).generate(count=100))
+    sim.run_until_complete(timeout=30)
+    assert 0 < sim.get_status()['total_jobs'] < 100
+    assert not sim.all_done_event.is_set()
+
+    sim.run_until_complete()
+    status = sim.get_status()
+    assert status['total_jobs'] == 100 and status['queued'] == 0
+
+
+def test_threaded_run_feeds_arrivals():
+    sim = PrinterSimulator(num_printers=2, time_scale=0.001, mode='threaded')
+    sim.add_arrivals(WorkloadGenerator(seed=5, arrival='bursty', rate=1.0, est_time=0.5).generate(count=300))
+    sim.run_until_complete(timeout=30)
+
+    assert sim.get_status()['completed'] == 300